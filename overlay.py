@@ -1,47 +1,442 @@
-import tkinter as tk
-from tkinter import ttk
-import ctypes
-import platform
-import logging
-import os
-import sys
-from datetime import datetime
-from screeninfo import get_monitors
+import time
+
+# Captured before the GUI imports so --profile-startup can report import cost.
+_IMPORT_STARTED = time.perf_counter()
+
+import tkinter as tk  # noqa: E402
+from tkinter import ttk  # noqa: E402
+import tkinter.font as tkfont  # noqa: E402
+import ctypes  # noqa: E402
+import platform  # noqa: E402
+import logging  # noqa: E402
+import logging.handlers  # noqa: E402
+import os  # noqa: E402
+import queue  # noqa: E402
+import sys  # noqa: E402
+import threading  # noqa: E402
+import atexit  # noqa: E402
+import gzip  # noqa: E402
+import shutil  # noqa: E402
+import select  # noqa: E402
+import signal  # noqa: E402
+import socket  # noqa: E402
+import socketserver  # noqa: E402
+import stat  # noqa: E402
+import tempfile  # noqa: E402
+import traceback  # noqa: E402
+import heapq  # noqa: E402
+import itertools  # noqa: E402
+import json  # noqa: E402
+import math  # noqa: E402
+import re  # noqa: E402
+from array import array  # noqa: E402
+from collections import OrderedDict, deque, namedtuple  # noqa: E402
+from contextlib import contextmanager  # noqa: E402
+from datetime import datetime  # noqa: E402
+from screeninfo import get_monitors  # noqa: E402
+from overlay_client import default_address, parse_control_address  # noqa: E402
+from overlay_client import send as send_control_command  # noqa: E402
+
+try:  # Pillow ships with the build dependencies; only the bitmap render mode needs it
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = ImageDraw = ImageFont = ImageTk = None
+
+try:  # POSIX only; used to tell log files still being written from finished ones
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class StartupProfiler:
+    """Collect wall-clock timings for the phases leading up to the first window."""
+
+    def __init__(self, origin):
+        self.origin = origin
+        self.phases = []  # (start, name, seconds, depth)
+        self.first_window_at = None
+        self._depth = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block; nested phases are indented in the report."""
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.record(name, start, time.perf_counter() - start, depth)
+
+    def record(self, name, start, seconds, depth=0):
+        self.phases.append((start, name, seconds, depth))
+
+    def mark_first_window(self):
+        """Record the moment the first window has been painted (idempotent)."""
+        if self.first_window_at is None:
+            self.first_window_at = time.perf_counter()
+
+    def report(self):
+        lines = ["Startup profile (time to first window):"]
+        for _, name, seconds, depth in sorted(self.phases):
+            label = "  " * depth + name
+            lines.append(f"  {label:<24} {seconds * 1000:8.1f} ms")
+        if self.first_window_at is not None:
+            total = (self.first_window_at - self.origin) * 1000
+            lines.append(f"  {'time to first window':<24} {total:8.1f} ms")
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler(_IMPORT_STARTED)
+
+logger = logging.getLogger(__name__)
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+LOG_BATCH_SIZE = 256  # Max records written between two flushes in queued mode
+LOG_DIR = "logs"
+LOG_FILE_PREFIX = "overlaypy_"
+
+# Rotation and retention defaults (overridable from the command line)
+DEFAULT_LOG_MAX_MB = 10
+DEFAULT_LOG_MAX_AGE_HOURS = 24
+DEFAULT_LOG_RETENTION_MB = 200
+DEFAULT_LOG_RETENTION_DAYS = 30
+LOG_LIVE_GRACE_SECONDS = 600  # Uncompressed logs modified this recently may belong to a running instance
+
+# Background writer started by setup_logging(queued=True); see shutdown_logging()
+_log_listener = None
+
+
+class DeferredFlushMixin:
+    """Let a batching writer emit many records and flush the stream once."""
+
+    defer_flush = False
+
+    def flush(self):
+        if not self.defer_flush:
+            super().flush()
+
+
+class BatchStreamHandler(DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+
+class RetentionFileHandler(DeferredFlushMixin, logging.handlers.RotatingFileHandler):
+    """Log file rotated by size and age, with rotated segments gzipped off-thread.
+
+    Segments are named ``<stem>.<n>.log`` and become ``<stem>.<n>.log.gz`` once
+    compressed; after each rotation the log directory is pruned back under the
+    retention budget by a background thread.
+    """
+
+    def __init__(self, filename, max_bytes=0, max_age=0, retention_bytes=0, retention_age=0, encoding=None):
+        super().__init__(filename, maxBytes=max_bytes, encoding=encoding)
+        self.max_age = max_age
+        self.retention_bytes = retention_bytes
+        self.retention_age = retention_age
+        self.opened_at = time.time()
+        self.segment = 0
+
+    def _open(self):
+        stream = super()._open()
+        if fcntl is not None:
+            # Shared lock marks the file as live for log maintenance in any process
+            try:
+                fcntl.flock(stream.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except OSError:
+                pass
+        return stream
+
+    def shouldRollover(self, record):
+        if self.max_age and time.time() - self.opened_at >= self.max_age:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.segment += 1
+        stem, ext = os.path.splitext(self.baseFilename)
+        segment_name = f"{stem}.{self.segment}{ext}"
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, segment_name)
+        self.opened_at = time.time()
+        if not self.delay:
+            self.stream = self._open()
+        start_log_maintenance(os.path.dirname(self.baseFilename), self.retention_bytes,
+                              self.retention_age, active=self.baseFilename)
+
+
+_log_maintenance_lock = threading.Lock()
+
+
+def compress_log_segment(path):
+    """Gzip a rotated log segment next to itself and remove the original."""
+    partial = path + ".gz.tmp"
+    with open(path, "rb") as source, gzip.open(partial, "wb") as target:
+        shutil.copyfileobj(source, target)
+    try:
+        os.remove(path)
+    except OSError:
+        # Still open in another process (Windows refuses to delete it); try again next time
+        os.remove(partial)
+        raise
+    os.replace(partial, path + ".gz")
+
+
+def log_in_use(path):
+    """True when a RetentionFileHandler in this or another process holds path open."""
+    if fcntl is None:
+        return False
+    try:
+        with open(path, "rb") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return True
+    return False
+
+
+def is_live_log(path, mtime, now=None):
+    """True for an uncompressed log that may still be written: recently modified or locked.
+
+    Rotated segments (``<stem>.<n>.log``) are closed before they are renamed,
+    so they are never live.
+    """
+    if not path.endswith(".log") or re.search(r"\.\d+\.log$", path):
+        return False
+    now = time.time() if now is None else now
+    return now - mtime < LOG_LIVE_GRACE_SECONDS or log_in_use(path)
+
+
+def prune_logs(log_dir, retention_bytes=0, retention_age=0, active=None):
+    """Delete the oldest log files until the directory fits the retention budget.
+
+    Files older than retention_age seconds are always removed; the active log
+    file and logs still being written by other instances are never touched
+    (they count towards the budget). Returns the list of removed paths.
+    """
+    active = os.path.abspath(active) if active is not None else None
+    now = time.time()
+    entries = []
+    total = 0
+    for name in os.listdir(log_dir):
+        path = os.path.abspath(os.path.join(log_dir, name))
+        if not name.startswith(LOG_FILE_PREFIX):
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        total += stat.st_size
+        if path != active and not is_live_log(path, stat.st_mtime, now):
+            entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+
+    cutoff = now - retention_age if retention_age else None
+
+    removed = []
+    for mtime, size, path in entries:
+        over_budget = retention_bytes and total > retention_bytes
+        expired = cutoff is not None and mtime < cutoff
+        if not (over_budget or expired):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed.append(path)
+    return removed
+
+
+def recover_partial_compression(path):
+    """Finish or discard a ``.gz.tmp`` left by a compression interrupted at exit."""
+    source = path[:-len(".gz.tmp")]
+    if os.path.exists(source):
+        os.remove(path)  # The source is intact; compress it again later
+    else:
+        # Interrupted after the source was removed; the copy is complete
+        os.replace(path, source + ".gz")
+
+
+def maintain_log_file(path, now):
+    """Compress one inactive log file, or recover an interrupted compression."""
+    if path.endswith(".gz.tmp"):
+        recover_partial_compression(path)
+    elif path.endswith(".log") and not is_live_log(path, os.stat(path).st_mtime, now):
+        compress_log_segment(path)
+
+
+def run_log_maintenance(log_dir, retention_bytes=0, retention_age=0, active=None):
+    """Compress every uncompressed inactive log, then enforce retention.
+
+    Logs that may still be written - the active one, or any other that is
+    locked or was modified in the last LOG_LIVE_GRACE_SECONDS - are left alone.
+    """
+    active = os.path.abspath(active) if active is not None else None
+    with _log_maintenance_lock:
+        try:
+            names = sorted(os.listdir(log_dir))
+        except OSError as e:
+            logger.warning(f"Log maintenance skipped, cannot list {log_dir}: {e}")
+            return
+        now = time.time()
+        for name in names:
+            path = os.path.abspath(os.path.join(log_dir, name))
+            if path == active or not name.startswith(LOG_FILE_PREFIX):
+                continue
+            try:
+                maintain_log_file(path, now)
+            except OSError as e:
+                logger.warning(f"Could not compress log segment {path}: {e}")
+        try:
+            removed = prune_logs(log_dir, retention_bytes, retention_age, active)
+        except OSError as e:
+            logger.warning(f"Log retention failed for {log_dir}: {e}")
+            return
+    if removed:
+        logger.debug(f"Log retention removed {len(removed)} old file(s)")
+
+
+def start_log_maintenance(log_dir, retention_bytes=0, retention_age=0, active=None):
+    """Run run_log_maintenance() on a daemon thread so the writer never waits on gzip."""
+    thread = threading.Thread(
+        target=run_log_maintenance,
+        args=(log_dir, retention_bytes, retention_age, active),
+        name="log-maintenance",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that drains records in batches on its writer thread.
+
+    Each handler sees the whole batch with flushing deferred, then is flushed
+    once, so a burst of DEBUG records costs one write syscall per handler
+    instead of one per record.
+    """
+
+    def __init__(self, record_queue, *handlers, batch_size=LOG_BATCH_SIZE):
+        super().__init__(record_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def _monitor(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(record is self._sentinel for record in batch)
+            self.handle_batch([record for record in batch if record is not self._sentinel])
+            if stopping:
+                break
+
+    def handle_batch(self, records):
+        for handler in self.handlers:
+            handler.defer_flush = True
+            try:
+                for record in records:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                handler.defer_flush = False
+                handler.flush()
 
 
 # Configure comprehensive logging
-def setup_logging():
-    """Set up comprehensive logging for debugging Windows issues."""
-    
+def setup_logging(queued=True, max_bytes=DEFAULT_LOG_MAX_MB * 1024 * 1024,
+                  max_age=DEFAULT_LOG_MAX_AGE_HOURS * 3600,
+                  retention_bytes=DEFAULT_LOG_RETENTION_MB * 1024 * 1024,
+                  retention_age=DEFAULT_LOG_RETENTION_DAYS * 86400):
+    """Set up comprehensive logging for debugging Windows issues.
+
+    Only installs the handlers; the (comparatively slow) system and monitor
+    probes live in log_startup_diagnostics() so they can be deferred.
+
+    With queued=True the root logger only gets a QueueHandler, so logging from
+    the Tk thread is a queue put; file and console output happen in batches on
+    a background writer thread that is flushed by shutdown_logging().
+
+    The log file rotates at max_bytes or after max_age seconds (0 disables
+    either); rotated segments are gzipped and the logs directory, including
+    files from previous launches, is kept under retention_bytes and
+    retention_age by a background maintenance thread.
+    """
+    global _log_listener
+
     # Create logs directory if it doesn't exist
-    log_dir = "logs"
+    log_dir = LOG_DIR
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
     # Create log filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = os.path.join(log_dir, f"overlaypy_{timestamp}.log")
+    log_filename = os.path.join(log_dir, f"{LOG_FILE_PREFIX}{timestamp}.log")
     
     # Configure logging with multiple levels
     # Use a StreamHandler with UTF-8 encoding for console output
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = BatchStreamHandler(sys.stdout)
     try:
-        console_handler.setStream(open(sys.stdout.fileno(), mode='w', encoding='utf-8', buffering=1))
+        # closefd=False so closing the handler at exit does not close the real stdout
+        # Line buffered when writing synchronously; the queued writer flushes once per batch
+        console_handler.setStream(open(sys.stdout.fileno(), mode='w', encoding='utf-8',
+                                       buffering=-1 if queued else 1, closefd=False))
     except Exception:
         # Fallback for environments where fileno() is not available
         pass
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename, encoding='utf-8'),
-            console_handler
-        ]
+    file_handler = RetentionFileHandler(
+        log_filename,
+        max_bytes=max_bytes,
+        max_age=max_age,
+        retention_bytes=retention_bytes,
+        retention_age=retention_age,
+        encoding='utf-8',
     )
+    handlers = [file_handler, console_handler]
+
+    if queued:
+        formatter = logging.Formatter(LOG_FORMAT)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        record_queue = queue.SimpleQueue()
+        _log_listener = BatchingQueueListener(record_queue, *handlers)
+        _log_listener.start()
+        atexit.register(shutdown_logging)
+        queue_handler = logging.handlers.QueueHandler(record_queue)
+        # prepare() stores the formatted message in the record; the writer's
+        # handlers add the LOG_FORMAT prefix, so it must not be applied here too
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers = [queue_handler]
+
+    logging.basicConfig(level=logging.DEBUG, format=LOG_FORMAT, handlers=handlers)
     
-    logger = logging.getLogger(__name__)
-    
-    # Log system information
+    logger.info(f"Log file: {log_filename} ({'queued' if queued else 'synchronous'} writer)")
+    # Compress/prune logs left by previous launches without delaying startup
+    start_log_maintenance(log_dir, retention_bytes, retention_age, active=file_handler.baseFilename)
+    return logger
+
+
+def shutdown_logging():
+    """Drain and stop the queued log writer, if one is running (idempotent)."""
+    global _log_listener
+    if _log_listener is not None:
+        listener, _log_listener = _log_listener, None
+        listener.stop()
+
+
+def log_startup_diagnostics():
+    """Log system, monitor and Windows feature information.
+
+    Safe to run on a background thread: it only queries the platform and
+    screeninfo, and never touches Tk.
+    """
     logger.info("=" * 60)
     logger.info("OVERLAYPY STARTUP - SYSTEM INFORMATION")
     logger.info("=" * 60)
@@ -55,7 +450,6 @@ def setup_logging():
     logger.info(f"Python executable: {sys.executable}")
     logger.info(f"Current working directory: {os.getcwd()}")
     logger.info(f"Script location: {os.path.abspath(__file__)}")
-    logger.info(f"Log file: {log_filename}")
     
     # Test monitor detection
     try:
@@ -85,23 +479,2104 @@ def setup_logging():
             logger.error(f"Windows-specific feature test failed: {e}")
     
     logger.info("=" * 60)
-    return logger
 
-# Initialize logging
-logger = setup_logging()
 
+def start_background_diagnostics():
+    """Run log_startup_diagnostics() on a daemon thread."""
+    thread = threading.Thread(target=log_startup_diagnostics, name="startup-diagnostics", daemon=True)
+    thread.start()
+    return thread
+
+
+# Flight recorder event kinds and the meaning of their four int fields
+EVENT_SHOW = 1
+EVENT_UPDATE = 2
+EVENT_HIDE = 3
+EVENT_GEOMETRY = 4
+EVENT_TIMER_SET = 5
+EVENT_TIMER_FIRED = 6
+EVENT_SETTING = 7
+EVENT_MONITORS = 8
+EVENT_REVEAL = 9
+EVENT_CUE = 10
+EVENT_FADE = 11
+
+EVENT_LAYOUTS = {
+    EVENT_SHOW: ("show", ("text_len", "monitor")),
+    EVENT_UPDATE: ("update", ("font_size", "padding", "width", "height")),
+    EVENT_HIDE: ("hide", ()),
+    EVENT_GEOMETRY: ("geometry", ("width", "height", "x", "y")),
+    EVENT_TIMER_SET: ("timer_set", ("seconds",)),
+    EVENT_TIMER_FIRED: ("timer_fired", ("drift_us",)),
+    EVENT_SETTING: ("setting", ()),
+    EVENT_MONITORS: ("monitors", ("count", "added", "removed", "changed")),
+    EVENT_REVEAL: ("reveal", ("latency_us", "trigger")),
+    EVENT_CUE: ("cue", ("index", "drift_us")),
+    EVENT_FADE: ("fade", ("direction", "steps", "dropped", "cpu_us")),
+}
+
+DEFAULT_FLIGHT_RECORDER_SIZE = 4096
+
+
+class FlightRecorder:
+    """Preallocated ring buffer of compact overlay events.
+
+    Each record is a perf_counter timestamp, a one-byte event kind and four
+    ints stored in flat arrays, so recording is a handful of array stores with
+    no allocation. The buffer is only written to disk by dump(): on demand, on
+    an unhandled exception or on a signal (see install_crash_dumps()).
+    """
+
+    FIELDS = 4
+
+    def __init__(self, capacity=DEFAULT_FLIGHT_RECORDER_SIZE):
+        self.capacity = max(1, capacity)
+        self._times = array("d", bytes(8 * self.capacity))
+        self._kinds = array("B", bytes(self.capacity))
+        self._values = array("q", bytes(8 * self.capacity * self.FIELDS))
+        self._count = 0  # Total events ever recorded
+        # Offset to turn perf_counter timestamps into wall-clock time in dumps
+        self._wall_offset = time.time() - time.perf_counter()
+
+    def record(self, kind, a=0, b=0, c=0, d=0):
+        slot = self._count % self.capacity
+        self._times[slot] = time.perf_counter()
+        self._kinds[slot] = kind
+        base = slot * self.FIELDS
+        values = self._values
+        values[base] = a
+        values[base + 1] = b
+        values[base + 2] = c
+        values[base + 3] = d
+        self._count += 1
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def events(self):
+        """Return the buffered events oldest first as (timestamp, kind, values) tuples."""
+        first = max(0, self._count - self.capacity)
+        result = []
+        for n in range(first, self._count):
+            slot = n % self.capacity
+            base = slot * self.FIELDS
+            result.append((self._times[slot], self._kinds[slot], tuple(self._values[base:base + self.FIELDS])))
+        return result
+
+    def format_events(self):
+        lines = []
+        previous = None
+        for timestamp, kind, values in self.events():
+            name, fields = EVENT_LAYOUTS.get(kind, (f"kind{kind}", ()))
+            wall = datetime.fromtimestamp(timestamp + self._wall_offset).strftime("%H:%M:%S.%f")
+            delta = 0.0 if previous is None else (timestamp - previous) * 1000
+            detail = " ".join(f"{field}={value}" for field, value in zip(fields, values))
+            lines.append(f"{wall} +{delta:9.3f}ms {name:<12} {detail}".rstrip())
+            previous = timestamp
+        return lines
+
+    def dump(self, reason="on demand", directory=LOG_DIR):
+        """Write the buffered events to a new file and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = os.path.join(directory, f"{LOG_FILE_PREFIX}flight_{timestamp}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"OverlayPy flight recorder dump ({reason})\n")
+            f.write(f"{len(self)} of {self._count} events (capacity {self.capacity})\n")
+            for line in self.format_events():
+                f.write(line + "\n")
+        logger.info(f"Flight recorder dumped to {path} ({reason})")
+        return path
+
+
+flight_recorder = FlightRecorder()
+
+
+def install_crash_dumps(root, recorder):
+    """Dump the flight recorder on unhandled exceptions and on SIGUSR1/SIGBREAK."""
+    previous_excepthook = sys.excepthook
+
+    def excepthook(exc_type, exc, tb):
+        try:
+            recorder.dump(reason=f"unhandled {exc_type.__name__}")
+        except Exception as e:
+            logger.error(f"Flight recorder dump failed: {e}")
+        previous_excepthook(exc_type, exc, tb)
+
+    def report_callback_exception(exc_type, exc, tb):
+        logger.error(f"Exception in Tk callback: {''.join(traceback.format_exception(exc_type, exc, tb))}")
+        try:
+            recorder.dump(reason=f"Tk callback {exc_type.__name__}")
+        except Exception as e:
+            logger.error(f"Flight recorder dump failed: {e}")
+
+    sys.excepthook = excepthook
+    root.report_callback_exception = report_callback_exception
+
+    dump_signal = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
+    if dump_signal is not None:
+        try:
+            signal.signal(dump_signal, lambda signum, frame: recorder.dump(reason=f"signal {signum}"))
+            logger.debug(f"✓ Flight recorder dumps on signal {dump_signal}")
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not install flight recorder signal handler: {e}")
+
+
+DEFAULT_OVERLAY_POOL_SIZE = 1
+OVERLAY_FG = "white"
+OVERLAY_BG = "black"
+# Opacity of a fully shown overlay (slight transparency on Windows to ensure visibility)
+OVERLAY_ALPHA = 0.95 if platform.system() == "Windows" else 1.0
+
+
+def create_overlay_window(master):
+    """Build a withdrawn, borderless, topmost overlay Toplevel with its text label.
+
+    Returns (window, label). The label is packed but empty; callers set text,
+    font and padding before showing it.
+    """
+    window = init_overlay_toplevel(tk.Toplevel(master))
+    label = tk.Label(window, fg=OVERLAY_FG, bg=OVERLAY_BG)
+    label.pack()
+    return window, label
+
+
+def init_overlay_toplevel(window):
+    """Make window a withdrawn, borderless, topmost overlay surface; returns it."""
+    # Enable borderless window on all platforms
+    window.overrideredirect(True)
+    window.attributes("-topmost", True)
+
+    # Windows-specific visibility attributes
+    if platform.system() == "Windows":
+        try:
+            window.attributes("-alpha", OVERLAY_ALPHA)  # Slight transparency to ensure visibility
+            window.attributes("-disabled", False)  # Ensure window is enabled
+            window.attributes("-toolwindow", True)  # Tool window style
+        except Exception as e:
+            logger.warning(f"Could not set Windows attributes: {e}")
+
+    window.configure(bg=OVERLAY_BG)
+    # Hide initially until properly positioned
+    window.withdraw()
+    return window
+
+
+def enable_click_through(window, log=logger):
+    """Let mouse clicks pass through an overlay window (Windows only)."""
+    if platform.system() == "Windows":
+        log.info("Attempting to enable Windows click-through feature...")
+        try:
+            # Get the window handle
+            overlay_id = window.winfo_id()
+            log.debug(f"Overlay winfo_id: {overlay_id}")
+            
+            hwnd = ctypes.windll.user32.GetParent(overlay_id)
+            log.debug(f"GetParent result: {hwnd}")
+            
+            if hwnd:
+                # Get current window style
+                current_style = ctypes.windll.user32.GetWindowLongW(hwnd, -20)
+                log.debug(f"Current window style: 0x{current_style:x}")
+                
+                # WS_EX_LAYERED (0x80000) | WS_EX_TRANSPARENT (0x20) for full click-through
+                new_style = current_style | 0x80000 | 0x20
+                log.debug(f"New window style (with click-through): 0x{new_style:x}")
+                
+                result = ctypes.windll.user32.SetWindowLongW(hwnd, -20, new_style)
+                log.debug(f"SetWindowLongW result: {result}")
+                
+                if result == 0:
+                    error_code = ctypes.windll.kernel32.GetLastError()
+                    log.warning(f"SetWindowLongW returned 0, error code: {error_code}")
+                else:
+                    log.info("✓ Click-through feature enabled successfully")
+                    
+                    # Force window to be visible and on top
+                    ctypes.windll.user32.SetWindowPos(hwnd, -1, 0, 0, 0, 0, 0x0001 | 0x0002 | 0x0010)
+                    log.debug("✓ SetWindowPos called to ensure visibility")
+            else:
+                log.warning("GetParent returned 0 (no parent window)")
+                
+        except Exception as e:
+            log.error(f"Failed to set up Windows click-through: {e}")
+            # Continue without click-through functionality
+                
+        except Exception as e:
+            # Click-through feature failed, but overlay still works
+            log.warning(f"Click-through feature failed (overlay still functional): {e}")
+            print(f"Note: Click-through feature unavailable: {e}")
+    else:
+        log.debug(f"Skipping click-through (not Windows): {platform.system()}")
+
+
+DEFAULT_TICKER_SPEED = 120  # Pixels per second
+
+
+def create_ticker_window(master):
+    """Build a withdrawn, borderless, topmost strip with a Canvas for the ticker.
+
+    Returns (window, canvas).
+    """
+    window = init_overlay_toplevel(tk.Toplevel(master))
+    canvas = tk.Canvas(window, bg=OVERLAY_BG, highlightthickness=0, borderwidth=0)
+    canvas.pack(fill=tk.BOTH, expand=True)
+    return window, canvas
+
+
+class Ticker:
+    """Marquee that scrolls one pre-laid-out Canvas text item across a monitor.
+
+    The text item is created once per message; each frame only moves it by
+    speed * elapsed time, so frames skipped under load make the text jump
+    further instead of slowing the scroll down. Driven by a FrameScheduler.
+    The strip runs along the top edge for "Top ..." corners, else the bottom.
+    """
+
+    def __init__(self, frames, factory, speed=DEFAULT_TICKER_SPEED):
+        self.frames = frames
+        self.factory = factory
+        self.speed = speed
+        self.window = None
+        self.canvas = None
+        self._item = None
+        self._text = ""
+        self._x = 0.0
+        self._y = 0
+        self._width = 0
+        self._text_width = 0
+        self._last = None
+
+    @property
+    def running(self):
+        return self._item is not None
+
+    def start(self, text, font, monitor, padding, corner="Bottom Left"):
+        """Show a strip along an edge of monitor and scroll text through it from the right."""
+        self.stop()
+        if self.window is None:
+            self.window, self.canvas = self.factory()
+        self._text = " ".join(text.split("\n"))
+        self._x = float(monitor.width)
+        self._last = None
+        self._layout(font, monitor, padding, corner)
+        self._item = self.canvas.create_text(self._x, self._y, text=self._text, font=font, fill=OVERLAY_FG, anchor="w")
+        self.window.deiconify()
+        self.frames.add(self._step)
+
+    def update(self, font, monitor, padding, corner):
+        """Apply new settings to a running ticker without restarting the scroll."""
+        if self._item is None:
+            return
+        self.canvas.itemconfigure(self._item, font=font)
+        self._layout(font, monitor, padding, corner)
+        self.canvas.coords(self._item, self._x, self._y)
+
+    def _layout(self, font, monitor, padding, corner):
+        height = font.metrics("linespace") + 2 * padding
+        self._width = monitor.width
+        self._text_width = font.measure(self._text)
+        self._x = min(self._x, float(monitor.width))
+        self._y = height // 2
+        y_pos = monitor.y if corner.startswith("Top") else monitor.y + monitor.height - height
+        self.canvas.config(width=monitor.width, height=height)
+        self.window.geometry(f"{monitor.width}x{height}+{monitor.x}+{y_pos}")
+
+    def stop(self):
+        if self._item is None:
+            return
+        self.frames.remove(self._step)
+        self.canvas.delete(self._item)
+        self._item = None
+        self.window.withdraw()
+
+    def _step(self, now, frames):
+        if self._last is None:
+            self._last = now
+            return True
+        dx = self.speed * (now - self._last)
+        self._last = now
+        self._x -= dx
+        if self._x + self._text_width < 0:
+            # Fully scrolled off the left edge: start again from the right
+            self._x = float(self._width)
+            self.canvas.coords(self._item, self._x, self._y)
+        else:
+            self.canvas.move(self._item, -dx, 0)
+        return True
+
+
+class OverlayWindowPool:
+    """Pre-built, withdrawn overlay windows handed out by acquire().
+
+    warm() fills the pool one window per idle callback, so building the
+    Toplevel, its attributes and label happens before the first show instead
+    of during it. release() returns a hidden window for reuse.
+    """
+
+    def __init__(self, master, size=DEFAULT_OVERLAY_POOL_SIZE, factory=None):
+        self.master = master
+        self.size = size
+        self.factory = factory or (lambda: create_overlay_window(master))
+        self.hits = 0
+        self.misses = 0
+        self._idle = []
+        self._warm_job = None
+
+    def __len__(self):
+        return len(self._idle)
+
+    def warm(self):
+        """Start filling the pool up to size in idle time."""
+        if self._warm_job is None and len(self._idle) < self.size:
+            self._warm_job = self.master.after_idle(self._warm_one)
+
+    def _warm_one(self):
+        self._warm_job = None
+        try:
+            self._idle.append(self.factory())
+        except Exception as e:
+            logger.error(f"Failed to pre-build overlay window: {e}")
+            return
+        self.warm()
+
+    def acquire(self):
+        """Return (window, label): a pooled one if available, otherwise a new one."""
+        if self._idle:
+            self.hits += 1
+            return self._idle.pop()
+        self.misses += 1
+        return self.factory()
+
+    def release(self, entry):
+        window, _ = entry
+        if len(self._idle) < self.size:
+            window.withdraw()
+            self._idle.append(entry)
+        else:
+            window.destroy()
+
+
+DEFAULT_REVEAL_TIMEOUT_MS = 100
+REVEAL_TRIGGERS = ("configure", "unchanged", "timeout", "first-map")
+
+
+class OverlayReveal:
+    """Deiconify a withdrawn overlay as soon as Tk reports its layout is done.
+
+    begin() waits for the window's own <Configure> event with the requested
+    size. If the window already has that size no Configure will come, so it is
+    revealed on the next idle callback; the same goes for a window that has
+    never been mapped, which on X11 gets no Configure until it is. A timeout
+    covers window managers that never report. The show latency runs from
+    begin()'s start time to the window's <Map> event and is passed to
+    on_shown(latency_seconds, trigger); triggers counts how each reveal happened.
+    """
+
+    def __init__(self, master, show, on_shown, timeout_ms=DEFAULT_REVEAL_TIMEOUT_MS):
+        self.master = master
+        self.show = show
+        self.on_shown = on_shown
+        self.timeout_ms = timeout_ms
+        self.window = None
+        self.expected_size = None
+        self.started = None
+        self.trigger = None
+        self._jobs = []
+        self._bound = set()
+        self._mapped = set()
+        self.triggers = dict.fromkeys(REVEAL_TRIGGERS, 0)
+
+    @property
+    def pending(self):
+        return self.window is not None and self.trigger is None
+
+    @property
+    def timeout_rate(self):
+        """Fraction of reveals that had to fall back to the timeout."""
+        total = sum(self.triggers.values())
+        return self.triggers["timeout"] / total if total else 0.0
+
+    def begin(self, window, expected_size, started=None):
+        self.cancel()
+        self.window = window
+        self.expected_size = tuple(expected_size)
+        self.started = started if started is not None else time.perf_counter()
+        self.trigger = None
+
+        # Pooled windows are reused, so bind each one once and route through self
+        if str(window) not in self._bound:
+            window.bind("<Configure>", self._on_configure)
+            window.bind("<Map>", self._on_map)
+            self._bound.add(str(window))
+
+        self._jobs.append(self.master.after(self.timeout_ms, self._reveal, "timeout"))
+        if str(window) not in self._mapped:
+            self._jobs.append(self.master.after_idle(self._reveal, "first-map"))
+        elif (window.winfo_width(), window.winfo_height()) == self.expected_size:
+            self._jobs.append(self.master.after_idle(self._reveal, "unchanged"))
+
+    def cancel(self):
+        for job in self._jobs:
+            self.master.after_cancel(job)
+        self._jobs = []
+        self.window = None
+        self.trigger = None
+
+    def _on_configure(self, event):
+        # Children's Configure events also reach toplevel bindings; only the window itself counts
+        if self.pending and str(event.widget) == str(self.window) and (event.width, event.height) == self.expected_size:
+            self._reveal("configure")
+
+    def _reveal(self, trigger):
+        if not self.pending:
+            return
+        self.trigger = trigger
+        self.triggers[trigger] += 1
+        for job in self._jobs:
+            self.master.after_cancel(job)
+        self._jobs = []
+        self.show(self.window)
+        if self.window.winfo_ismapped():
+            # Already mapped (re-show of a visible overlay): no <Map> will follow
+            self._mapped.add(str(self.window))
+            self._finish()
+
+    def _on_map(self, event):
+        self._mapped.add(str(event.widget))
+        if str(event.widget) == str(self.window) and self.trigger is not None and self.started is not None:
+            self._finish()
+
+    def _finish(self):
+        # On X11 deiconify() waits for MapNotify, so <Map> may already have
+        # reported this reveal from inside show()
+        if self.started is None:
+            return
+        latency = time.perf_counter() - self.started
+        self.started = None
+        self.on_shown(latency, self.trigger)
+
+
+class TimerWheel:
+    """Heap of monotonic deadlines serviced by a single Tk after() callback.
+
+    schedule() returns a handle that cancel() deactivates in place; cancelled
+    entries are skipped when they reach the top and the heap is compacted
+    once they make up half of it, so scheduling is O(log n) and cancelling is
+    O(1) amortised however many timers are in flight. Only one after() job is
+    ever pending; it is replaced only when a new deadline is earlier than it,
+    otherwise it fires early (or with nothing due) and re-arms. Firing lateness
+    (drift) is tracked in last_drift/max_drift/mean_drift.
+    """
+
+    # Index of the fields in a timer handle (a list so cancel() can flip it in place)
+    _DEADLINE, _SEQ, _CALLBACK, _ARGS, _ACTIVE = range(5)
+
+    def __init__(self, master, clock=time.monotonic):
+        self.master = master
+        self.clock = clock
+        self.fired = 0
+        self.last_drift = 0.0
+        self.max_drift = 0.0
+        self._total_drift = 0.0
+        self._heap = []
+        self._cancelled = 0
+        self._seq = itertools.count()
+        self._job = None
+        self._job_deadline = None
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    @property
+    def mean_drift(self):
+        return self._total_drift / self.fired if self.fired else 0.0
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) delay seconds from now; returns a handle for cancel()."""
+        entry = [self.clock() + delay, next(self._seq), callback, args, True]
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._rearm()
+        return entry
+
+    def cancel(self, entry):
+        """Deactivate a handle from schedule(); None and already-fired handles are ignored."""
+        if entry is None or not entry[self._ACTIVE]:
+            return
+        entry[self._ACTIVE] = False
+        self._cancelled += 1
+        if self._cancelled * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if e[self._ACTIVE]]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        self._rearm()
+
+    def _drop_cancelled_head(self):
+        while self._heap and not self._heap[0][self._ACTIVE]:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+    def _rearm(self):
+        self._drop_cancelled_head()
+        deadline = self._heap[0][self._DEADLINE] if self._heap else None
+        if self._job is not None:
+            if deadline is None or self._job_deadline <= deadline:
+                # The pending job fires no later than needed; _fire() re-arms for
+                # whatever is left, so cancel-and-reschedule makes no Tk call
+                return
+            self.master.after_cancel(self._job)
+            self._job = None
+        self._job_deadline = deadline
+        if deadline is not None:
+            delay_ms = max(0, math.ceil((deadline - self.clock()) * 1000))
+            self._job = self.master.after(delay_ms, self._fire)
+
+    def _fire(self):
+        self._job = None
+        self._job_deadline = None
+        now = self.clock()
+        # Tk timers have millisecond resolution; treat deadlines within 1 ms as due
+        while self._heap and self._heap[0][self._DEADLINE] <= now + 0.001:
+            entry = heapq.heappop(self._heap)
+            if not entry[self._ACTIVE]:
+                self._cancelled -= 1
+                continue
+            entry[self._ACTIVE] = False
+            drift = max(0.0, now - entry[self._DEADLINE])
+            self.fired += 1
+            self.last_drift = drift
+            self.max_drift = max(self.max_drift, drift)
+            self._total_drift += drift
+            try:
+                entry[self._CALLBACK](*entry[self._ARGS])
+            except Exception as e:
+                logger.error(f"Timer callback {getattr(entry[self._CALLBACK], '__name__', '?')} failed: {e}")
+        self._rearm()
+
+
+FRAME_INTERVAL_MS = 16  # ~60 Hz; the smallest useful gap between two relayouts
+
+
+class FrameCoalescer:
+    """Collapse bursts of requests into at most one callback per frame.
+
+    The first request schedules the callback as an idle task (or, if the last
+    run was less than a frame ago, for the start of the next frame); requests
+    arriving while that is pending are merged into it and counted.
+    """
+
+    def __init__(self, master, callback, frame_ms=FRAME_INTERVAL_MS):
+        self.master = master
+        self.callback = callback
+        self.frame_interval = frame_ms / 1000
+        self.requests = 0
+        self.runs = 0
+        self.merged = 0
+        self._job = None
+        self._last_run = None
+
+    @property
+    def pending(self):
+        return self._job is not None
+
+    def request(self):
+        self.requests += 1
+        if self._job is not None:
+            self.merged += 1
+            return
+        wait = 0.0
+        if self._last_run is not None:
+            wait = self._last_run + self.frame_interval - time.perf_counter()
+        if wait > 0:
+            self._job = self.master.after(max(1, int(wait * 1000)), self._run)
+        else:
+            self._job = self.master.after_idle(self._run)
+
+    def cancel(self):
+        if self._job is not None:
+            self.master.after_cancel(self._job)
+            self._job = None
+
+    def _run(self):
+        self._job = None
+        self._last_run = time.perf_counter()
+        self.runs += 1
+        self.callback()
+
+
+DEFAULT_FRAME_RATE = 60
+
+
+class FrameScheduler:
+    """Single per-frame Tk callback driving every running animation.
+
+    Animations are callables step(now, frames) returning False once finished;
+    frames is the number of frame slots since the previous tick, so a value
+    above 1 means the Tk loop fell behind and the extra frames were skipped
+    rather than replayed. Tick-to-tick frame times and the time spent in
+    steps are kept for diagnostics (see format_stats).
+    """
+
+    def __init__(self, master, fps=DEFAULT_FRAME_RATE, clock=time.perf_counter):
+        self.master = master
+        self.fps = fps
+        self.clock = clock
+        self._animations = []
+        self._job = None
+        self._last_tick = None
+        self.reset_stats()
+
+    @property
+    def frame_interval(self):
+        return 1.0 / self.fps
+
+    @property
+    def running(self):
+        return bool(self._animations)
+
+    @property
+    def mean_frame_time(self):
+        return self._total_frame_time / self.frames if self.frames else 0.0
+
+    def reset_stats(self):
+        self.frames = 0
+        self.skipped = 0
+        self.last_frame_time = 0.0
+        self.max_frame_time = 0.0
+        self.work_time = 0.0
+        self._total_frame_time = 0.0
+
+    def format_stats(self):
+        return (
+            f"{self.frames} frames at {self.fps} fps target, {self.skipped} skipped, frame time "
+            f"mean {self.mean_frame_time * 1000:.1f} ms / max {self.max_frame_time * 1000:.1f} ms, "
+            f"step work {self.work_time / max(1, self.frames) * 1000:.2f} ms/frame"
+        )
+
+    def add(self, step):
+        self._animations.append(step)
+        if self._job is None:
+            self._last_tick = self.clock()
+            self._job = self.master.after(max(1, int(self.frame_interval * 1000)), self._tick)
+
+    def remove(self, step):
+        if step in self._animations:
+            self._animations.remove(step)
+        if not self._animations and self._job is not None:
+            self.master.after_cancel(self._job)
+            self._job = None
+
+    def _tick(self):
+        self._job = None
+        now = self.clock()
+        frame_time = now - self._last_tick
+        self._last_tick = now
+        frames = max(1, int(frame_time / self.frame_interval + 0.5))
+        self.frames += 1
+        self.skipped += frames - 1
+        self.last_frame_time = frame_time
+        self.max_frame_time = max(self.max_frame_time, frame_time)
+        self._total_frame_time += frame_time
+
+        for step in list(self._animations):
+            try:
+                keep = step(now, frames)
+            except Exception as e:
+                logger.error(f"Animation step failed: {e}")
+                keep = False
+            if not keep and step in self._animations:
+                self._animations.remove(step)
+
+        work = self.clock() - now
+        self.work_time += work
+        if self._animations:
+            # Aim for the next frame boundary; time spent in steps counts against the frame
+            delay = max(1, int((self.frame_interval - work) * 1000 + 0.5))
+            self._job = self.master.after(delay, self._tick)
+
+
+DEFAULT_FADE_MS = 150
+
+
+class AlphaFade:
+    """Step a window's -alpha attribute from start to end on a FrameScheduler.
+
+    Opacity follows elapsed time rather than a step count, so when the loop
+    is busy the fade takes fewer, larger steps and still ends on time. Steps
+    taken, frames dropped and the CPU time spent in steps are counted.
+    """
+
+    def __init__(self, frames, window, start, end, duration, on_done=None):
+        self.frames = frames
+        self.window = window
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.on_done = on_done
+        self.alpha = start
+        self.steps = 0
+        self.dropped = 0
+        self.cpu_time = 0.0
+        self._started = None
+
+    @property
+    def running(self):
+        return self._started is not None
+
+    def begin(self):
+        self.window.attributes("-alpha", self.start)
+        self._started = self.frames.clock()
+        self.frames.add(self._step)
+
+    def cancel(self):
+        if self._started is not None:
+            self.frames.remove(self._step)
+            self._started = None
+
+    def _step(self, now, frames):
+        cpu_started = time.process_time()
+        progress = min(1.0, (now - self._started) / self.duration) if self.duration > 0 else 1.0
+        self.alpha = self.start + (self.end - self.start) * progress
+        self.window.attributes("-alpha", self.alpha)
+        self.steps += 1
+        self.dropped += frames - 1
+        self.cpu_time += time.process_time() - cpu_started
+        if progress < 1.0:
+            return True
+        self._started = None
+        if self.on_done is not None:
+            self.on_done(self)
+        return False
+
+
+class FallbackMonitor:
+    """Stand-in display used when monitor detection fails or finds nothing."""
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.width = 1920
+        self.height = 1080
+        self.name = "Fallback Monitor"
+        self.is_primary = True
+
+    def __str__(self):
+        return f"FallbackMonitor(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+
+
+# Immutable per-monitor record: id is stable across re-probes, label is what the dropdown shows
+MonitorInfo = namedtuple("MonitorInfo", "id label index x y width height is_primary name")
+# Monitor ids that appeared, disappeared or changed geometry between two probes
+MonitorDiff = namedtuple("MonitorDiff", "added removed changed")
+
+DEFAULT_MONITOR_POLL_SECONDS = 2.0
+
+
+def probe_monitors():
+    """Return the detected monitors, or [FallbackMonitor()] if detection fails."""
+    try:
+        monitors = get_monitors()
+        logger.info(f"✓ Detected {len(monitors)} monitor(s)")
+        for i, monitor in enumerate(monitors):
+            logger.info(f"  Monitor {i+1}: {monitor}")
+    except Exception as e:
+        logger.error(f"Failed to detect monitors: {e}")
+        monitors = []
+    if not monitors:
+        logger.warning("No monitors detected, creating fallback monitor")
+        monitors = [FallbackMonitor()]
+    return monitors
+
+
+class MonitorRegistry:
+    """Monitor records built once per probe, with O(1) lookup by label or id.
+
+    Labels keep the historical "{name} ({w}x{h})" / "Monitor N ({w}x{h})"
+    format; identical labels get a " #n" suffix so every monitor stays
+    selectable. The primary monitor (or the first one) is cached.
+    """
+
+    def __init__(self, monitors):
+        self.records = []
+        self.by_label = {}
+        self.by_id = {}
+        self.primary = None
+        self.update(monitors)
+
+    def update(self, monitors):
+        """Rebuild the index from a fresh probe and return what changed as a MonitorDiff."""
+        previous = self.by_id
+        records = []
+        by_label = {}
+        by_id = {}
+        for i, monitor in enumerate(monitors):
+            name = getattr(monitor, "name", None) or ""
+            label = self._unique(by_label, f"{name or f'Monitor {i + 1}'} ({monitor.width}x{monitor.height})")
+            monitor_id = self._unique(by_id, name or f"monitor@{monitor.x},{monitor.y}")
+            record = MonitorInfo(
+                monitor_id, label, i, monitor.x, monitor.y, monitor.width, monitor.height,
+                bool(getattr(monitor, "is_primary", False)), name,
+            )
+            records.append(record)
+            by_label[label] = record
+            by_id[monitor_id] = record
+        self.records = records
+        self.by_label = by_label
+        self.by_id = by_id
+        self.primary = next((r for r in records if r.is_primary), records[0] if records else None)
+
+        return MonitorDiff(
+            added=[i for i in by_id if i not in previous],
+            removed=[i for i in previous if i not in by_id],
+            changed=[i for i in by_id if i in previous and self._geometry(by_id[i]) != self._geometry(previous[i])],
+        )
+
+    @staticmethod
+    def _geometry(record):
+        return (record.x, record.y, record.width, record.height, record.is_primary)
+
+    @staticmethod
+    def _unique(existing, key):
+        candidate = key
+        n = 2
+        while candidate in existing:
+            candidate = f"{key} #{n}"
+            n += 1
+        return candidate
+
+    @property
+    def labels(self):
+        return [record.label for record in self.records]
+
+    def __len__(self):
+        return len(self.records)
+
+    def get(self, label):
+        """Return the monitor shown as label in the dropdown, or the primary monitor."""
+        return self.by_label.get(label, self.primary)
+
+    def find(self, key):
+        """Resolve a 1-based index, id, name or dropdown label; None if nothing matches."""
+        if key is None:
+            return self.primary
+        if isinstance(key, int):
+            return self.records[key - 1] if 0 < key <= len(self.records) else None
+        record = self.by_id.get(key) or self.by_label.get(key)
+        if record is None:
+            record = next((r for r in self.records if r.name == key), None)
+        return record
+
+
+def monitor_layout_signature(monitors):
+    """Cheap comparable summary of a get_monitors() result."""
+    return tuple(
+        (getattr(m, "name", None) or "", m.x, m.y, m.width, m.height, bool(getattr(m, "is_primary", False)))
+        for m in monitors
+    )
+
+
+DISPATCH_INTERVAL_MS = 25
+
+
+class TkDispatcher:
+    """Run callables posted from any thread on the Tk thread.
+
+    post() is a deque append followed, only if no tick is armed, by a single
+    after() call (tkinter hands calls from other threads to the Tk thread);
+    the tick drains everything queued since and re-arms only while work is
+    queued or a tick handler is registered, so an idle controller is never
+    woken. start() runs one tick once the main loop is idle, which picks up
+    anything posted before the loop was running.
+    """
+
+    def __init__(self, master, interval_ms=DISPATCH_INTERVAL_MS):
+        self.master = master
+        self.interval_ms = interval_ms
+        self._pending = deque()
+        self._tick_handlers = []
+        self._job = None
+        self._armed = False
+        self._lock = threading.Lock()
+        self._stopped = True
+
+    def start(self):
+        self._stopped = False
+        with self._lock:
+            if self._armed:
+                return
+            self._armed = True
+        self._job = self.master.after_idle(self._tick)
+
+    def add_tick_handler(self, func):
+        """Call func() on every tick, after the posted callables (e.g. to drain another queue)."""
+        self._tick_handlers.append(func)
+        self._arm()
+
+    def stop(self):
+        self._stopped = True
+        with self._lock:
+            self._armed = False
+        if self._job is not None:
+            self.master.after_cancel(self._job)
+            self._job = None
+
+    def post(self, func, *args):
+        self._pending.append((func, args))
+        self._arm()
+
+    def _arm(self):
+        # Decide under the lock, but call after() outside it: from another thread
+        # after() waits for the Tk thread, which may itself be waiting on the lock
+        if self._stopped:
+            return
+        with self._lock:
+            if self._armed:
+                return
+            self._armed = True
+        try:
+            self._job = self.master.after(self.interval_ms, self._tick)
+        except (RuntimeError, tk.TclError) as e:
+            # Main loop not running yet: start()'s idle tick drains the queue
+            logger.debug(f"Dispatcher tick not armed: {e}")
+            with self._lock:
+                self._armed = False
+
+    def drain(self):
+        """Run every queued callable; returns how many ran."""
+        ran = 0
+        pending = self._pending
+        while pending:
+            func, args = pending.popleft()
+            ran += 1
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Dispatched callback {getattr(func, '__name__', func)} failed: {e}")
+        return ran
+
+    def _tick(self):
+        self._job = None
+        self.drain()
+        for func in self._tick_handlers:
+            try:
+                func()
+            except Exception as e:
+                logger.error(f"Tick handler {getattr(func, '__name__', func)} failed: {e}")
+        with self._lock:
+            # A post() racing with this check either sees _armed still set (and
+            # its item is seen here) or finds it cleared and arms a tick itself
+            self._armed = not self._stopped and bool(self._pending or self._tick_handlers)
+            rearm = self._armed
+        if rearm:
+            self._job = self.master.after(self.interval_ms, self._tick)
+
+
+class MonitorWatcher:
+    """Background thread that re-probes monitors and reports layout changes.
+
+    Every interval seconds it calls probe() and compares a tuple signature
+    with the previous result; only a real change is handed to on_change
+    (through the dispatcher, so it runs on the Tk thread).
+    """
+
+    def __init__(self, dispatcher, on_change, monitors, interval=DEFAULT_MONITOR_POLL_SECONDS, probe=get_monitors):
+        self.dispatcher = dispatcher
+        self.on_change = on_change
+        self.interval = interval
+        self.probe = probe
+        self.polls = 0
+        self.changes = 0
+        self._signature = monitor_layout_signature(monitors)
+        self._stop = threading.Event()
+        self._thread = None
+        self._immediate = False
+
+    def start(self, immediate=False):
+        """Start polling; with immediate, probe right away instead of after the first interval."""
+        self._immediate = immediate
+        self._thread = threading.Thread(target=self._run, name="monitor-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def poll(self):
+        """Probe once; post on_change if the layout differs. Returns True on change."""
+        self.polls += 1
+        try:
+            monitors = self.probe()
+        except Exception as e:
+            logger.debug(f"Monitor re-probe failed: {e}")
+            return False
+        if not monitors:
+            # Transient empty result while displays reconfigure; keep the current layout
+            return False
+        signature = monitor_layout_signature(monitors)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self.changes += 1
+        self.dispatcher.post(self.on_change, monitors)
+        return True
+
+    def _run(self):
+        if self._immediate:
+            self.poll()
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+
+DEFAULT_WATCH_POLL_SECONDS = 0.5
+DEFAULT_WATCH_TAIL_BYTES = 4096
+INOTIFY_SAFETY_POLL_SECONDS = 5.0  # stat() check even without events (e.g. network filesystems)
+
+
+def file_signature(path):
+    """(inode, size, mtime_ns) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def read_tail(path, max_bytes):
+    """Return at most the last max_bytes of path as text, starting at a line boundary when cut."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - max_bytes)
+        f.seek(start)
+        data = f.read(max_bytes)
+    if start > 0:
+        newline = data.find(b"\n")
+        if newline != -1:
+            data = data[newline + 1:]
+    return data.decode("utf-8", errors="replace")
+
+
+class InotifyWaiter:
+    """Wait for changes in a directory with Linux inotify (through ctypes, no extra package).
+
+    create() returns None where inotify is unavailable so callers can fall
+    back to polling. The directory rather than the file is watched so that
+    writers replacing the file atomically (write + rename) are seen too.
+    """
+
+    MASK = 0x2 | 0x4 | 0x8 | 0x80 | 0x100 | 0x200  # MODIFY ATTRIB CLOSE_WRITE MOVED_TO CREATE DELETE
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    @classmethod
+    def create(cls, directory):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(directory or "."), cls.MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout):
+        """Block up to timeout seconds; True if any event arrived (events are discarded)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """Background thread mirroring a file's (tail) contents into the overlay.
+
+    Changes are detected from the file's (inode, size, mtime) signature,
+    checked when inotify reports activity in its directory or every interval
+    seconds without it. Only a changed signature causes a read, and only of
+    the last tail_bytes; text that actually differs is posted to on_change
+    through the dispatcher (Tk thread).
+    """
+
+    def __init__(self, dispatcher, on_change, path, interval=DEFAULT_WATCH_POLL_SECONDS,
+                 tail_bytes=DEFAULT_WATCH_TAIL_BYTES, use_inotify=True):
+        self.dispatcher = dispatcher
+        self.on_change = on_change
+        self.path = path
+        self.interval = interval
+        self.tail_bytes = tail_bytes
+        self.use_inotify = use_inotify
+        self.backend = None
+        self.polls = 0
+        self.reads = 0
+        self.changes = 0
+        self._signature = None
+        self._text = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        return {"backend": self.backend, "polls": self.polls, "reads": self.reads, "changes": self.changes}
+
+    def poll(self):
+        """Check the file once; post on_change if its text changed. Returns True on change."""
+        self.polls += 1
+        signature = file_signature(self.path)
+        if signature == self._signature or signature is None:
+            # Unchanged, or removed mid-replace: keep showing the last contents
+            return False
+        self._signature = signature
+        try:
+            text = read_tail(self.path, self.tail_bytes).strip()
+        except OSError as e:
+            logger.debug(f"Reading {self.path} failed: {e}")
+            return False
+        self.reads += 1
+        if text == self._text:
+            return False
+        self._text = text
+        self.changes += 1
+        self.dispatcher.post(self.on_change, text)
+        return True
+
+    def _run(self):
+        waiter = InotifyWaiter.create(os.path.dirname(os.path.abspath(self.path))) if self.use_inotify else None
+        self.backend = "inotify" if waiter is not None else "polling"
+        try:
+            self.poll()
+            while not self._stop.is_set():
+                if waiter is not None:
+                    waiter.wait(INOTIFY_SAFETY_POLL_SECONDS)
+                elif self._stop.wait(self.interval):
+                    break
+                self.poll()
+        finally:
+            if waiter is not None:
+                waiter.close()
+
+
+CONTROL_COMMANDS = ("show", "hide", "toggle", "set", "status", "quit")
+DEFAULT_CONTROL_QUEUE_SIZE = 1024  # Commands waiting for the Tk thread beyond this are dropped
+
+
+def validate_control_command(command):
+    """Check a control command's fields; returns a normalised copy or raises ValueError.
+
+    Only what can be checked off the Tk thread is checked here; whether a
+    monitor key still matches a connected monitor is decided when it is applied.
+    """
+    if not isinstance(command, dict) or command.get("cmd", "set") not in CONTROL_COMMANDS:
+        raise ValueError(f"unknown command: {command!r}")
+    command = dict(command)
+    if "text" in command:
+        command["text"] = str(command["text"])
+    if "corner" in command and command["corner"] not in CORNERS:
+        raise ValueError(f"unknown corner {command['corner']!r}")
+    for field in ("font_size", "padding"):
+        if field in command:
+            value = command[field]
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ValueError(f"{field} must be a non-negative integer, not {value!r}")
+    if "timer" in command:
+        value = command["timer"]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value < float("inf"):
+            raise ValueError(f"timer must be a non-negative number of seconds, not {value!r}")
+        command["timer"] = math.ceil(value)  # The timer field holds whole seconds
+    if "monitor" in command and (isinstance(command["monitor"], bool) or not isinstance(command["monitor"], (int, str))):
+        raise ValueError(f"monitor must be a 1-based index or a name, not {command['monitor']!r}")
+    return command
+
+
+class _ControlRequestHandler(socketserver.StreamRequestHandler):
+    """One JSON value per line in, one JSON response per line out."""
+
+    def handle(self):
+        control = self.server.control
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except ValueError as e:
+                control.count(dropped=1)
+                response = {"ok": False, "error": f"invalid JSON: {e}"}
+            else:
+                response = control.submit(payload)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class ControlServer:
+    """Optional local JSON control API on a Unix socket or loopback TCP port.
+
+    Each line is a command object such as {"cmd": "show", "text": "Hi",
+    "corner": "Top Right"}, a list of them, or {"batch": [...]}. Commands
+    are validated on the connection thread (validate_control_command) and
+    appended to a deque that the Tk thread drains once per dispatcher tick,
+    calling apply(command) for each. Commands beyond max_pending, or invalid
+    ones, are rejected in the response and counted as dropped; "status" is
+    answered directly with the counters and the receive-to-apply latency.
+    Connection threads update accepted/dropped under a lock; the other
+    counters are only written by the Tk thread.
+    """
+
+    def __init__(self, address, apply, max_pending=DEFAULT_CONTROL_QUEUE_SIZE, clock=time.perf_counter):
+        self.family, self.address = address
+        self.apply = apply
+        self.max_pending = max_pending
+        self.clock = clock
+        self.accepted = 0
+        self.dropped = 0
+        self.applied = 0
+        self.failed = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+        self._commands = deque()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._lock_file = None
+
+    def _claim_unix_address(self):
+        """Take the socket path for this process; OSError if another server owns it.
+
+        A lock file next to the socket serialises daemons starting at the same
+        time, and an existing socket is only unlinked once connecting to it
+        fails, so a live server is never orphaned.
+        """
+        if fcntl is not None:
+            lock_file = open(self.address + ".lock", "a")
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                raise OSError(f"another control server is starting or running at {self.address}")
+            self._lock_file = lock_file
+        if os.path.exists(self.address) and stat.S_ISSOCK(os.stat(self.address).st_mode):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.settimeout(1.0)
+                probe.connect(self.address)
+            except OSError:
+                os.unlink(self.address)  # Left behind by an instance that did not shut down cleanly
+            else:
+                self._release_lock()
+                raise OSError(f"a control server is already listening at {self.address}")
+            finally:
+                probe.close()
+
+    def _release_lock(self):
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def start(self):
+        if self.family == "unix":
+            if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+                raise OSError("Unix sockets are not supported here; use a loopback TCP port")
+            self._claim_unix_address()
+            try:
+                server = socketserver.ThreadingUnixStreamServer(self.address, _ControlRequestHandler)
+            except OSError:
+                self._release_lock()
+                raise
+        else:
+            server = socketserver.ThreadingTCPServer(self.address, _ControlRequestHandler, bind_and_activate=False)
+            if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                # On Windows SO_REUSEADDR would let a second process bind the same port
+                server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                server.allow_reuse_address = True
+            try:
+                server.server_bind()
+                server.server_activate()
+            except OSError:
+                server.server_close()
+                raise
+            self.address = server.server_address[:2]
+        server.daemon_threads = True
+        server.control = self
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="overlay-control", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self.family == "unix":
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+            self._release_lock()
+
+    @property
+    def mean_latency(self):
+        return self._total_latency / self.applied if self.applied else 0.0
+
+    def stats(self):
+        return {
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+            "applied": self.applied,
+            "failed": self.failed,
+            "pending": len(self._commands),
+            "latency_ms": {
+                "last": round(self.last_latency * 1000, 3),
+                "mean": round(self.mean_latency * 1000, 3),
+                "max": round(self.max_latency * 1000, 3),
+            },
+        }
+
+    def count(self, accepted=0, dropped=0):
+        with self._lock:
+            self.accepted += accepted
+            self.dropped += dropped
+
+    def submit(self, payload):
+        """Validate and queue a decoded request (connection thread); returns the response."""
+        if isinstance(payload, dict) and "batch" in payload:
+            payload = payload["batch"]
+        commands = payload if isinstance(payload, list) else [payload]
+        received = self.clock()
+        accepted = 0
+        errors = []
+        for command in commands:
+            try:
+                command = validate_control_command(command)
+            except ValueError as e:
+                self.count(dropped=1)
+                errors.append(str(e))
+                continue
+            if command.get("cmd") == "status":
+                continue
+            with self._lock:
+                if len(self._commands) >= self.max_pending:
+                    self.dropped += 1
+                    errors.append("queue full")
+                    continue
+                self._commands.append((received, command))
+                self.accepted += 1
+            accepted += 1
+        response = {"ok": not errors, "accepted": accepted}
+        if errors:
+            response["errors"] = errors
+        if any(isinstance(c, dict) and c.get("cmd") == "status" for c in commands):
+            response["status"] = self.stats()
+        return response
+
+    def drain(self):
+        """Apply every queued command (Tk thread); returns how many ran."""
+        ran = 0
+        commands = self._commands
+        while commands:
+            received, command = commands.popleft()
+            ran += 1
+            try:
+                self.apply(command)
+                self.applied += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Control command {command!r} failed: {e}")
+                continue
+            latency = self.clock() - received
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self._total_latency += latency
+        return ran
+
+
+class LineStream:
+    """Read lines on a background thread, keeping only the newest for the Tk thread.
+
+    The reader overwrites a single (sequence, line) slot - one tuple
+    assignment, no queue or lock - so however fast the producer writes, the
+    Tk thread sees at most one line per take(). Lines overwritten before
+    being taken are counted as dropped. opener() returns the file to read;
+    with reopen (FIFOs) it is opened again after each writer closes it.
+
+    wake(), if set, is called from the reader thread when a line arrives
+    after the previous one was taken, and when the stream ends, so the Tk
+    side only needs to poll while pending is true.
+    """
+
+    def __init__(self, opener, name="<stdin>", reopen=False, wake=None):
+        self.opener = opener
+        self.name = name
+        self.reopen = reopen
+        self.wake = wake
+        self.received = 0
+        self.displayed = 0
+        self.dropped = 0
+        self.closed = False
+        self._latest = (0, None)
+        self._taken = 0
+        self._woken = False
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="overlay-stream", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                with self.opener() as source:
+                    for raw in source:
+                        self.received += 1
+                        self._latest = (self.received, raw.rstrip("\r\n"))
+                        self._wake()
+                if not self.reopen:
+                    break
+        except (OSError, ValueError) as e:
+            logger.error(f"Reading {self.name} failed: {e}")
+        finally:
+            self.closed = True
+            self._woken = False
+            self._wake()
+
+    def _wake(self):
+        # One wake-up per batch: take() re-arms it before reading the slot
+        if self.wake is not None and not self._woken:
+            self._woken = True
+            self.wake()
+
+    @property
+    def pending(self):
+        """True while a line is waiting to be taken."""
+        return self._latest[0] != self._taken
+
+    def take(self):
+        """Return the newest line not yet taken, or None (Tk thread)."""
+        self._woken = False
+        seq, line = self._latest
+        if seq == self._taken:
+            return None
+        self.dropped += seq - self._taken - 1
+        self._taken = seq
+        self.displayed += 1
+        return line
+
+    @property
+    def finished(self):
+        return self.closed and self._taken == self._latest[0]
+
+    def stats(self):
+        return {"received": self.received, "displayed": self.displayed, "dropped": self.dropped}
+
+
+def open_line_stream(path):
+    """LineStream for --stream: "-" is stdin, a FIFO is reopened for each new writer."""
+    if path == "-":
+        # Closing the "with" on stdin would close the real sys.stdin; hand out a duplicate
+        return LineStream(lambda: os.fdopen(os.dup(sys.stdin.fileno()), encoding="utf-8", errors="replace"))
+    is_fifo = stat.S_ISFIFO(os.stat(path).st_mode)
+    return LineStream(lambda: open(path, encoding="utf-8", errors="replace"), name=path, reopen=is_fifo)
+
+
+OVERLAY_FONT_FAMILY = "Arial"
+OVERLAY_FONT_WEIGHT = "bold"
+GUI_FONT_FAMILY = "Arial"
+DEFAULT_MEASURE_CACHE_SIZE = 256
+STATE_MEASUREMENTS = 64  # Most recent text measurements carried over to the next run
+DEFAULT_FONT_CACHE_SIZE = 48
+FIT_MIN_FONT_SIZE = 12  # Same range as the Font Size dropdown
+FIT_MAX_FONT_SIZE = 240
+
+
+class FontCache:
+    """Shared named Tk fonts keyed by (family, size, weight), evicted LRU.
+
+    Widgets configured with a cached font reference it by name, so Tk resolves
+    each (family, size, weight) once instead of parsing a font tuple on every
+    configure. An evicted font stays valid for widgets still using it; Tk
+    frees it once the last one lets go.
+    """
+
+    def __init__(self, master, max_fonts=DEFAULT_FONT_CACHE_SIZE, font_factory=None):
+        self.max_fonts = max_fonts
+        self.font_factory = font_factory or (
+            lambda family, size, weight: tkfont.Font(root=master, family=family, size=size, weight=weight)
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fonts = OrderedDict()
+
+    def get(self, family, size, weight="normal"):
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = self._fonts[key] = self.font_factory(family, size, weight)
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+            self.evictions += 1
+        return font
+
+
+class TextMeasureCache:
+    """LRU cache of overlay window sizes computed from font metrics.
+
+    Sizes are derived from the font's measure()/linespace plus the label's
+    fixed chrome (border, highlight and internal padding), so no window has to
+    be laid out or mapped. Entries are keyed by (text, family, size, weight,
+    padding); font_factory(family, size, weight) supplies a tkinter.font.Font
+    and is expected to cache (see FontCache.get).
+    """
+
+    def __init__(self, font_factory, max_entries=DEFAULT_MEASURE_CACHE_SIZE):
+        self.font_factory = font_factory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Extra pixels the tk.Label adds on each side of its text (x, y)
+        self.label_inset = (0, 0)
+        self.fit_probes = 0  # measure() calls made by fit()
+        self._entries = OrderedDict()
+        self._fits = OrderedDict()
+
+    def set_label_chrome(self, label):
+        """Read border/highlight/padding once from the label the sizes are for."""
+        def pixels(option):
+            return int(round(label.winfo_fpixels(label.cget(option))))
+
+        border = pixels("borderwidth") + pixels("highlightthickness")
+        inset = (border + pixels("padx"), border + pixels("pady"))
+        if inset != self.label_inset:
+            self.label_inset = inset
+            self._entries.clear()
+            self._fits.clear()
+
+    def measure(self, text, family, size, weight, padding):
+        """Return the (width, height) of an overlay showing text, including padding."""
+        key = (text, family, size, weight, padding)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        font = self.font_factory(family, size, weight)
+        lines = text.split("\n")
+        text_width = max(font.measure(line) for line in lines)
+        text_height = font.metrics("linespace") * len(lines)
+        inset_x, inset_y = self.label_inset
+        entry = (text_width + 2 * (inset_x + padding), text_height + 2 * (inset_y + padding))
+
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self._fits.clear()
+
+    def snapshot(self, limit=STATE_MEASUREMENTS):
+        """The limit most recently used measurements as JSON-friendly lists (see preload)."""
+        return [list(key) + list(size) for key, size in list(self._entries.items())[-limit:]]
+
+    def preload(self, entries, label_inset):
+        """Seed the cache from a snapshot taken with the given label inset.
+
+        set_label_chrome() drops the entries again if the real label turns
+        out to have different chrome.
+        """
+        if not entries or not label_inset:
+            return
+        try:
+            self.label_inset = (int(label_inset[0]), int(label_inset[1]))
+            for text, family, size, weight, padding, width, height in entries[-self.max_entries:]:
+                self._entries[(text, family, size, weight, padding)] = (width, height)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Ignoring cached measurements: {e}")
+            self.clear()
+
+    def wrap(self, text, family, size, weight, max_width):
+        """Greedily break text at spaces so each line is at most max_width pixels wide."""
+        font = self.font_factory(family, size, weight)
+        lines = []
+        for paragraph in text.split("\n"):
+            line = ""
+            for word in paragraph.split(" "):
+                candidate = f"{line} {word}" if line else word
+                if line and font.measure(candidate) > max_width:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = candidate
+            lines.append(line)
+        return "\n".join(lines)
+
+    def fit(self, text, family, weight, padding, max_width, max_height, wrap=False,
+            min_size=FIT_MIN_FONT_SIZE, max_size=FIT_MAX_FONT_SIZE):
+        """Return (size, text) for the largest font size whose overlay fits max_width x max_height.
+
+        Binary search over the size range, so about log2(max_size - min_size)
+        measurements instead of one relayout per candidate. With wrap, the
+        returned text has line breaks for that size. Falls back to min_size
+        when nothing fits. Results are cached.
+        """
+        key = (text, family, weight, padding, max_width, max_height, wrap, min_size, max_size)
+        result = self._fits.get(key)
+        if result is not None:
+            self._fits.move_to_end(key)
+            return result
+
+        inset_x = self.label_inset[0]
+        text_width = max_width - 2 * (inset_x + padding)
+        result = None
+        low, high = min_size, max_size
+        while low <= high:
+            size = (low + high) // 2
+            laid_out = self.wrap(text, family, size, weight, text_width) if wrap else text
+            width, height = self.measure(laid_out, family, size, weight, padding)
+            self.fit_probes += 1
+            if width <= max_width and height <= max_height:
+                result = (size, laid_out)
+                low = size + 1
+            else:
+                high = size - 1
+        if result is None:
+            result = (min_size, self.wrap(text, family, min_size, weight, text_width) if wrap else text)
+
+        self._fits[key] = result
+        if len(self._fits) > self.max_entries:
+            self._fits.popitem(last=False)
+        return result
+
+
+DEFAULT_BITMAP_CACHE_MB = 32
+BITMAP_SHADOW_COLOR = "#404040"
+# Font files tried for the bitmap renderer, in order; Pillow searches the system font directories
+BITMAP_FONT_FILES = {
+    "bold": ("{lower}bd.ttf", "{family} Bold.ttf", "{family}-Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf"),
+    "normal": ("{family}.ttf", "{family}-Regular.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"),
+}
+
+
+class PillowTextRenderer:
+    """Rasterize overlay text with Pillow into Tk PhotoImages (bitmap render mode).
+
+    Outlines are drawn as a text stroke in the background colour and drop
+    shadows as an offset copy, both of which would be too costly to redraw
+    on a live label. Sizes are Tk font sizes (points, or pixels when
+    negative) and are converted with the display's DPI, so a bitmap matches
+    the label text the fit and measure caches are computed for.
+    """
 
-class OverlayApp:
     def __init__(self, master):
+        if Image is None:
+            raise RuntimeError("Pillow is not installed")
+        self.master = master
+        self._fonts = {}
+        self._pixels_per_point = None
+
+    def pixel_size(self, size):
+        """Pillow font size (pixels) for a Tk font size."""
+        if size < 0:
+            return -size
+        if self._pixels_per_point is None:
+            self._pixels_per_point = self.master.winfo_fpixels("1p")
+        return max(1, round(size * self._pixels_per_point))
+
+    def font(self, family, size, weight):
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            pixels = self.pixel_size(size)
+            for pattern in BITMAP_FONT_FILES.get(weight, BITMAP_FONT_FILES["normal"]):
+                try:
+                    font = ImageFont.truetype(pattern.format(family=family, lower=family.lower()), pixels)
+                    break
+                except OSError:
+                    continue
+            else:
+                logger.warning(f"No TrueType font found for {family} {weight}, using Pillow's default font")
+                try:
+                    font = ImageFont.load_default(pixels)
+                except TypeError:  # Pillow < 10.1 has a single fixed-size default
+                    font = ImageFont.load_default()
+            self._fonts[key] = font
+        return font
+
+    def __call__(self, text, family, size, weight, fg, bg, outline, shadow):
+        font = self.font(family, size, weight)
+        probe = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        left, top, right, bottom = probe.multiline_textbbox((0, 0), text, font=font, stroke_width=outline)
+        image = Image.new("RGB", (max(1, right - left + shadow), max(1, bottom - top + shadow)), bg)
+        draw = ImageDraw.Draw(image)
+        origin = (-left, -top)
+        if shadow:
+            draw.multiline_text(
+                (origin[0] + shadow, origin[1] + shadow), text, font=font, fill=BITMAP_SHADOW_COLOR,
+                stroke_width=outline, stroke_fill=BITMAP_SHADOW_COLOR,
+            )
+        draw.multiline_text(origin, text, font=font, fill=fg, stroke_width=outline, stroke_fill=bg)
+        return ImageTk.PhotoImage(image, master=self.master)
+
+
+class BitmapCache:
+    """LRU of pre-rendered overlay text images bounded by a memory budget.
+
+    Keyed by (text, family, size, weight, fg, bg, outline, shadow); an image
+    costs width * height * 4 bytes against max_bytes. The newest image is
+    always kept even if it alone exceeds the budget. render(*key) returns an
+    object with width()/height() (see PillowTextRenderer).
+    """
+
+    def __init__(self, render, max_bytes=DEFAULT_BITMAP_CACHE_MB * 1024 * 1024,
+                 fg=OVERLAY_FG, bg=OVERLAY_BG, outline=0, shadow=0):
+        self.render = render
+        self.max_bytes = max_bytes
+        self.fg = fg
+        self.bg = bg
+        self.outline = outline
+        self.shadow = shadow
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, text, family, size, weight):
+        key = (text, family, size, weight, self.fg, self.bg, self.outline, self.shadow)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        image = self.render(*key)
+        cost = image.width() * image.height() * 4
+        self._entries[key] = (image, cost)
+        self.bytes += cost
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self.bytes -= evicted_cost
+            self.evictions += 1
+        return image
+
+
+STATE_VERSION = 1
+DEFAULT_STATE_FILE = os.path.join(os.path.expanduser("~"), ".overlaypy", "state.json")
+
+
+def load_state(path):
+    """Read the state saved by save_state(); {} if missing, unreadable or from another version."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable state file {path}: {e}")
+        return {}
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return {}
+    # A hand-edited file may have the right version but the wrong shapes; drop those parts
+    settings = state.get("settings", {})
+    if not isinstance(settings, dict):
+        logger.warning(f"Ignoring settings in {path}: expected an object")
+        state["settings"] = settings = {}
+    if "monitor" in settings and not isinstance(settings["monitor"], (str, int)):
+        del settings["monitor"]
+    for key in ("monitors", "measurements"):
+        entries = state.get(key, [])
+        if not isinstance(entries, list) or (key == "monitors" and not all(isinstance(m, dict) for m in entries)):
+            logger.warning(f"Ignoring {key} in {path}: unexpected format")
+            state[key] = []
+    return state
+
+
+def save_state(path, state):
+    """Write state atomically (temporary file + rename) so a crash never leaves half a file.
+
+    Each writer gets its own temporary file, so two instances exiting at the
+    same time cannot interleave; the last rename wins.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dict(state, version=STATE_VERSION), f)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+
+
+CORNERS = ("Bottom Left", "Bottom Right", "Top Left", "Top Right", "Center")
+OVERLAY_MARGIN = 20  # Margin from screen edges
+
+
+def overlay_position(monitor, corner, width, height, margin=OVERLAY_MARGIN):
+    """Return the (x, y) of a width x height overlay in corner of monitor, kept on screen.
+
+    Unknown corners fall back to bottom left.
+    """
+    if corner == "Bottom Right":
+        x_pos = monitor.x + monitor.width - width - margin
+        y_pos = monitor.y + monitor.height - height - margin
+    elif corner == "Top Left":
+        x_pos = monitor.x + margin
+        y_pos = monitor.y + margin
+    elif corner == "Top Right":
+        x_pos = monitor.x + monitor.width - width - margin
+        y_pos = monitor.y + margin
+    elif corner == "Center":
+        x_pos = monitor.x + (monitor.width - width) // 2
+        y_pos = monitor.y + (monitor.height - height) // 2
+    else:  # Bottom Left
+        x_pos = monitor.x + margin
+        y_pos = monitor.y + monitor.height - height - margin
+
+    # Clamp x_pos and y_pos to stay within monitor bounds
+    x_pos = max(monitor.x, min(x_pos, monitor.x + monitor.width - width))
+    y_pos = max(monitor.y, min(y_pos, monitor.y + monitor.height - height))
+    return x_pos, y_pos
+
+
+Cue = namedtuple("Cue", "at text monitor corner font_size padding duration")
+PreparedCue = namedtuple("PreparedCue", "cue monitor font geometry image", defaults=(None,))
+
+CUE_DEFAULTS = {"monitor": None, "corner": "Bottom Left", "font_size": 36, "padding": 40, "duration": None}
+_CUE_TIME_UNITS = re.compile(r"(\d+(?:\.\d+)?)([hms])")
+
+
+def parse_cue_time(value):
+    """Seconds from a cue timestamp: 90, "90s", "45m", "1h30m", "45:00" or "1:30:00"."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = float(value)
+    elif isinstance(value, str) and ":" in value:
+        seconds = 0.0
+        for part in value.strip().split(":"):
+            seconds = seconds * 60 + float(part)
+    elif isinstance(value, str):
+        text = value.strip().lower().lstrip("t+")
+        try:
+            seconds = float(text)
+        except ValueError:
+            units = _CUE_TIME_UNITS.findall(text)
+            if not units or "".join(n + u for n, u in units) != text:
+                raise ValueError(f"Invalid cue time {value!r}")
+            seconds = sum(float(n) * {"h": 3600, "m": 60, "s": 1}[u] for n, u in units)
+    else:
+        raise ValueError(f"Invalid cue time {value!r}")
+    if seconds < 0:
+        raise ValueError(f"Cue time {value!r} is negative")
+    return seconds
+
+
+def load_cue_list(path):
+    """Read a JSON cue list and return its cues sorted by time.
+
+    The file is either a list of cues or {"defaults": {...}, "cues": [...]}.
+    Each cue needs "at" (see parse_cue_time) and "text"; "monitor" (1-based
+    index, name or label), "corner", "font_size", "padding" and "duration"
+    (seconds until auto-hide, omitted = until the next cue) fall back to the
+    file defaults and then CUE_DEFAULTS.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        data = {"cues": data}
+    defaults = dict(CUE_DEFAULTS, **data.get("defaults", {}))
+
+    cues = []
+    for i, entry in enumerate(data.get("cues", [])):
+        try:
+            fields = dict(defaults, **entry)
+            cues.append(Cue(
+                at=parse_cue_time(fields["at"]),
+                text=str(fields["text"]),
+                monitor=fields["monitor"],
+                corner=fields["corner"] if fields["corner"] in CORNERS else "Bottom Left",
+                font_size=int(fields["font_size"]),
+                padding=int(fields["padding"]),
+                duration=float(fields["duration"]) if fields["duration"] else None,
+            ))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"{path}: cue {i + 1} is invalid: {e}") from e
+    cues.sort(key=lambda cue: cue.at)
+    return cues
+
+
+class CuePlayer:
+    """Plays a cue list on an OverlayApp from layouts computed at load time.
+
+    load() resolves every cue's monitor, font, measured size and position
+    through OverlayApp.prepare_cue; start() puts all cues on the app's
+    TimerWheel, so firing one only configures the label and applies a known
+    geometry. prepare() is re-run when the monitor layout changes.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.cues = []
+        self.prepared = []
+        self.fired = 0
+        self._handles = []
+        self._remaining = 0
+
+    def load(self, cues):
+        self.stop()
+        self.cues = list(cues)
+        self.prepare()
+
+    def prepare(self):
+        self.prepared = [self.app.prepare_cue(cue) for cue in self.cues]
+
+    @property
+    def playing(self):
+        return bool(self._handles)
+
+    def start(self, offset=0.0):
+        """Schedule every cue at or after offset seconds into the list."""
+        self.stop()
+        self._handles = [
+            self.app.timers.schedule(cue.at - offset, self._fire, i)
+            for i, cue in enumerate(self.cues) if cue.at >= offset
+        ]
+        self._remaining = len(self._handles)
+
+    def stop(self):
+        for handle in self._handles:
+            self.app.timers.cancel(handle)
+        self._handles = []
+
+    def _fire(self, index):
+        self.fired += 1
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._handles = []
+        self.app.recorder.record(EVENT_CUE, index, int(self.app.timers.last_drift * 1_000_000))
+        self.app.show_cue(self.prepared[index])
+
+
+class OneShotOverlay:
+    """A single overlay shown without the controller GUI (--message).
+
+    Only the overlay Toplevel is built: monitors are probed once, the size
+    comes from font metrics and the master's mainloop is quit as soon as the
+    overlay hides, either after timeout seconds or when hide() is called.
+    """
+
+    def __init__(self, master, window_factory=None, monitors=None, on_shown=None):
+        self.master = master
+        self.window_factory = window_factory or (lambda: create_overlay_window(master))
+        self.monitors = monitors
+        self.on_shown = on_shown
+        self.font_cache = FontCache(master, max_fonts=2)
+        self.measure_cache = TextMeasureCache(self.font_cache.get, max_entries=4)
+        self.reveal = OverlayReveal(master, self._deiconify, self._on_shown)
+        self.window = None
+        self.label = None
+        self.geometry = None
+
+    def show(self, text, monitor=None, corner="Bottom Left", font_size=36, padding=40, timeout=0):
+        started = time.perf_counter()
+        registry = MonitorRegistry(self.monitors if self.monitors is not None else probe_monitors())
+        record = registry.find(monitor)
+        if record is None:
+            record = registry.primary
+            logger.warning(f"No monitor matches {monitor!r}, using {record.label}")
+
+        self.window, self.label = self.window_factory()
+        font = self.font_cache.get(OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT)
+        self.label.config(text=text, font=font)
+        self.label.pack_configure(padx=padding, pady=padding)
+        self.measure_cache.set_label_chrome(self.label)
+        width, height = self.measure_cache.measure(text, OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT, padding)
+        x_pos, y_pos = overlay_position(record, corner, width, height)
+        self.geometry = (width, height, x_pos, y_pos)
+        self.window.geometry(f"{width}x{height}+{x_pos}+{y_pos}")
+        self.reveal.begin(self.window, (width, height), started=started)
+        enable_click_through(self.window)
+        if timeout > 0:
+            self.master.after(int(timeout * 1000), self.hide)
+        logger.info(f"One-shot overlay on {record.label} ({corner}), timeout {timeout}s")
+
+    def hide(self):
+        self.reveal.cancel()
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+        self.master.quit()
+
+    def _deiconify(self, window):
+        window.deiconify()
+
+    def _on_shown(self, latency, trigger):
+        logger.info(f"✓ One-shot overlay shown in {latency * 1000:.1f} ms (reveal trigger: {trigger})")
+        if self.on_shown is not None:
+            self.on_shown()
+
+
+class OverlayApp:
+    def __init__(self, master, recorder=None, state=None):
         self.logger = logging.getLogger(f"{__name__}.OverlayApp")
         self.logger.info("Initializing OverlayApp...")
         
         self.master = master
+        self.recorder = recorder if recorder is not None else flight_recorder
+        # Settings, monitor layout and measurements saved by the previous run (see export_state)
+        state = state or {}
+        settings = state.get("settings", {})
         master.title("Overlay Controller")
         master.geometry("450x500")
+        # Closing the window ends mainloop like Quit does, so the widgets still
+        # exist when the state is saved on the way out
+        master.protocol("WM_DELETE_WINDOW", master.quit)
         
         # GUI font size control
         self.gui_font_size = 11  # Default GUI font size
+        # Every controller widget uses one of these three named fonts, so zooming
+        # reconfigures three fonts instead of walking the widget tree
+        self.gui_fonts = {
+            role: tkfont.Font(root=master, family=GUI_FONT_FAMILY, size=size, weight=weight)
+            for role, size, weight in self._gui_font_specs()
+        }
+        # Named fonts for the overlay label, one per size
+        self.font_cache = FontCache(master)
         
         try:
             master.attributes("-topmost", True)  # Keep main window always on top
@@ -212,9 +2687,10 @@ class OverlayApp:
             "216",
             "240",
         ]
-        self.font_size_var.set("36")  # Default font size
+        self.font_size_var.set(settings.get("font_size") if settings.get("font_size") in font_sizes else "36")  # Default font size
         self.font_size_menu = tk.OptionMenu(font_col, self.font_size_var, *font_sizes, command=self.on_setting_change)
         self.font_size_menu.config(width=8)
+        self.apply_gui_font_to_menu(self.font_size_menu)
         self.font_size_menu.pack(fill=tk.X)
 
         # Position Column
@@ -222,10 +2698,10 @@ class OverlayApp:
         position_col.pack(side=tk.LEFT, padx=(0, 15), fill=tk.X, expand=True)
         tk.Label(position_col, text="Position:", font=self.get_gui_font(bold=True)).pack()
         self.corner_var = tk.StringVar(container)
-        corners = ["Bottom Left", "Bottom Right", "Top Left", "Top Right", "Center"]
-        self.corner_var.set("Bottom Left")  # Default position
-        self.corner_menu = tk.OptionMenu(position_col, self.corner_var, *corners, command=self.on_setting_change)
+        self.corner_var.set(settings.get("corner") if settings.get("corner") in CORNERS else "Bottom Left")  # Default position
+        self.corner_menu = tk.OptionMenu(position_col, self.corner_var, *CORNERS, command=self.on_setting_change)
         self.corner_menu.config(width=10)
+        self.apply_gui_font_to_menu(self.corner_menu)
         self.corner_menu.pack(fill=tk.X)
 
         # Padding Column
@@ -234,7 +2710,7 @@ class OverlayApp:
         tk.Label(padding_col, text="Padding (px):", font=self.get_gui_font(bold=True)).pack()
         self.padding_entry = tk.Entry(padding_col, width=8, font=self.get_gui_font(), justify="center")
         self.padding_entry.pack(fill=tk.X)
-        self.padding_entry.insert(0, "40")
+        self.padding_entry.insert(0, str(settings.get("padding", "40")))
         # Bind real-time updates for padding
         self.padding_entry.bind("<KeyRelease>", self.on_setting_change)
 
@@ -242,7 +2718,7 @@ class OverlayApp:
         timer_frame = tk.Frame(container)
         timer_frame.pack(pady=(10, 10))
 
-        self.timer_enabled = tk.BooleanVar(value=True)
+        self.timer_enabled = tk.BooleanVar(value=bool(settings.get("timer_enabled", True)))
         self.timer_checkbox = tk.Checkbutton(
             timer_frame, text="Auto-hide after", variable=self.timer_enabled, font=self.get_gui_font(), command=self.on_timer_change
         )
@@ -250,84 +2726,78 @@ class OverlayApp:
 
         self.timer_entry = tk.Entry(timer_frame, width=5, font=self.get_gui_font())
         self.timer_entry.pack(side=tk.LEFT, padx=(5, 2))
-        self.timer_entry.insert(0, "60")
+        self.timer_entry.insert(0, str(settings.get("timer", "60")))
         # Bind real-time updates for timer
         self.timer_entry.bind("<KeyRelease>", self.on_timer_change)
 
         tk.Label(timer_frame, text="seconds", font=self.get_gui_font()).pack(side=tk.LEFT)
 
+        # --- Fit Settings (overrides Font Size while enabled) ---
+        fit_frame = tk.Frame(container)
+        fit_frame.pack(pady=(0, 10))
+
+        self.fit_enabled = tk.BooleanVar(value=bool(settings.get("fit_enabled", False)))
+        self.fit_checkbox = tk.Checkbutton(
+            fit_frame, text="Fit to", variable=self.fit_enabled, font=self.get_gui_font(), command=self.on_setting_change
+        )
+        self.fit_checkbox.pack(side=tk.LEFT)
+
+        self.fit_entry = tk.Entry(fit_frame, width=5, font=self.get_gui_font())
+        self.fit_entry.pack(side=tk.LEFT, padx=(5, 2))
+        self.fit_entry.insert(0, str(settings.get("fit_percent", "90")))
+        self.fit_entry.bind("<KeyRelease>", self.on_setting_change)
+
+        tk.Label(fit_frame, text="% of monitor width", font=self.get_gui_font()).pack(side=tk.LEFT)
+
+        self.wrap_enabled = tk.BooleanVar(value=bool(settings.get("wrap", False)))
+        self.wrap_checkbox = tk.Checkbutton(
+            fit_frame, text="Wrap words", variable=self.wrap_enabled, font=self.get_gui_font(), command=self.on_setting_change
+        )
+        self.wrap_checkbox.pack(side=tk.LEFT, padx=(10, 0))
+
+        self.ticker_enabled = tk.BooleanVar(value=False)
+        self.ticker_checkbox = tk.Checkbutton(
+            container, text="Scroll as ticker along the screen edge", variable=self.ticker_enabled, font=self.get_gui_font()
+        )
+        self.ticker_checkbox.pack(pady=(0, 10))
+
         # --- Monitor Selection ---
         tk.Label(container, text="Select Monitor:", font=self.get_gui_font(bold=True)).pack(pady=(10, 2))
         
-        self.logger.info("Detecting monitors...")
+        # Warm start: lay out from the cached monitor layout, re-probed in the background later
         try:
-            self.monitors = get_monitors()
-            self.logger.info(f"✓ Detected {len(self.monitors)} monitor(s)")
-            for i, monitor in enumerate(self.monitors):
-                self.logger.info(f"  Monitor {i+1}: {monitor}")
-        except Exception as e:
-            self.logger.error(f"Failed to detect monitors: {e}")
-            # Create a fallback monitor for testing
-            self.monitors = []
-            
-        if not self.monitors:
-            self.logger.warning("No monitors detected, creating fallback monitor")
-            # Create a simple fallback monitor object
-            class FallbackMonitor:
-                def __init__(self):
-                    self.x = 0
-                    self.y = 0
-                    self.width = 1920
-                    self.height = 1080
-                    self.name = "Fallback Monitor"
-                def __str__(self):
-                    return f"FallbackMonitor(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
-            self.monitors = [FallbackMonitor()]
-        
+            cached_monitors = [MonitorInfo(**monitor) for monitor in state.get("monitors", [])]
+        except TypeError:
+            cached_monitors = []
+        self.monitors_from_cache = bool(cached_monitors)
+        if self.monitors_from_cache:
+            self.logger.info("Using cached monitor layout (re-probing in background)")
+            self.monitor_registry = MonitorRegistry(cached_monitors)
+        else:
+            self.logger.info("Detecting monitors...")
+            with startup_profiler.phase("monitor probe"):
+                self.monitor_registry = MonitorRegistry(probe_monitors())
+
         self.monitor_var = tk.StringVar(container)
+        monitor_names = self.monitor_registry.labels
+        default_monitor = self.monitor_registry.by_id.get(settings.get("monitor"), self.monitor_registry.primary)
+        self.monitor_var.set(default_monitor.label)
+        self.logger.info(f"✓ Default monitor set to: {default_monitor.label}")
 
-        # Create monitor names for dropdown
-        monitor_names = []
-        self.logger.debug("Creating monitor dropdown options...")
-        for i, monitor in enumerate(self.monitors):
-            try:
-                if hasattr(monitor, "name") and monitor.name:
-                    monitor_name = f"{monitor.name} ({monitor.width}x{monitor.height})"
-                    self.logger.debug(f"Monitor {i+1} with name: {monitor_name}")
-                else:
-                    monitor_name = f"Monitor {i + 1} ({monitor.width}x{monitor.height})"
-                    self.logger.debug(f"Monitor {i+1} without name: {monitor_name}")
-                monitor_names.append(monitor_name)
-            except Exception as e:
-                self.logger.error(f"Error processing monitor {i+1}: {e}")
-                monitor_names.append(f"Monitor {i + 1} (Unknown)")
-
-        if monitor_names:
-            # Try to set primary monitor as default
-            primary_monitor_name = None
-            for i, monitor in enumerate(self.monitors):
-                if hasattr(monitor, 'is_primary') and monitor.is_primary:
-                    if hasattr(monitor, "name") and monitor.name:
-                        primary_monitor_name = f"{monitor.name} ({monitor.width}x{monitor.height})"
-                    else:
-                        primary_monitor_name = f"Monitor {i + 1} ({monitor.width}x{monitor.height})"
-                    break
-            
-            if primary_monitor_name and primary_monitor_name in monitor_names:
-                self.monitor_var.set(primary_monitor_name)
-                self.logger.info(f"✓ Default monitor set to primary: {primary_monitor_name}")
-            else:
-                self.monitor_var.set(monitor_names[0])
-                self.logger.info(f"✓ Default monitor set to: {monitor_names[0]}")
-        else:
-            self.monitor_var.set("No monitors detected")
-            self.logger.error("No monitor names available for dropdown")
-            
         self.monitor_menu = tk.OptionMenu(container, self.monitor_var, *monitor_names, command=self.on_setting_change)
         self.monitor_menu.config(width=35)
+        self.apply_gui_font_to_menu(self.monitor_menu)
         self.monitor_menu.pack(pady=(0, 15))
         self.logger.debug("✓ Monitor selection UI created")
 
+        # Runs callbacks posted by background threads (monitor watcher, ...) on the Tk thread
+        self.dispatcher = TkDispatcher(master)
+        self.dispatcher.start()
+        self.monitor_watcher = None
+        self.control_server = None
+        self.stream = None
+        self.file_watcher = None
+
         # --- Buttons ---
         self.toggle_btn = tk.Button(
             container,
@@ -344,8 +2814,38 @@ class OverlayApp:
 
         # Overlay state
         self.overlay = None
+        self.label = None
+        self.overlay_pool = OverlayWindowPool(master)
         self.overlay_visible = False
-        self.timer_job = None  # Store timer job reference
+        # All timed overlay events (auto-hide, cues, ...) share one heap-backed scheduler
+        self.timers = TimerWheel(master)
+        self.hide_timer = None  # Handle of the pending auto-hide in self.timers
+        self.cue_player = CuePlayer(self)
+        # Per-frame animations (ticker, ...) share one frame callback
+        self.frames = FrameScheduler(master)
+        self.ticker = Ticker(self.frames, lambda: create_ticker_window(master))
+        self.fade_ms = DEFAULT_FADE_MS  # 0 shows and hides overlays abruptly
+        self._fade_in = None
+
+        self.overlay_text = ""
+        self.measure_cache = TextMeasureCache(self.font_cache.get)
+        self.measure_cache.preload(state.get("measurements"), state.get("label_inset"))
+        self._label_font = None  # Cached font currently on the overlay label
+        self._label_text = None  # Text currently on the overlay label (wrapped in fit mode)
+        self.bitmap_cache = None  # Set by enable_bitmap_rendering() for the bitmap render mode
+        self._label_image = None  # Keeps the PhotoImage on the label alive while shown
+
+        # Windows are revealed on their Configure event; latencies of recent shows are kept
+        self.reveal = OverlayReveal(master, self._deiconify_overlay, self._on_overlay_shown)
+        self.show_latencies = deque(maxlen=100)
+        self.last_geometry = None  # (width, height, x, y) of the last layout pass
+
+        # Geometry read-back is diagnostics only: 0 = never, N = every Nth layout pass
+        self.verify_geometry_every = 0
+        self.geometry_updates = 0
+
+        # Setting changes are merged into at most one layout pass per frame
+        self.layout_coalescer = FrameCoalescer(master, self._run_coalesced_layout)
 
     def setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts for GUI font size control."""
@@ -359,6 +2859,7 @@ class OverlayApp:
         self.master.bind(f"<{modifier}-equal>", self.increase_gui_font)  # Ctrl/Cmd + =
         self.master.bind(f"<{modifier}-plus>", self.increase_gui_font)   # Ctrl/Cmd + +
         self.master.bind(f"<{modifier}-minus>", self.decrease_gui_font)  # Ctrl/Cmd + -
+        self.master.bind(f"<{modifier}-Shift-D>", self.dump_flight_recorder)  # Ctrl/Cmd + Shift + D
         
         # Make sure the window can receive focus for key events
         self.master.focus_set()
@@ -379,85 +2880,268 @@ class OverlayApp:
             self.update_gui_fonts()
             self.logger.debug(f"GUI font size decreased to {self.gui_font_size}")
 
+    def _gui_font_specs(self):
+        """(role, size, weight) for the controller's named fonts at the current zoom."""
+        return (
+            ("normal", self.gui_font_size, "normal"),
+            ("bold", self.gui_font_size, "bold"),
+            ("entry", self.gui_font_size + 2, "normal"),
+        )
+
     def update_gui_fonts(self):
-        """Update all GUI element fonts to the current size."""
+        """Update all GUI element fonts to the current size.
+
+        Widgets reference the named fonts in self.gui_fonts, so this is a
+        constant three font reconfigures however many widgets exist.
+        """
         try:
-            # Create the font tuple
-            gui_font = ("Arial", self.gui_font_size)
-            bold_font = ("Arial", self.gui_font_size, "bold")
-            
-            # Update all labels and buttons
-            for widget in self.master.winfo_children():
-                self.update_widget_fonts(widget, gui_font, bold_font)
-                
+            for role, size, weight in self._gui_font_specs():
+                self.gui_fonts[role].configure(size=size, weight=weight)
             self.logger.debug(f"✓ Updated all GUI fonts to size {self.gui_font_size}")
         except Exception as e:
             self.logger.error(f"Failed to update GUI fonts: {e}")
 
-    def update_widget_fonts(self, widget, gui_font, bold_font):
-        """Recursively update fonts for a widget and its children."""
-        try:
-            # Update current widget if it has a font
-            if hasattr(widget, 'config'):
-                if isinstance(widget, (tk.Label, tk.Button)):
-                    # Check if it should be bold
-                    current_font = widget.cget('font')
-                    if isinstance(current_font, tuple) and len(current_font) >= 3 and 'bold' in current_font:
-                        widget.config(font=bold_font)
-                    else:
-                        widget.config(font=gui_font)
-                elif isinstance(widget, (tk.Entry, ttk.Entry)):
-                    widget.config(font=gui_font)
-                elif isinstance(widget, (tk.OptionMenu, ttk.OptionMenu)):
-                    widget.config(font=gui_font)
-            
-            # Recursively update children
-            for child in widget.winfo_children():
-                self.update_widget_fonts(child, gui_font, bold_font)
-                
+    def apply_gui_font_to_menu(self, option_menu):
+        """Give an OptionMenu button and its dropdown the shared GUI font."""
+        option_menu.config(font=self.gui_fonts["normal"])
+        option_menu["menu"].config(font=self.gui_fonts["normal"])
+
+    def dump_flight_recorder(self, event=None):
+        """Write the flight recorder buffer to the logs directory on demand."""
+        try:
+            self.recorder.dump(reason="keyboard shortcut")
         except Exception as e:
-            # Ignore widgets that don't support font changes
-            pass
+            self.logger.error(f"Flight recorder dump failed: {e}")
 
     def get_gui_font(self, bold=False):
-        """Get the current GUI font tuple."""
-        if bold:
-            return ("Arial", self.gui_font_size, "bold")
-        else:
-            return ("Arial", self.gui_font_size)
+        """Get the shared named GUI font (follows zoom automatically)."""
+        return self.gui_fonts["bold" if bold else "normal"]
 
     def get_gui_entry_font(self):
         """Get a slightly larger font for entry widgets."""
-        return ("Arial", self.gui_font_size + 2)
+        return self.gui_fonts["entry"]
 
     def on_setting_change(self, event=None):
-        """Called when font size, position, or padding changes - updates overlay in real-time"""
+        """Called when font size, position, or padding changes - updates overlay in real-time.
+
+        Changes are coalesced: a burst of keystrokes or menu callbacks results
+        in a single update_overlay_appearance() on the next idle/frame.
+        """
         self.logger.debug(f"Setting change detected: event={event}")
-        if self.overlay_visible and self.overlay is not None:
-            self.logger.debug("Updating overlay appearance due to setting change")
-            self.update_overlay_appearance()
+        self.recorder.record(EVENT_SETTING)
+        if self.overlay_visible and (self.overlay is not None or self.ticker.running):
+            self.layout_coalescer.request()
         else:
             self.logger.debug("Skipping overlay update (not visible or None)")
 
+    def _run_coalesced_layout(self):
+        coalescer = self.layout_coalescer
+        self.logger.debug(
+            f"Coalesced layout pass #{coalescer.runs} ({coalescer.requests} changes, {coalescer.merged} merged)"
+        )
+        if self.ticker.running:
+            self.update_ticker()
+        else:
+            self.update_overlay_appearance()
+
+    def update_ticker(self):
+        """Apply font, padding, corner and monitor changes to the running ticker."""
+        try:
+            self.ticker.update(*self._ticker_settings())
+        except Exception as e:
+            self.logger.error(f"Failed to update ticker: {e}")
+
     def on_timer_change(self, event=None):
         """Called when timer settings change - updates timer in real-time"""
         self.logger.debug(f"Timer setting change detected: event={event}")
         if self.overlay_visible and self.overlay is not None:
-            # Cancel existing timer
-            if self.timer_job:
-                self.master.after_cancel(self.timer_job)
-                self.timer_job = None
-                self.logger.debug("✓ Cancelled existing timer")
+            # Cancel existing timer: a flag flip in the timer heap; the pending Tk
+            # job is kept and re-armed when it fires, so no Tk call per keystroke
+            self.timers.cancel(self.hide_timer)
+            self.hide_timer = None
 
             # Set new timer if enabled
             if self.timer_enabled.get():
                 try:
                     timer_seconds = int(self.timer_entry.get())
                     if timer_seconds > 0:
-                        self.timer_job = self.master.after(timer_seconds * 1000, self.auto_hide_overlay)
+                        self.hide_timer = self.timers.schedule(timer_seconds, self.auto_hide_overlay)
+                        self.recorder.record(EVENT_TIMER_SET, timer_seconds)
                 except ValueError:
                     pass  # Invalid timer value, skip timer
 
+    def start_monitor_watcher(self, interval=DEFAULT_MONITOR_POLL_SECONDS):
+        """Watch for docking/undocking in the background (interval <= 0 disables)."""
+        if interval <= 0:
+            self.logger.info("Monitor hotplug detection disabled")
+            if self.monitors_from_cache:
+                # Still confirm (or correct) the cached layout once
+                watcher = MonitorWatcher(self.dispatcher, self.apply_monitor_layout, self.monitor_registry.records)
+                threading.Thread(target=watcher.poll, name="monitor-reprobe", daemon=True).start()
+            return
+        self.monitor_watcher = MonitorWatcher(
+            self.dispatcher, self.apply_monitor_layout, self.monitor_registry.records, interval=interval
+        )
+        self.monitor_watcher.start(immediate=self.monitors_from_cache)
+        self.logger.info(f"✓ Monitor hotplug detection every {interval}s")
+
+    def start_control_server(self, address):
+        """Accept JSON commands on a local socket (see ControlServer); address from parse_control_address."""
+        self.control_server = ControlServer(address, self.apply_command)
+        self.control_server.start()
+        self.dispatcher.add_tick_handler(self.control_server.drain)
+        self.logger.info(f"✓ Control server listening on {self.control_server.family}:{self.control_server.address}")
+
+    def apply_command(self, command):
+        """Apply one control command on the Tk thread by driving the controller's own widgets.
+
+        command has been through validate_control_command(); the monitor is
+        resolved before any widget changes so a stale key leaves them untouched.
+        """
+        action = command.get("cmd", "set")
+        monitor = None
+        if "monitor" in command:
+            monitor = self.monitor_registry.find(command["monitor"])
+            if monitor is None:
+                raise ValueError(f"no monitor matches {command['monitor']!r}")
+        if "text" in command:
+            self.entry.delete(0, tk.END)
+            self.entry.insert(0, command["text"])
+        if monitor is not None:
+            self.monitor_var.set(monitor.label)
+        if "corner" in command:
+            self.corner_var.set(command["corner"])
+        if "font_size" in command:
+            self.font_size_var.set(str(command["font_size"]))
+        if "padding" in command:
+            self.padding_entry.delete(0, tk.END)
+            self.padding_entry.insert(0, str(command["padding"]))
+        if "timer" in command:
+            seconds = command["timer"]
+            self.timer_enabled.set(bool(seconds))
+            if seconds:
+                self.timer_entry.delete(0, tk.END)
+                self.timer_entry.insert(0, str(seconds))
+
+        if action == "show":
+            self.show_overlay()
+        elif action == "hide":
+            if self.overlay_visible:
+                self.hide_overlay()
+        elif action == "toggle":
+            self.toggle_overlay()
+        elif action == "quit":
+            self.master.quit()
+        elif self.overlay_visible:
+            if "text" in command:
+                self.show_overlay()  # Refreshes the text and lays out again
+            else:
+                self.on_setting_change()
+            if "timer" in command:
+                self.on_timer_change()
+
+    def set_overlay_text(self, text):
+        """Replace the message (streams, watched files): shown if hidden, else relaid out in place."""
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, text)
+        if not self.overlay_visible or self.overlay is None:
+            self.show_overlay()
+            return
+        self.overlay_text = text
+        self.update_overlay_appearance()
+        self.on_timer_change()  # Restart auto-hide from the latest update
+
+    def start_file_watch(self, path, interval=DEFAULT_WATCH_POLL_SECONDS, tail_bytes=DEFAULT_WATCH_TAIL_BYTES):
+        """Mirror the end of a file in the overlay, updating whenever it changes (see FileWatcher)."""
+        self.file_watcher = FileWatcher(self.dispatcher, self.set_overlay_text, path, interval, tail_bytes)
+        self.file_watcher.start()
+        self.logger.info(f"✓ Watching {path} (last {tail_bytes} bytes)")
+
+    def start_stream(self, stream):
+        """Show lines from a LineStream, at most one per frame (see --stream).
+
+        The frame step only runs while lines are waiting: the reader thread
+        wakes the Tk side through the dispatcher, so an idle stream costs no
+        frame ticks.
+        """
+        self.stream = stream
+        self._stream_stepping = False
+        stream.wake = lambda: self.dispatcher.post(self._wake_stream)
+        stream.start()
+        self.logger.info(f"✓ Streaming overlay text from {stream.name}")
+
+    def _wake_stream(self):
+        if not self._stream_stepping:
+            self._stream_stepping = True
+            self.frames.add(self._stream_step)
+
+    def _stream_step(self, now, frames):
+        line = self.stream.take()
+        if line is not None:
+            self.set_overlay_text(line)
+        if self.stream.finished:
+            self.logger.info(f"Stream {self.stream.name} ended: {self.stream.stats()}")
+        self._stream_stepping = self.stream.pending
+        return self._stream_stepping
+
+    def apply_monitor_layout(self, monitors):
+        """Fold a new monitor probe into the registry, dropdown and visible overlay."""
+        previous_selection = self.selected_monitor()
+        previous_labels = self.monitor_registry.labels
+        diff = self.monitor_registry.update(monitors)
+        registry = self.monitor_registry
+        self.recorder.record(EVENT_MONITORS, len(registry), len(diff.added), len(diff.removed), len(diff.changed))
+        self.logger.info(
+            f"Monitor layout changed: {len(registry)} monitor(s), added={diff.added}, "
+            f"removed={diff.removed}, changed={diff.changed}"
+        )
+
+        # Only touch the dropdown's menu entries, and only if the labels changed
+        if registry.labels != previous_labels:
+            menu = self.monitor_menu["menu"]
+            menu.delete(0, "end")
+            for label in registry.labels:
+                menu.add_command(label=label, command=tk._setit(self.monitor_var, label, self.on_setting_change))
+
+        surviving = registry.by_id.get(previous_selection.id)
+        if surviving is None:
+            surviving = registry.primary
+            self.logger.warning(f"Selected monitor {previous_selection.id} disconnected, moving to {surviving.label}")
+        self.monitor_var.set(surviving.label)
+
+        if surviving != previous_selection and self.overlay_visible and (self.overlay is not None or self.ticker.running):
+            self.layout_coalescer.request()
+
+        if self.cue_player.cues:
+            self.cue_player.prepare()
+
+    def export_state(self):
+        """Settings, monitor layout and recent measurements for save_state()."""
+        return {
+            "settings": {
+                "font_size": self.font_size_var.get(),
+                "corner": self.corner_var.get(),
+                "padding": self.padding_entry.get(),
+                "timer": self.timer_entry.get(),
+                "timer_enabled": self.timer_enabled.get(),
+                "fit_enabled": self.fit_enabled.get(),
+                "fit_percent": self.fit_entry.get(),
+                "wrap": self.wrap_enabled.get(),
+                "monitor": self.selected_monitor().id,
+            },
+            "monitors": [record._asdict() for record in self.monitor_registry.records],
+            "label_inset": list(self.measure_cache.label_inset),
+            "measurements": self.measure_cache.snapshot(),
+        }
+
+    def selected_monitor(self):
+        """Return the MonitorInfo chosen in the dropdown (primary if it no longer exists)."""
+        selected_text = self.monitor_var.get()
+        monitor = self.monitor_registry.get(selected_text)
+        if selected_text not in self.monitor_registry.by_label:
+            self.logger.warning(f"No monitor matches '{selected_text}', using primary/default: {monitor}")
+        return monitor
+
     def update_overlay_appearance(self):
         """Update the overlay appearance without hiding/showing"""
         self.logger.debug("Starting update_overlay_appearance...")
@@ -466,32 +3150,7 @@ class OverlayApp:
             self.logger.debug("Skipping update: overlay not visible or None")
             return
 
-        # Find the selected monitor
-        selected_monitor = None
-        selected_text = self.monitor_var.get()
-        self.logger.debug(f"Selected monitor for positioning: '{selected_text}'")
-
-        for i, monitor in enumerate(self.monitors):
-            if hasattr(monitor, "name") and monitor.name:
-                monitor_name = f"{monitor.name} ({monitor.width}x{monitor.height})"
-            else:
-                monitor_name = f"Monitor {i+1} ({monitor.width}x{monitor.height})"
-
-            if monitor_name == selected_text:
-                selected_monitor = monitor
-                self.logger.debug(f"✓ Found positioning monitor: {monitor}")
-                break
-
-        if selected_monitor is None:
-            # Try to find the primary monitor first
-            primary_monitor = None
-            for monitor in self.monitors:
-                if hasattr(monitor, 'is_primary') and monitor.is_primary:
-                    primary_monitor = monitor
-                    break
-            
-            selected_monitor = primary_monitor if primary_monitor else self.monitors[0]
-            self.logger.warning(f"No matching monitor for positioning, using primary/default: {selected_monitor}")
+        selected_monitor = self.selected_monitor()
 
         # Get current font size
         try:
@@ -501,13 +3160,6 @@ class OverlayApp:
             font_size = 36
             self.logger.warning(f"Invalid font size, using default 36: {e}")
 
-        # Update font size
-        try:
-            self.label.config(font=("Arial", font_size, "bold"))
-            self.logger.debug("✓ Font updated")
-        except Exception as e:
-            self.logger.error(f"Failed to update font: {e}")
-
         # Get current padding value
         try:
             padding = int(self.padding_entry.get())
@@ -516,6 +3168,34 @@ class OverlayApp:
             padding = 40
             self.logger.warning(f"Invalid padding, using default 40: {e}")
 
+        # Fit mode: largest font size (and line breaks) that fits N% of the monitor width
+        display_text = self.overlay_text
+        fit_percent = self.fit_percent()
+        if fit_percent:
+            try:
+                font_size, display_text = self.measure_cache.fit(
+                    self.overlay_text, OVERLAY_FONT_FAMILY, OVERLAY_FONT_WEIGHT, padding,
+                    max_width=selected_monitor.width * fit_percent // 100,
+                    max_height=selected_monitor.height - 2 * OVERLAY_MARGIN,
+                    wrap=self.wrap_enabled.get(),
+                )
+                self.logger.debug(f"Fit to {fit_percent}% width: font size {font_size}")
+            except Exception as e:
+                self.logger.error(f"Failed to fit font size: {e}")
+
+        # Update font size; skipped when only padding/position/monitor changed
+        try:
+            font = self.font_cache.get(OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT)
+            if font is not self._label_font:
+                self.label.config(font=font)
+                self._label_font = font
+                self.logger.debug("✓ Font updated")
+            if display_text != self._label_text:
+                self.label.config(text=display_text)
+                self._label_text = display_text
+        except Exception as e:
+            self.logger.error(f"Failed to update font: {e}")
+
         # Update padding
         try:
             self.label.pack_configure(padx=padding, pady=padding)
@@ -523,47 +3203,31 @@ class OverlayApp:
         except Exception as e:
             self.logger.error(f"Failed to update padding: {e}")
 
-        # Calculate size based on text content and padding
+        # Calculate size based on text content and padding from cached font metrics
         try:
-            self.overlay.update_idletasks()  # Force update to get accurate measurements
-            self.logger.debug("✓ update_idletasks completed for size calculation")
-            
-            req_width = self.label.winfo_reqwidth() + (padding * 2)
-            req_height = self.label.winfo_reqheight() + (padding * 2)
-            self.logger.debug(f"Required size: {req_width}x{req_height} (label: {self.label.winfo_reqwidth()}x{self.label.winfo_reqheight()}, padding: {padding})")
+            if self.bitmap_cache is not None:
+                req_width, req_height = self._apply_bitmap(display_text, font_size, padding)
+            else:
+                req_width, req_height = self.measure_cache.measure(
+                    display_text, OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT, padding
+                )
+            self.logger.debug(
+                f"Required size: {req_width}x{req_height} (padding: {padding}, "
+                f"measure cache hits/misses: {self.measure_cache.hits}/{self.measure_cache.misses})"
+            )
+            self.recorder.record(EVENT_UPDATE, font_size, padding, req_width, req_height)
         except Exception as e:
             self.logger.error(f"Failed to calculate overlay size: {e}")
             return
 
         # Position overlay based on selected corner
-        margin = 20  # Margin from screen edges
         corner = self.corner_var.get()
-        self.logger.debug(f"Positioning in corner: '{corner}' with margin: {margin}")
-
-        try:
-            if corner == "Bottom Left":
-                x_pos = selected_monitor.x + margin
-                y_pos = selected_monitor.y + selected_monitor.height - req_height - margin
-            elif corner == "Bottom Right":
-                x_pos = selected_monitor.x + selected_monitor.width - req_width - margin
-                y_pos = selected_monitor.y + selected_monitor.height - req_height - margin
-            elif corner == "Top Left":
-                x_pos = selected_monitor.x + margin
-                y_pos = selected_monitor.y + margin
-            elif corner == "Top Right":
-                x_pos = selected_monitor.x + selected_monitor.width - req_width - margin
-                y_pos = selected_monitor.y + margin
-            elif corner == "Center":
-                x_pos = selected_monitor.x + (selected_monitor.width - req_width) // 2
-                y_pos = selected_monitor.y + (selected_monitor.height - req_height) // 2
-            else:  # Default to bottom left if something goes wrong
-                x_pos = selected_monitor.x + margin
-                y_pos = selected_monitor.y + selected_monitor.height - req_height - margin
-                self.logger.warning(f"Unknown corner '{corner}', using bottom left")
+        self.logger.debug(f"Positioning in corner: '{corner}' with margin: {OVERLAY_MARGIN}")
 
-            # Clamp x_pos and y_pos to stay within monitor bounds
-            x_pos = max(selected_monitor.x, min(x_pos, selected_monitor.x + selected_monitor.width - req_width))
-            y_pos = max(selected_monitor.y, min(y_pos, selected_monitor.y + selected_monitor.height - req_height))
+        try:
+            if corner not in CORNERS:
+                self.logger.warning(f"Unknown corner '{corner}', using bottom left")
+            x_pos, y_pos = overlay_position(selected_monitor, corner, req_width, req_height)
 
             self.logger.debug(f"Clamped position: ({x_pos}, {y_pos})")
             self.logger.debug(f"Monitor bounds: x={selected_monitor.x}, y={selected_monitor.y}, w={selected_monitor.width}, h={selected_monitor.height}")
@@ -572,23 +3236,68 @@ class OverlayApp:
             geometry_string = f"{req_width}x{req_height}+{x_pos}+{y_pos}"
             self.logger.debug(f"Setting geometry: {geometry_string}")
 
+            # Tk applies the geometry from its own idle handler; no synchronous
+            # update() here, it would flush the whole event queue and re-enter handlers
             self.overlay.geometry(geometry_string)
+            self.recorder.record(EVENT_GEOMETRY, req_width, req_height, x_pos, y_pos)
+            self.last_geometry = (req_width, req_height, x_pos, y_pos)
             self.logger.debug("✓ Geometry set")
 
-            # Force immediate update to ensure positioning takes effect
-            self.overlay.update()
-            self.logger.debug("✓ Overlay update completed")
-
-            # Verify final position
-            actual_x = self.overlay.winfo_x()
-            actual_y = self.overlay.winfo_y()
-            actual_width = self.overlay.winfo_width()
-            actual_height = self.overlay.winfo_height()
-            self.logger.info(f"Final overlay position: ({actual_x}, {actual_y}), size: {actual_width}x{actual_height}")
+            self.geometry_updates += 1
+            if self.verify_geometry_every and self.geometry_updates % self.verify_geometry_every == 0:
+                # Read back one frame later, once the window manager has had a chance to apply it
+                self.overlay.after(FRAME_INTERVAL_MS, self._verify_geometry, req_width, req_height, x_pos, y_pos)
 
         except Exception as e:
             self.logger.error(f"Failed to position overlay: {e}")
 
+    def fit_percent(self):
+        """Percentage of the monitor width to fit the text to, or None when fit mode is off."""
+        if not self.fit_enabled.get():
+            return None
+        try:
+            percent = int(self.fit_entry.get())
+        except ValueError:
+            return None
+        return min(percent, 100) if percent > 0 else None
+
+    def enable_bitmap_rendering(self, max_bytes=DEFAULT_BITMAP_CACHE_MB * 1024 * 1024, outline=0, shadow=0):
+        """Show overlay text as cached Pillow-rendered images instead of a live label.
+
+        Returns False (and keeps label rendering) when Pillow is not installed.
+        """
+        if Image is None:
+            self.logger.warning("Bitmap render mode needs Pillow (pip install pillow); using label rendering")
+            return False
+        self.bitmap_cache = BitmapCache(
+            PillowTextRenderer(self.master), max_bytes=max_bytes, outline=outline, shadow=shadow
+        )
+        self.logger.info(f"✓ Bitmap rendering enabled ({max_bytes // (1024 * 1024)} MB cache, outline={outline}, shadow={shadow})")
+        return True
+
+    def _apply_bitmap(self, text, font_size, padding):
+        """Put the cached image for text on the label and return the overlay size."""
+        image = self.bitmap_cache.get(text, OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT)
+        if image is not self._label_image:
+            self.label.config(image=image)
+            self._label_image = image
+        inset_x, inset_y = self.measure_cache.label_inset
+        return image.width() + 2 * (inset_x + padding), image.height() + 2 * (inset_y + padding)
+
+    def _verify_geometry(self, width, height, x_pos, y_pos):
+        """Diagnostic read-back of the overlay geometry (see --verify-geometry-every)."""
+        try:
+            if self.overlay is None or not self.overlay.winfo_ismapped():
+                return
+            actual = (self.overlay.winfo_width(), self.overlay.winfo_height(), self.overlay.winfo_x(), self.overlay.winfo_y())
+            message = f"Final overlay position: ({actual[2]}, {actual[3]}), size: {actual[0]}x{actual[1]}"
+            if actual == (width, height, x_pos, y_pos):
+                self.logger.info(message)
+            else:
+                self.logger.warning(f"{message} differs from requested {width}x{height}+{x_pos}+{y_pos}")
+        except Exception as e:
+            self.logger.error(f"Geometry verification failed: {e}")
+
     def toggle_overlay(self):
         self.logger.debug(f"Toggle overlay called, current state: {'visible' if self.overlay_visible else 'hidden'}")
         if self.overlay_visible:
@@ -598,62 +3307,31 @@ class OverlayApp:
 
     def auto_hide_overlay(self):
         """Called by timer to automatically hide overlay"""
-        self.logger.info("Auto-hide timer triggered")
+        self.hide_timer = None
+        drift = self.timers.last_drift
+        self.logger.info(f"Auto-hide timer triggered (drift {drift * 1000:.1f} ms, max {self.timers.max_drift * 1000:.1f} ms)")
+        self.recorder.record(EVENT_TIMER_FIRED, int(drift * 1_000_000))
         self.hide_overlay()
 
     def show_overlay(self):
+        if self.ticker_enabled.get():
+            self.show_ticker()
+            return
         self.logger.info("Starting show_overlay process...")
+        show_started = time.perf_counter()
         
-        # Find the selected monitor by matching the dropdown selection
-        selected_monitor = None
-        selected_text = self.monitor_var.get()
-        self.logger.debug(f"Selected monitor text: '{selected_text}'")
-
-        for i, monitor in enumerate(self.monitors):
-            if hasattr(monitor, "name") and monitor.name:
-                monitor_name = f"{monitor.name} ({monitor.width}x{monitor.height})"
-            else:
-                monitor_name = f"Monitor {i+1} ({monitor.width}x{monitor.height})"
-
-            self.logger.debug(f"Checking monitor {i}: {monitor_name}")
-            if monitor_name == selected_text:
-                selected_monitor = monitor
-                self.logger.info(f"✓ Found matching monitor: {monitor}")
-                break
-
-        if selected_monitor is None:
-            selected_monitor = self.monitors[0]
-            self.logger.warning(f"No matching monitor found, using default: {selected_monitor}")
+        selected_monitor = self.selected_monitor()
+        self.recorder.record(EVENT_SHOW, len(self.entry.get()), selected_monitor.index)
 
-        if self.overlay is None:
-            self.logger.info("Creating new overlay window...")
+        # A visible overlay is only relaid out; reveal (and fade in) only a new window
+        newly_acquired = self.overlay is None
+        if newly_acquired:
+            self.logger.info("Acquiring overlay window...")
             try:
-                self.overlay = tk.Toplevel(self.master)
-                self.logger.debug("✓ Toplevel window created")
-                
-                # Enable borderless window on all platforms
-                self.overlay.overrideredirect(True)
-                self.logger.debug("✓ Override redirect set to TRUE (borderless mode)")
-                
-                self.overlay.attributes("-topmost", True)
-                self.logger.debug("✓ Topmost attribute set")
-                
-                # Windows-specific visibility attributes
-                if platform.system() == "Windows":
-                    try:
-                        self.overlay.attributes("-alpha", 0.95)  # Slight transparency to ensure visibility
-                        self.overlay.attributes("-disabled", False)  # Ensure window is enabled
-                        self.overlay.attributes("-toolwindow", True)  # Tool window style
-                        self.logger.debug("✓ Windows-specific attributes set")
-                    except Exception as e:
-                        self.logger.warning(f"Could not set Windows attributes: {e}")
-                
-                self.overlay.configure(bg="black")
-                self.logger.debug("✓ Background color configured")
-                
-                # Hide initially until properly positioned
-                self.overlay.withdraw()
-                self.logger.debug("✓ Window initially withdrawn")
+                self.overlay, self.label = self.overlay_pool.acquire()
+                self.logger.debug(
+                    f"✓ Overlay window acquired (pool hits={self.overlay_pool.hits}, misses={self.overlay_pool.misses})"
+                )
 
                 # Get font size from user input
                 try:
@@ -665,16 +3343,14 @@ class OverlayApp:
 
                 # Create label
                 message_text = self.entry.get()
+                self.overlay_text = message_text
                 self.logger.debug(f"Message text: '{message_text}'")
                 
-                self.label = tk.Label(
-                    self.overlay, 
-                    text=message_text, 
-                    font=("Arial", font_size, "bold"), 
-                    fg="white", 
-                    bg="black"
-                )
-                self.logger.debug("✓ Label widget created")
+                self._label_font = self.font_cache.get(OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT)
+                self.label.config(text=message_text, font=self._label_font)
+                self._label_text = message_text
+                self.measure_cache.set_label_chrome(self.label)
+                self.logger.debug("✓ Label configured")
 
                 # Get padding from user input
                 try:
@@ -684,18 +3360,11 @@ class OverlayApp:
                     padding = 40  # default padding if invalid input
                     self.logger.warning(f"Invalid padding, using default 40: {e}")
 
-                self.label.pack(padx=padding, pady=padding)
-                self.logger.debug("✓ Label packed with padding")
+                self.label.pack_configure(padx=padding, pady=padding)
+                self.logger.debug("✓ Label padding set")
 
-                # Position the overlay immediately when first created
-                self.overlay.update_idletasks()
-                self.logger.debug("✓ Initial update_idletasks completed")
-                
-                self.update_overlay_appearance()
-                self.logger.debug("✓ Initial overlay appearance updated")
-                
             except Exception as e:
-                self.logger.error(f"Failed to create overlay window: {e}")
+                self.logger.error(f"Failed to prepare overlay window: {e}")
                 return
         else:
             self.logger.info("Updating existing overlay...")
@@ -703,72 +3372,31 @@ class OverlayApp:
                 # Only update the text content (not real-time)
                 new_text = self.entry.get()
                 self.label.config(text=new_text)
+                self._label_text = new_text
+                self.overlay_text = new_text
                 self.logger.debug(f"✓ Label text updated to: '{new_text}'")
             except Exception as e:
                 self.logger.error(f"Failed to update overlay text: {e}")
 
-        # Update appearance (font, padding, position) using the real-time method
+        # Lay out now (sizes come from cached font metrics), then reveal the window
+        # when Tk reports the geometry has been applied rather than after a fixed delay
         try:
-            # Force window update before positioning
-            self.overlay.update_idletasks()
-            self.logger.debug("✓ Final update_idletasks completed")
-            
-            # Small delay to ensure proper measurement, then position
-            self.master.after(10, self.update_overlay_appearance)
-            self.logger.debug("✓ Scheduled overlay appearance update")
-            
-            # Show the overlay only after it's properly positioned
-            self.master.after(20, lambda: self._show_overlay_delayed())
-            self.logger.debug("✓ Scheduled overlay display")
-            
+            self.overlay_visible = True
+            self.last_geometry = None
+            self.update_overlay_appearance()
+            if not (newly_acquired or self.reveal.pending):
+                self.logger.debug("✓ Visible overlay updated in place")
+            elif self.last_geometry is not None:
+                self.reveal.begin(self.overlay, self.last_geometry[:2], started=show_started)
+                self.logger.debug("✓ Waiting for layout to complete before revealing overlay")
+            else:
+                self._deiconify_overlay(self.overlay)
         except Exception as e:
-            self.logger.error(f"Failed to schedule overlay updates: {e}")
+            self.logger.error(f"Failed to lay out overlay: {e}")
 
-        # Make overlay click-through (Windows only)
-        if platform.system() == "Windows":
-            self.logger.info("Attempting to enable Windows click-through feature...")
-            try:
-                # Get the window handle
-                overlay_id = self.overlay.winfo_id()
-                self.logger.debug(f"Overlay winfo_id: {overlay_id}")
-                
-                hwnd = ctypes.windll.user32.GetParent(overlay_id)
-                self.logger.debug(f"GetParent result: {hwnd}")
-                
-                if hwnd:
-                    # Get current window style
-                    current_style = ctypes.windll.user32.GetWindowLongW(hwnd, -20)
-                    self.logger.debug(f"Current window style: 0x{current_style:x}")
-                    
-                    # WS_EX_LAYERED (0x80000) | WS_EX_TRANSPARENT (0x20) for full click-through
-                    new_style = current_style | 0x80000 | 0x20
-                    self.logger.debug(f"New window style (with click-through): 0x{new_style:x}")
-                    
-                    result = ctypes.windll.user32.SetWindowLongW(hwnd, -20, new_style)
-                    self.logger.debug(f"SetWindowLongW result: {result}")
-                    
-                    if result == 0:
-                        error_code = ctypes.windll.kernel32.GetLastError()
-                        self.logger.warning(f"SetWindowLongW returned 0, error code: {error_code}")
-                    else:
-                        self.logger.info("✓ Click-through feature enabled successfully")
-                        
-                        # Force window to be visible and on top
-                        ctypes.windll.user32.SetWindowPos(hwnd, -1, 0, 0, 0, 0, 0x0001 | 0x0002 | 0x0010)
-                        self.logger.debug("✓ SetWindowPos called to ensure visibility")
-                else:
-                    self.logger.warning("GetParent returned 0 (no parent window)")
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to set up Windows click-through: {e}")
-                # Continue without click-through functionality
-                    
-            except Exception as e:
-                # Click-through feature failed, but overlay still works
-                self.logger.warning(f"Click-through feature failed (overlay still functional): {e}")
-                print(f"Note: Click-through feature unavailable: {e}")
-        else:
-            self.logger.debug(f"Skipping click-through (not Windows): {platform.system()}")
+        if newly_acquired:
+            # Make overlay click-through (Windows only)
+            self._enable_click_through()
 
         self.overlay_visible = True
         self.toggle_btn.config(text="Hide Overlay", bg="orange", fg="black")
@@ -783,12 +3411,11 @@ class OverlayApp:
                 
                 if timer_seconds > 0:
                     # Cancel any existing timer
-                    if self.timer_job:
-                        self.master.after_cancel(self.timer_job)
-                        self.logger.debug("✓ Cancelled existing timer")
+                    self.timers.cancel(self.hide_timer)
                     
                     # Set new timer
-                    self.timer_job = self.master.after(timer_seconds * 1000, self.auto_hide_overlay)
+                    self.hide_timer = self.timers.schedule(timer_seconds, self.auto_hide_overlay)
+                    self.recorder.record(EVENT_TIMER_SET, timer_seconds)
                     self.logger.info(f"✓ Auto-hide timer set for {timer_seconds} seconds")
                 else:
                     self.logger.warning("Timer duration is 0 or negative, skipping timer")
@@ -799,58 +3426,218 @@ class OverlayApp:
             
         self.logger.info("show_overlay process completed")
 
-    def _show_overlay_delayed(self):
-        """Helper method for delayed overlay display with logging."""
+    def _enable_click_through(self):
+        """Let mouse clicks pass through the overlay window (Windows only)."""
+        enable_click_through(self.overlay, self.logger)
+
+    def load_cues(self, path):
+        """Load a cue list file and precompute every cue's layout."""
+        cues = load_cue_list(path)
+        # Sizes include the label's chrome; read it once from a (pooled) overlay label
+        window, label = self.overlay_pool.acquire()
+        self.measure_cache.set_label_chrome(label)
+        self.overlay_pool.release((window, label))
+        self.cue_player.load(cues)
+        self.logger.info(f"✓ Loaded {len(cues)} cue(s) from {path}")
+
+    def prepare_cue(self, cue):
+        """Resolve a cue's monitor, font, size and position ahead of time (see CuePlayer)."""
+        monitor = self.monitor_registry.find(cue.monitor)
+        if monitor is None:
+            monitor = self.monitor_registry.primary
+            self.logger.warning(f"No monitor matches cue monitor {cue.monitor!r}, using {monitor.label}")
+        font = self.font_cache.get(OVERLAY_FONT_FAMILY, cue.font_size, OVERLAY_FONT_WEIGHT)
+        image = None
+        if self.bitmap_cache is not None:
+            image = self.bitmap_cache.get(cue.text, OVERLAY_FONT_FAMILY, cue.font_size, OVERLAY_FONT_WEIGHT)
+            inset_x, inset_y = self.measure_cache.label_inset
+            width = image.width() + 2 * (inset_x + cue.padding)
+            height = image.height() + 2 * (inset_y + cue.padding)
+        else:
+            width, height = self.measure_cache.measure(
+                cue.text, OVERLAY_FONT_FAMILY, cue.font_size, OVERLAY_FONT_WEIGHT, cue.padding
+            )
+        x_pos, y_pos = overlay_position(monitor, cue.corner, width, height)
+        return PreparedCue(cue, monitor, font, (width, height, x_pos, y_pos), image)
+
+    def show_cue(self, prepared):
+        """Show a cue laid out by prepare_cue; nothing is measured or positioned here."""
+        cue = prepared.cue
+        show_started = time.perf_counter()
+        width, height, x_pos, y_pos = prepared.geometry
+        self.recorder.record(EVENT_SHOW, len(cue.text), prepared.monitor.index)
+        self.timers.cancel(self.hide_timer)
+        self.hide_timer = None
+        self.layout_coalescer.cancel()
+
         try:
-            if self.overlay:
-                # Force focus and visibility on Windows
-                if platform.system() == "Windows":
-                    try:
-                        # Additional Windows-specific visibility calls
-                        self.overlay.lift()
-                        self.overlay.focus_force()
-                        self.logger.debug("✓ Windows lift() and focus_force() called")
-                    except Exception as e:
-                        self.logger.warning(f"Windows visibility calls failed: {e}")
-                
-                self.overlay.deiconify()
-                self.logger.info("✓ Overlay window displayed (deiconify)")
-                
-                # Log final window position and size
-                self.overlay.update_idletasks()
-                x = self.overlay.winfo_x()
-                y = self.overlay.winfo_y()
-                width = self.overlay.winfo_width()
-                height = self.overlay.winfo_height()
-                self.logger.info(f"Final overlay position: ({x}, {y}), size: {width}x{height}")
-                
-                # Additional visibility check on Windows
-                if platform.system() == "Windows":
-                    try:
-                        visible = self.overlay.winfo_viewable()
-                        mapped = self.overlay.winfo_ismapped()
-                        self.logger.info(f"Window visibility check - viewable: {visible}, mapped: {mapped}")
-                    except Exception as e:
-                        self.logger.warning(f"Visibility check failed: {e}")
-            else:
-                self.logger.error("Overlay is None in _show_overlay_delayed")
+            needs_reveal = self.overlay is None
+            if needs_reveal:
+                self.overlay, self.label = self.overlay_pool.acquire()
+            if prepared.font is not self._label_font:
+                self.label.config(font=prepared.font)
+                self._label_font = prepared.font
+            self.label.config(text=cue.text)
+            self._label_text = cue.text
+            if prepared.image is not None and prepared.image is not self._label_image:
+                self.label.config(image=prepared.image)
+                self._label_image = prepared.image
+            self.label.pack_configure(padx=cue.padding, pady=cue.padding)
+            self.overlay_text = cue.text
+            self.overlay.geometry(f"{width}x{height}+{x_pos}+{y_pos}")
+            self.recorder.record(EVENT_GEOMETRY, width, height, x_pos, y_pos)
+            self.last_geometry = prepared.geometry
+            self.overlay_visible = True
+            if needs_reveal:
+                self.reveal.begin(self.overlay, (width, height), started=show_started)
+                self._enable_click_through()
+        except Exception as e:
+            self.logger.error(f"Failed to show cue '{cue.text}': {e}")
+            return
+
+        self.toggle_btn.config(text="Hide Overlay", bg="orange", fg="black")
+        if cue.duration:
+            self.hide_timer = self.timers.schedule(cue.duration, self.auto_hide_overlay)
+            self.recorder.record(EVENT_TIMER_SET, int(cue.duration))
+        self.logger.info(f"✓ Cue at {cue.at:.0f}s shown: '{cue.text}'")
+
+    def _ticker_settings(self):
+        """(font, monitor, padding, corner) for the ticker from the controller fields."""
+        try:
+            font_size = int(self.font_size_var.get())
+        except ValueError:
+            font_size = 36
+        try:
+            padding = int(self.padding_entry.get())
+        except ValueError:
+            padding = 40
+        font = self.font_cache.get(OVERLAY_FONT_FAMILY, font_size, OVERLAY_FONT_WEIGHT)
+        return font, self.selected_monitor(), padding, self.corner_var.get()
+
+    def show_ticker(self):
+        """Scroll the message along the top or bottom edge of the selected monitor (ticker mode)."""
+        text = self.entry.get()
+        selected_monitor = self.selected_monitor()
+        self.recorder.record(EVENT_SHOW, len(text), selected_monitor.index)
+
+        try:
+            self.frames.reset_stats()
+            self.ticker.start(text, *self._ticker_settings())
+            if platform.system() == "Windows":
+                self.ticker.window.lift()
+            enable_click_through(self.ticker.window, self.logger)
+        except Exception as e:
+            self.logger.error(f"Failed to start ticker: {e}")
+            return
+
+        self.overlay_visible = True
+        self.toggle_btn.config(text="Hide Overlay", bg="orange", fg="black")
+        self.logger.info(f"✓ Ticker started on {selected_monitor.label} at {self.ticker.speed} px/s")
+
+        if self.timer_enabled.get():
+            try:
+                timer_seconds = int(self.timer_entry.get())
+                if timer_seconds > 0:
+                    self.timers.cancel(self.hide_timer)
+                    self.hide_timer = self.timers.schedule(timer_seconds, self.auto_hide_overlay)
+                    self.recorder.record(EVENT_TIMER_SET, timer_seconds)
+            except ValueError as e:
+                self.logger.warning(f"Invalid timer value, skipping timer: {e}")
+
+    def _deiconify_overlay(self, window):
+        """Make a laid-out overlay visible (called by OverlayReveal)."""
+        try:
+            # Force focus and visibility on Windows
+            if platform.system() == "Windows":
+                try:
+                    # Additional Windows-specific visibility calls
+                    window.lift()
+                    window.focus_force()
+                    self.logger.debug("✓ Windows lift() and focus_force() called")
+                except Exception as e:
+                    self.logger.warning(f"Windows visibility calls failed: {e}")
+
+            if self._fade_in is not None:
+                self._fade_in.cancel()
+                self._fade_in = None
+            if self.fade_ms > 0:
+                window.attributes("-alpha", 0.0)
+            window.deiconify()
+            self.logger.debug("✓ Overlay window displayed (deiconify)")
+            if self.fade_ms > 0:
+                self._fade_in = AlphaFade(self.frames, window, 0.0, OVERLAY_ALPHA, self.fade_ms / 1000, self._on_fade_done)
+                self._fade_in.begin()
         except Exception as e:
             self.logger.error(f"Failed to display overlay: {e}")
 
+    def _on_fade_done(self, fade):
+        """Report what a finished fade cost (see AlphaFade)."""
+        direction = 1 if fade.end > fade.start else 0
+        if fade is self._fade_in:
+            self._fade_in = None
+        self.recorder.record(EVENT_FADE, direction, fade.steps, fade.dropped, int(fade.cpu_time * 1_000_000))
+        self.logger.debug(
+            f"Fade {'in' if direction else 'out'}: {fade.steps} steps, {fade.dropped} dropped, "
+            f"{fade.cpu_time * 1000:.2f} ms CPU"
+        )
+
+    def _release_overlay(self, window, label):
+        window.withdraw()
+        if self.fade_ms > 0:
+            window.attributes("-alpha", OVERLAY_ALPHA)
+        self.overlay_pool.release((window, label))
+
+    def _on_overlay_shown(self, latency, trigger):
+        """Report how long the overlay took from show request to mapped window."""
+        self.show_latencies.append(latency)
+        self.recorder.record(EVENT_REVEAL, int(latency * 1_000_000), REVEAL_TRIGGERS.index(trigger))
+        self.logger.info(
+            f"✓ Overlay shown in {latency * 1000:.1f} ms (reveal trigger: {trigger}, "
+            f"timeout fallback rate {self.reveal.timeout_rate:.0%})"
+        )
+
     def hide_overlay(self):
         self.logger.info("Hiding overlay...")
+        self.recorder.record(EVENT_HIDE)
         
         # Cancel any pending timer
-        if self.timer_job:
-            self.master.after_cancel(self.timer_job)
-            self.timer_job = None
+        if self.hide_timer is not None:
+            self.timers.cancel(self.hide_timer)
+            self.hide_timer = None
             self.logger.debug("✓ Auto-hide timer cancelled")
+        self.layout_coalescer.cancel()
+        was_revealing = self.reveal.pending
+        self.reveal.cancel()
+        fade_from = OVERLAY_ALPHA
+        if self._fade_in is not None:
+            fade_from = self._fade_in.alpha
+            self._fade_in.cancel()
+            self._fade_in = None
+
+        ticker_stopped = self.ticker.running
+        if ticker_stopped:
+            self.ticker.stop()
+            self.logger.info(f"✓ Ticker stopped: {self.frames.format_stats()}")
 
         try:
             if self.overlay:
-                self.overlay.withdraw()
-                self.logger.info("✓ Overlay window hidden (withdraw)")
-            else:
+                # Hand the window back so the next show reuses it without rebuilding
+                if self.fade_ms > 0 and not was_revealing:
+                    window, label = self.overlay, self.label
+                    AlphaFade(
+                        self.frames, window, fade_from, 0.0, self.fade_ms / 1000,
+                        lambda fade: (self._on_fade_done(fade), self._release_overlay(window, label)),
+                    ).begin()
+                    self.logger.info("✓ Overlay window fading out")
+                else:
+                    self._release_overlay(self.overlay, self.label)
+                    self.logger.info("✓ Overlay window hidden (withdraw)")
+                self.overlay = None
+                self.label = None
+                self._label_font = None
+                self._label_image = None
+                self._label_text = None
+            elif not ticker_stopped:
                 self.logger.warning("Overlay is None when trying to hide")
                 
             self.overlay_visible = False
@@ -861,16 +3648,136 @@ class OverlayApp:
             self.logger.error(f"Failed to hide overlay: {e}")
 
 
+startup_profiler.record("import", _IMPORT_STARTED, time.perf_counter() - _IMPORT_STARTED)
+
+
 if __name__ == "__main__":
     import argparse
     
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='OverlayPy - Text overlay application')
     parser.add_argument('--test', action='store_true', help='Run in test mode (exit after 3 seconds)')
+    one_shot_group = parser.add_argument_group('one-shot message', 'Options below are only valid together with --message')
+    one_shot_group.add_argument('--message', metavar='TEXT',
+                                help='Show TEXT in a single overlay without the controller window, then exit when it hides')
+    one_shot_group.add_argument('--monitor', metavar='N',
+                                help='Monitor for --message: 1-based index, name or label (default: primary)')
+    one_shot_group.add_argument('--corner', choices=CORNERS, help='Position for --message (default: Bottom Left)')
+    one_shot_group.add_argument('--font-size', type=int, help='Font size for --message (default: 36)')
+    one_shot_group.add_argument('--padding', type=int, help='Padding in pixels for --message (default: 40)')
+    one_shot_group.add_argument('--timeout', type=float, metavar='S',
+                                help='Hide the --message overlay and exit after S seconds (default: 60, 0 = stay until killed)')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging to console')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
                         default='INFO', help='Set logging level')
+    parser.add_argument('--log-mode', choices=['queued', 'sync'], default='queued',
+                        help='Write logs from a background batching thread (default) or synchronously')
+    parser.add_argument('--log-max-mb', type=float, default=DEFAULT_LOG_MAX_MB,
+                        help='Rotate the log file after this many MB (0 disables)')
+    parser.add_argument('--log-max-age-hours', type=float, default=DEFAULT_LOG_MAX_AGE_HOURS,
+                        help='Rotate the log file after this many hours (0 disables)')
+    parser.add_argument('--log-retention-mb', type=float, default=DEFAULT_LOG_RETENTION_MB,
+                        help='Delete the oldest logs once the logs directory exceeds this many MB (0 disables)')
+    parser.add_argument('--log-retention-days', type=float, default=DEFAULT_LOG_RETENTION_DAYS,
+                        help='Delete logs older than this many days (0 disables)')
+    parser.add_argument('--flight-recorder-size', type=int, default=DEFAULT_FLIGHT_RECORDER_SIZE,
+                        help='Number of overlay events kept in memory for post-mortem dumps')
+    parser.add_argument('--monitor-poll-seconds', type=float, default=DEFAULT_MONITOR_POLL_SECONDS,
+                        help='How often to check for monitors being connected/disconnected (0 disables)')
+    parser.add_argument('--verify-geometry-every', type=int, default=0, metavar='N',
+                        help='Read back and log the overlay geometry every N layout passes (0 = never)')
+    parser.add_argument('--overlay-pool-size', type=int, default=DEFAULT_OVERLAY_POOL_SIZE,
+                        help='Number of overlay windows pre-built in idle time after startup')
+    parser.add_argument('--reveal-timeout-ms', type=int, default=DEFAULT_REVEAL_TIMEOUT_MS,
+                        help='Show the overlay after this long even if the window manager never confirms its layout')
+    parser.add_argument('--render-mode', choices=['label', 'bitmap'], default='label',
+                        help='Draw overlay text live on a Tk label (default) or as cached Pillow-rendered images')
+    parser.add_argument('--bitmap-cache-mb', type=float, default=DEFAULT_BITMAP_CACHE_MB,
+                        help='Memory budget for pre-rendered overlay images in bitmap mode')
+    parser.add_argument('--text-outline', type=int, default=0, metavar='PX',
+                        help='Outline width around overlay text (bitmap mode)')
+    parser.add_argument('--text-shadow', type=int, default=0, metavar='PX',
+                        help='Drop shadow offset for overlay text (bitmap mode)')
+    parser.add_argument('--frame-rate', type=int, default=DEFAULT_FRAME_RATE, metavar='FPS',
+                        help='Target frame rate for animations such as the ticker')
+    parser.add_argument('--fade-ms', type=int, default=DEFAULT_FADE_MS, metavar='MS',
+                        help='Fade overlays in and out over this many milliseconds (0 disables)')
+    parser.add_argument('--ticker-speed', type=float, default=DEFAULT_TICKER_SPEED, metavar='PX',
+                        help='Ticker scroll speed in pixels per second')
+    parser.add_argument('--control', metavar='ADDRESS',
+                        help='Accept JSON commands on a Unix socket path, or PORT / HOST:PORT on loopback TCP')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Stay resident with the controller hidden and take commands on the control address '
+                             '(--control, default: per-user socket); see overlay_client.py')
+    parser.add_argument('--stream', nargs='?', const='-', metavar='PATH',
+                        help='Show each line read from stdin (default) or a FIFO/file; only the newest line per frame is drawn')
+    parser.add_argument('--watch', metavar='FILE',
+                        help='Mirror the end of FILE in the overlay, updating whenever it changes')
+    parser.add_argument('--watch-interval', type=float, default=DEFAULT_WATCH_POLL_SECONDS, metavar='S',
+                        help='How often to stat() the watched file when inotify is unavailable')
+    parser.add_argument('--watch-tail-bytes', type=int, default=DEFAULT_WATCH_TAIL_BYTES, metavar='N',
+                        help='Show at most the last N bytes of the watched file')
+    parser.add_argument('--state-file', default=DEFAULT_STATE_FILE, metavar='PATH',
+                        help='Where settings, the monitor layout and text measurements are kept between runs')
+    parser.add_argument('--no-state', action='store_true',
+                        help='Start from the built-in defaults and do not save state on exit')
+    parser.add_argument('--cues', metavar='FILE',
+                        help='Play a JSON cue list: each cue is shown at its time offset from startup')
+    parser.add_argument('--startup-diagnostics', choices=['background', 'sync', 'off'], default='background',
+                        help='When to log system/monitor diagnostics: after first paint on a background thread '
+                             '(default), synchronously before the window, or never')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Print a time-to-first-window breakdown once the controller is painted')
     args = parser.parse_args()
+    one_shot_options = {'monitor': None, 'corner': 'Bottom Left', 'font_size': 36, 'padding': 40, 'timeout': 60}
+    if args.message is None:
+        given = [f"--{name.replace('_', '-')}" for name in one_shot_options if getattr(args, name) is not None]
+        if given:
+            parser.error(f"{', '.join(given)} can only be used with --message")
+    for name, default in one_shot_options.items():
+        if getattr(args, name) is None:
+            setattr(args, name, default)
+
+    # Only the daemon, --control and --message use the control socket; a plain
+    # GUI start never touches the per-user runtime directory
+    control_address = None
+    if args.message is not None or args.daemon or args.control:
+        try:
+            control_address = parse_control_address(args.control) if args.control else default_address()
+        except ValueError as e:
+            parser.error(f"invalid --control address: {e}")
+        except OSError as e:
+            if args.message is None:
+                parser.error(f"cannot use the control address: {e}")
+            print(f"Not forwarding to a daemon ({e}); showing the message directly", file=sys.stderr)
+    if control_address is not None and (args.message is not None or args.daemon):
+        # A resident daemon already has Tk and the monitors up: hand it the message and exit
+        try:
+            if args.daemon:
+                reply = send_control_command({"cmd": "status"}, control_address)
+                print(f"OverlayPy daemon already running at {control_address[1]}")
+            else:
+                monitor = int(args.monitor) if args.monitor and args.monitor.isdigit() else args.monitor
+                command = {"cmd": "show", "text": args.message.replace("\\n", "\n"), "corner": args.corner,
+                           "font_size": args.font_size, "padding": args.padding, "timer": math.ceil(args.timeout)}
+                if monitor is not None:
+                    command["monitor"] = monitor
+                reply = send_control_command(command, control_address)
+                print(json.dumps(reply))
+            sys.exit(0 if reply.get("ok") else 1)
+        except OSError:
+            pass  # No daemon listening; start normally
+    
+    flight_recorder = FlightRecorder(args.flight_recorder_size)
+
+    with startup_profiler.phase("logging"):
+        setup_logging(
+            queued=args.log_mode == "queued",
+            max_bytes=int(args.log_max_mb * 1024 * 1024),
+            max_age=args.log_max_age_hours * 3600,
+            retention_bytes=int(args.log_retention_mb * 1024 * 1024),
+            retention_age=args.log_retention_days * 86400,
+        )
     
     # Adjust logging level if requested
     if args.debug:
@@ -880,46 +3787,120 @@ if __name__ == "__main__":
     
     logger.info(f"Starting OverlayPy with arguments: {vars(args)}")
     
+    if args.startup_diagnostics == "sync":
+        with startup_profiler.phase("diagnostics"):
+            log_startup_diagnostics()
+    
     try:
         logger.info("Creating Tkinter root window...")
-        root = tk.Tk()
+        with startup_profiler.phase("tk init"):
+            root = tk.Tk()
         logger.info("✓ Tkinter root window created")
+        install_crash_dumps(root, flight_recorder)
         
-        # Test mode setup
-        if args.test:
-            logger.info("Running in TEST MODE - will exit after 3 seconds")
-            root.title("OverlayPy - TEST MODE")
+        app = None
+        if args.message is not None:
+            # One-shot: no controller, no monitor watcher, no background diagnostics
+            root.withdraw()
+
+            def on_one_shot_shown():
+                startup_profiler.mark_first_window()
+                if args.profile_startup:
+                    report = startup_profiler.report()
+                    logger.info(report)
+                    print(report)
+
+            monitor = int(args.monitor) if args.monitor and args.monitor.isdigit() else args.monitor
+            one_shot = OneShotOverlay(root, on_shown=on_one_shot_shown)
+            with startup_profiler.phase("overlay build"):
+                one_shot.show(
+                    args.message.replace("\\n", "\n"), monitor=monitor, corner=args.corner,
+                    font_size=args.font_size, padding=args.padding, timeout=args.timeout,
+                )
+        else:
+            # Test mode setup
+            if args.test:
+                logger.info("Running in TEST MODE - will exit after 3 seconds")
+                root.title("OverlayPy - TEST MODE")
             
-        logger.info("Initializing OverlayApp...")
-        app = OverlayApp(root)
-        logger.info("✓ OverlayApp initialized successfully")
+            state = {}
+            if not args.no_state:
+                with startup_profiler.phase("state load"):
+                    state = load_state(args.state_file)
+            logger.info("Initializing OverlayApp...")
+            with startup_profiler.phase("controller build"):
+                app = OverlayApp(root, state=state)
+            logger.info("✓ OverlayApp initialized successfully")
+            app.verify_geometry_every = max(0, args.verify_geometry_every)
+            app.overlay_pool.size = max(0, args.overlay_pool_size)
+            app.reveal.timeout_ms = max(1, args.reveal_timeout_ms)
+            app.start_monitor_watcher(args.monitor_poll_seconds)
+            app.frames.fps = max(1, args.frame_rate)
+            app.ticker.speed = args.ticker_speed
+            app.fade_ms = max(0, args.fade_ms)
+            if args.render_mode == "bitmap":
+                app.enable_bitmap_rendering(
+                    max_bytes=int(args.bitmap_cache_mb * 1024 * 1024),
+                    outline=max(0, args.text_outline),
+                    shadow=max(0, args.text_shadow),
+                )
+            if args.cues:
+                app.load_cues(args.cues)
+            if args.daemon:
+                root.withdraw()
+                logger.info("Daemon mode: controller hidden, waiting for commands")
+            if args.control or args.daemon:
+                app.start_control_server(control_address)
+            if args.stream:
+                app.start_stream(open_line_stream(args.stream))
+            if args.watch:
+                app.start_file_watch(args.watch, max(0.05, args.watch_interval), max(1, args.watch_tail_bytes))
         
-        if args.test:
-            # In test mode, show the overlay briefly then exit
-            def test_sequence():
-                logger.info("TEST: Starting test sequence...")
-                try:
-                    app.entry.delete(0, tk.END)
-                    app.entry.insert(0, "TEST OVERLAY")
-                    logger.info("TEST: Set test message")
+            if args.test:
+                # In test mode, show the overlay briefly then exit
+                def test_sequence():
+                    logger.info("TEST: Starting test sequence...")
+                    try:
+                        app.entry.delete(0, tk.END)
+                        app.entry.insert(0, "TEST OVERLAY")
+                        logger.info("TEST: Set test message")
                     
-                    app.show_overlay()
-                    logger.info("TEST: Overlay shown")
+                        app.show_overlay()
+                        logger.info("TEST: Overlay shown")
                     
-                    # Wait 2 seconds then hide and exit
-                    root.after(2000, lambda: [
-                        logger.info("TEST: Hiding overlay"),
-                        app.hide_overlay(),
-                        logger.info("TEST: Test completed successfully"),
+                        # Wait 2 seconds then hide and exit
+                        root.after(2000, lambda: [
+                            logger.info("TEST: Hiding overlay"),
+                            app.hide_overlay(),
+                            logger.info("TEST: Test completed successfully"),
+                            root.quit()
+                        ])
+                    except Exception as e:
+                        logger.error(f"TEST: Test sequence failed: {e}")
                         root.quit()
-                    ])
-                except Exception as e:
-                    logger.error(f"TEST: Test sequence failed: {e}")
-                    root.quit()
             
-            # Start test sequence after UI is ready
-            root.after(500, test_sequence)
+                # Start test sequence after UI is ready
+                root.after(500, test_sequence)
         
+            # Idle callbacks run after Tk has mapped and drawn the controller, so the
+            # first one doubles as the "first paint" signal for deferred startup work.
+            mainloop_entered = time.perf_counter()
+
+            def on_first_paint():
+                startup_profiler.record("mainloop entry", mainloop_entered, time.perf_counter() - mainloop_entered)
+                startup_profiler.mark_first_window()
+                app.overlay_pool.warm()
+                if args.cues:
+                    app.cue_player.start()
+                if args.startup_diagnostics == "background":
+                    start_background_diagnostics()
+                if args.profile_startup:
+                    report = startup_profiler.report()
+                    logger.info(report)
+                    print(report)
+
+            root.after_idle(on_first_paint)
+
         logger.info("Starting main event loop...")
         root.mainloop()
         logger.info("Main event loop ended")
@@ -927,8 +3908,11 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Fatal error in main: {e}")
         logger.error(f"Exception type: {type(e).__name__}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
+        try:
+            flight_recorder.dump(reason=f"fatal {type(e).__name__}")
+        except Exception as dump_error:
+            logger.error(f"Flight recorder dump failed: {dump_error}")
         
         # Try to show a simple error dialog
         try:
@@ -938,6 +3922,23 @@ if __name__ == "__main__":
         except:
             print(f"FATAL ERROR: {e}")
             
+        shutdown_logging()
         sys.exit(1)
     
+    if app is not None and not args.no_state:
+        try:
+            save_state(args.state_file, app.export_state())
+            logger.info(f"✓ State saved to {args.state_file}")
+        except (OSError, tk.TclError) as e:
+            logger.warning(f"Could not save state to {args.state_file}: {e}")
+    if app is not None and app.control_server is not None:
+        app.control_server.stop()
+        logger.info(f"Control server stats: {app.control_server.stats()}")
+    if app is not None and app.stream is not None:
+        logger.info(f"Stream stats: {app.stream.stats()}")
+    if app is not None and app.file_watcher is not None:
+        app.file_watcher.stop()
+        logger.info(f"File watcher stats: {app.file_watcher.stats()}")
     logger.info("OverlayPy shutdown complete")
+    # master.quit only ends mainloop; drain the queued writer before the interpreter exits
+    shutdown_logging()
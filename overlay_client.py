@@ -0,0 +1,144 @@
+"""Thin client for a running OverlayPy daemon (``python overlay.py --daemon``).
+
+Only the standard library's socket/json are imported - no tkinter, no
+screeninfo - so a show request costs an interpreter start and one local
+round trip. The daemon replies as soon as the command is queued.
+
+    python overlay_client.py show "Build passed" --corner "Top Right" --timeout 10
+    python overlay_client.py hide
+    python overlay_client.py status
+"""
+
+import argparse
+import getpass
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import zlib
+
+DEFAULT_CONTROL_PORT = 47653  # Base of the loopback ports used where Unix sockets are unavailable (Windows)
+CONTROL_PORT_RANGE = 1000  # Each user gets DEFAULT_CONTROL_PORT + a hash of their name within this range
+CONNECT_TIMEOUT = 2.0
+
+
+def runtime_dir():
+    """A directory only this user can write to: $XDG_RUNTIME_DIR, else a 0700 one in the temp dir.
+
+    Raises PermissionError if the temp dir entry exists but is not a private
+    directory owned by this user (e.g. created first by someone else).
+    """
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg and os.path.isdir(xdg):
+        return xdg
+    path = os.path.join(tempfile.gettempdir(), f"overlaypy-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} is not a private directory owned by this user")
+    return path
+
+
+def default_address():
+    """The per-user daemon address: a Unix socket in runtime_dir(), or loopback TCP on Windows.
+
+    Loopback ports are not private: the per-user port only keeps users from
+    colliding by accident, and any local process can connect to it.
+    """
+    if os.name != "nt" and hasattr(socket, "AF_UNIX"):
+        return "unix", os.path.join(runtime_dir(), "overlaypy.sock")
+    port = DEFAULT_CONTROL_PORT + zlib.crc32(getpass.getuser().encode("utf-8")) % CONTROL_PORT_RANGE
+    return "tcp", ("127.0.0.1", port)
+
+
+def parse_control_address(value):
+    """Parse --control: "PORT" or "HOST:PORT" (loopback only) for TCP, anything else is a Unix socket path."""
+    host, _, port = value.rpartition(":")
+    if port.isdigit() and "/" not in value and "\\" not in value:
+        host = host.strip("[]") or "127.0.0.1"
+        if host not in ("127.0.0.1", "localhost", "::1"):
+            raise ValueError(f"Control server only listens on loopback, not {host}")
+        return "tcp", (host, int(port))
+    return "unix", value
+
+
+def connect(address, timeout=CONNECT_TIMEOUT):
+    family, target = address
+    if family == "tcp":
+        return socket.create_connection(target, timeout=timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(target)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def send(payload, address=None, timeout=CONNECT_TIMEOUT):
+    """Send one command (dict) or a batch (list) and return the daemon's decoded reply.
+
+    Raises OSError when no daemon is listening at address.
+    """
+    with connect(address or default_address(), timeout) as sock:
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection without replying")
+    return json.loads(line)
+
+
+def build_command(args):
+    command = {"cmd": args.cmd}
+    if args.cmd == "show":
+        command["text"] = args.text
+        for field in ("monitor", "corner", "font_size", "padding"):
+            value = getattr(args, field)
+            if value is not None:
+                command[field] = value
+        if args.timeout is not None:
+            command["timer"] = args.timeout
+    return command
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send a command to a running OverlayPy daemon")
+    parser.add_argument("--control", metavar="ADDRESS",
+                        help="Daemon address: Unix socket path or loopback PORT / HOST:PORT (default: per-user socket)")
+    commands = parser.add_subparsers(dest="cmd", required=True)
+    show = commands.add_parser("show", help="Show (or replace) the overlay text")
+    show.add_argument("text")
+    show.add_argument("--monitor", type=lambda v: int(v) if v.isdigit() else v,
+                      help="1-based index, name or label")
+    show.add_argument("--corner")
+    show.add_argument("--font-size", type=int)
+    show.add_argument("--padding", type=int)
+    show.add_argument("--timeout", type=float, help="Auto-hide after this many seconds, rounded up (0 disables)")
+    for name, help_text in (("hide", "Hide the overlay"), ("toggle", "Show or hide the overlay"),
+                            ("status", "Print the daemon's command counters"), ("quit", "Stop the daemon")):
+        commands.add_parser(name, help=help_text)
+    args = parser.parse_args(argv)
+
+    try:
+        address = parse_control_address(args.control) if args.control else default_address()
+    except (OSError, ValueError) as e:
+        print(f"Cannot determine the daemon address: {e}", file=sys.stderr)
+        return 2
+    try:
+        reply = send(build_command(args), address)
+    except OSError as e:
+        print(f"No OverlayPy daemon at {address[1]}: {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(reply))
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
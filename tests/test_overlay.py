@@ -1,7 +1,7 @@
 """Basic tests for OverlayPy application."""
 
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 import sys
 import os
 
@@ -9,12 +9,41 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
+    import overlay_client  # Standard library only: importable even where tkinter is not
     import overlay
 except ImportError:
     # If tkinter is not available (like in CI), we'll skip the tests
     overlay = None
 
 
+class FakeScheduler:
+    """Stand-in for a Tk root's after/after_idle/after_cancel that runs jobs on demand."""
+
+    def __init__(self):
+        self.jobs = {}
+        self._next_id = 0
+
+    def after(self, ms, func=None, *args):
+        self._next_id += 1
+        job_id = f"after#{self._next_id}"
+        self.jobs[job_id] = (ms, func, args)
+        return job_id
+
+    def after_idle(self, func, *args):
+        return self.after("idle", func, *args)
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def run_pending(self):
+        """Run the queued jobs once each, idle jobs first, then timers by delay."""
+        jobs, self.jobs = self.jobs, {}
+        ordered = sorted(jobs.values(), key=lambda job: (job[0] != "idle", 0 if job[0] == "idle" else job[0]))
+        for _, func, args in ordered:
+            func(*args)
+        return len(jobs)
+
+
 class TestOverlayApp(unittest.TestCase):
     """Test cases for OverlayApp class."""
 
@@ -91,5 +120,1401 @@ class TestApplicationConfiguration(unittest.TestCase):
         self.assertGreater(int(default_timer), 0)
 
 
+class TestStartupProfiler(unittest.TestCase):
+    """Test lazy startup and the --profile-startup report."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_import_installs_no_file_logging(self):
+        """Importing the module must not open log files or probe monitors."""
+        import logging
+        log_files = [
+            h.baseFilename for h in logging.getLogger().handlers
+            if isinstance(h, logging.FileHandler) and "overlaypy_" in h.baseFilename
+        ]
+        self.assertEqual(log_files, [])
+
+    def test_report_orders_and_indents_phases(self):
+        profiler = overlay.StartupProfiler(origin=0.0)
+        with profiler.phase("controller build"):
+            with profiler.phase("monitor probe"):
+                pass
+        profiler.record("import", -1.0, 0.25)
+        profiler.mark_first_window()
+
+        lines = profiler.report().splitlines()
+        self.assertIn("import", lines[1])
+        self.assertIn("controller build", lines[2])
+        self.assertIn("    monitor probe", lines[3])
+        self.assertIn("time to first window", lines[-1])
+
+
+class TestQueuedLogging(unittest.TestCase):
+    """Test the batching background log writer."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_listener_batches_flushes_and_drains_on_stop(self):
+        import io
+        import logging
+        import logging.handlers
+        import queue
+
+        class CountingStream(io.StringIO):
+            flushes = 0
+
+            def flush(self):
+                CountingStream.flushes += 1
+
+        record_queue = queue.SimpleQueue()
+        handler = overlay.BatchStreamHandler(CountingStream())
+        listener = overlay.BatchingQueueListener(record_queue, handler)
+        test_logger = logging.getLogger("overlay.tests.queued")
+        test_logger.propagate = False
+        test_logger.setLevel(logging.DEBUG)
+        queue_handler = logging.handlers.QueueHandler(record_queue)
+        test_logger.addHandler(queue_handler)
+        try:
+            listener.start()
+            for i in range(500):
+                test_logger.debug("record %d", i)
+            listener.stop()
+        finally:
+            test_logger.removeHandler(queue_handler)
+
+        self.assertEqual(handler.stream.getvalue().count("\n"), 500)
+        self.assertLess(CountingStream.flushes, 500)
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Test the handlers installed by setup_logging()."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        import logging
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers = []
+
+        def restore():
+            overlay.shutdown_logging()
+            for handler in root.handlers:
+                handler.close()
+            root.handlers = saved_handlers
+            root.setLevel(saved_level)
+        self.addCleanup(restore)
+
+    def _log_lines(self):
+        [name] = [n for n in os.listdir(self.tmp.name) if n.endswith(".log")]
+        with open(os.path.join(self.tmp.name, name), encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_queued_record_is_formatted_once(self):
+        import logging
+        with patch.object(overlay, "LOG_DIR", self.tmp.name):
+            overlay.setup_logging(queued=True)
+        logging.getLogger("overlay.tests.setup").info("hello")
+        overlay.shutdown_logging()
+
+        [line] = [line for line in self._log_lines() if "overlay.tests.setup" in line]
+        self.assertRegex(line, r"^\S+ \S+ - overlay\.tests\.setup - INFO - test_queued_record_is_formatted_once:\d+ - hello$")
+
+    def test_startup_maintenance_keeps_live_log_with_relative_log_dir(self):
+        import logging
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        threads = []
+        real_start = overlay.start_log_maintenance
+
+        def start(*args, **kwargs):
+            threads.append(real_start(*args, **kwargs))
+            return threads[-1]
+
+        self.assertFalse(os.path.isabs(overlay.LOG_DIR))
+        with patch.object(overlay, "start_log_maintenance", side_effect=start):
+            overlay.setup_logging(queued=True)
+        for thread in threads:
+            thread.join(5)
+        logging.getLogger("overlay.tests.setup").info("after maintenance")
+        overlay.shutdown_logging()
+
+        log_dir = os.path.join(self.tmp.name, overlay.LOG_DIR)
+        names = os.listdir(log_dir)
+        self.assertEqual([n for n in names if n.endswith(".gz")], [])
+        [name] = [n for n in names if n.endswith(".log")]
+        with open(os.path.join(log_dir, name), encoding="utf-8") as f:
+            self.assertIn("after maintenance", f.read())
+
+
+class TestLogRetention(unittest.TestCase):
+    """Test log rotation, compression and retention."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _write_log(self, name, size, age=0):
+        import time
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_maintenance_compresses_and_keeps_active_file(self):
+        active = self._write_log("overlaypy_20240102_000000.log", 100)
+        old = self._write_log("overlaypy_20240101_000000.log", 100, age=3600)
+        recent = self._write_log("overlaypy_20240103_000000.log", 100, age=60)
+        segment = self._write_log("overlaypy_20240102_000000.1.log", 100)
+        overlay.run_log_maintenance(self.tmp.name, active=active)
+
+        self.assertTrue(os.path.exists(active))
+        self.assertTrue(os.path.exists(recent))
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(old + ".gz"))
+        self.assertTrue(os.path.exists(segment + ".gz"))
+
+    @unittest.skipIf(overlay is None or overlay.fcntl is None, "needs POSIX file locks")
+    def test_maintenance_skips_log_held_by_another_handler(self):
+        import logging
+        held = self._write_log("overlaypy_20240101_000000.log", 100)
+        handler = overlay.RetentionFileHandler(held, encoding="utf-8")
+        self.addCleanup(handler.close)
+        handler.handle(logging.makeLogRecord({"msg": "live", "levelno": logging.INFO}))
+        os.utime(held, (0, 0))
+
+        overlay.run_log_maintenance(self.tmp.name)
+        removed = overlay.prune_logs(self.tmp.name, retention_bytes=1, retention_age=60)
+
+        self.assertTrue(os.path.exists(held))
+        self.assertFalse(os.path.exists(held + ".gz"))
+        self.assertEqual(removed, [])
+
+    def test_prune_removes_oldest_until_under_budget(self):
+        active = self._write_log("overlaypy_active.log", 1000)
+        oldest = self._write_log("overlaypy_a.log.gz", 1000, age=300)
+        middle = self._write_log("overlaypy_b.log.gz", 1000, age=200)
+        expired = self._write_log("overlaypy_c.log.gz", 10, age=10 * 86400)
+        unrelated = self._write_log("notes.txt", 5000, age=300)
+
+        removed = overlay.prune_logs(self.tmp.name, retention_bytes=2500, retention_age=86400, active=active)
+
+        self.assertEqual(set(removed), {oldest, expired})
+        self.assertTrue(os.path.exists(middle))
+        self.assertTrue(os.path.exists(unrelated))
+
+    def test_handler_rotates_by_size(self):
+        import logging
+        path = os.path.join(self.tmp.name, "overlaypy_rotating.log")
+        handler = overlay.RetentionFileHandler(path, max_bytes=200, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            for i in range(20):
+                handler.handle(logging.makeLogRecord({"msg": "x" * 40, "levelno": logging.INFO}))
+        finally:
+            handler.close()
+
+        self.assertGreater(handler.segment, 0)
+        self.assertLessEqual(os.path.getsize(path), 200)
+
+
+class TestFlightRecorder(unittest.TestCase):
+    """Test the in-memory overlay event ring buffer."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_ring_buffer_keeps_most_recent_events(self):
+        recorder = overlay.FlightRecorder(capacity=3)
+        for x in range(5):
+            recorder.record(overlay.EVENT_GEOMETRY, 100, 50, x, 0)
+
+        events = recorder.events()
+        self.assertEqual(len(recorder), 3)
+        self.assertEqual([values[2] for _, _, values in events], [2, 3, 4])
+        self.assertTrue(all(kind == overlay.EVENT_GEOMETRY for _, kind, _ in events))
+
+    def test_dump_writes_named_fields(self):
+        import tempfile
+        recorder = overlay.FlightRecorder(capacity=8)
+        recorder.record(overlay.EVENT_GEOMETRY, 300, 120, 20, 940)
+        recorder.record(overlay.EVENT_HIDE)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = recorder.dump(reason="test", directory=tmp)
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+
+        self.assertIn("(test)", content)
+        self.assertIn("geometry", content)
+        self.assertIn("width=300 height=120 x=20 y=940", content)
+        self.assertIn("hide", content)
+
+
+class TestFrameCoalescer(unittest.TestCase):
+    """Test coalescing of setting changes into one layout pass per frame."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_burst_is_merged_into_one_idle_pass(self):
+        master = FakeScheduler()
+        calls = []
+        coalescer = overlay.FrameCoalescer(master, lambda: calls.append(1))
+        for _ in range(25):
+            coalescer.request()
+
+        self.assertEqual(len(master.jobs), 1)
+        self.assertEqual(list(master.jobs.values())[0][0], "idle")
+        master.run_pending()
+        self.assertEqual(calls, [1])
+        self.assertEqual((coalescer.requests, coalescer.runs, coalescer.merged), (25, 1, 24))
+
+    def test_request_within_a_frame_waits_for_next_frame(self):
+        master = FakeScheduler()
+        coalescer = overlay.FrameCoalescer(master, lambda: None, frame_ms=1000)
+        coalescer.request()
+        master.run_pending()
+        coalescer.request()
+
+        delay = list(master.jobs.values())[0][0]
+        self.assertIsInstance(delay, int)
+        self.assertGreater(delay, 0)
+
+    def test_cancel_drops_pending_pass(self):
+        master = FakeScheduler()
+        calls = []
+        coalescer = overlay.FrameCoalescer(master, lambda: calls.append(1))
+        coalescer.request()
+        coalescer.cancel()
+
+        self.assertFalse(coalescer.pending)
+        self.assertEqual(master.run_pending(), 0)
+        self.assertEqual(calls, [])
+
+
+class FakeFont:
+    """Monospace stand-in for tkinter.font.Font: each character is size/2 px wide."""
+
+    created = 0
+
+    def __init__(self, family, size, weight):
+        FakeFont.created += 1
+        self.size = size
+
+    def measure(self, text):
+        return len(text) * self.size // 2
+
+    def metrics(self, option):
+        return {"linespace": self.size + 4}[option]
+
+
+class TestTextMeasureCache(unittest.TestCase):
+    """Test overlay sizing from cached font metrics."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_size_includes_label_inset_and_padding(self):
+        cache = overlay.TextMeasureCache(FakeFont)
+        cache.label_inset = (2, 3)
+
+        self.assertEqual(cache.measure("Hello", "Arial", 20, "bold", 10), (50 + 2 * 12, 24 + 2 * 13))
+        self.assertEqual(cache.measure("ab\nabcd", "Arial", 20, "bold", 0), (40 + 4, 2 * 24 + 6))
+
+    def test_repeated_measure_is_a_cache_hit(self):
+        cache = overlay.TextMeasureCache(FakeFont)
+        for size in (36, 48, 36, 48):
+            cache.measure("Doors open", "Arial", size, "bold", 40)
+
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_lru_eviction(self):
+        cache = overlay.TextMeasureCache(FakeFont, max_entries=2)
+        cache.measure("a", "Arial", 12, "bold", 0)
+        cache.measure("b", "Arial", 12, "bold", 0)
+        cache.measure("a", "Arial", 12, "bold", 0)
+        cache.measure("c", "Arial", 12, "bold", 0)  # evicts "b", the least recently used
+        cache.measure("a", "Arial", 12, "bold", 0)
+        cache.measure("b", "Arial", 12, "bold", 0)
+
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+
+def make_monitor(name, x, y, width=1920, height=1080, is_primary=False):
+    monitor = Mock()
+    monitor.name = name
+    monitor.x, monitor.y = x, y
+    monitor.width, monitor.height = width, height
+    monitor.is_primary = is_primary
+    return monitor
+
+
+class TestMonitorRegistry(unittest.TestCase):
+    """Test the precomputed monitor index."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_labels_ids_and_primary(self):
+        registry = overlay.MonitorRegistry([
+            make_monitor("DP-1", 0, 0),
+            make_monitor(None, 1920, 0, 2560, 1440, is_primary=True),
+        ])
+
+        self.assertEqual(registry.labels, ["DP-1 (1920x1080)", "Monitor 2 (2560x1440)"])
+        self.assertEqual(registry.primary.label, "Monitor 2 (2560x1440)")
+        self.assertEqual(registry.by_id["DP-1"].index, 0)
+        self.assertEqual(registry.by_id["monitor@1920,0"].width, 2560)
+
+    def test_unknown_label_falls_back_to_primary(self):
+        registry = overlay.MonitorRegistry([make_monitor("A", 0, 0), make_monitor("B", 1920, 0)])
+
+        self.assertEqual(registry.get("B (1920x1080)").name, "B")
+        self.assertIs(registry.get("Gone (800x600)"), registry.records[0])
+
+    def test_identical_labels_stay_selectable(self):
+        registry = overlay.MonitorRegistry([make_monitor("DELL", 0, 0), make_monitor("DELL", 1920, 0)])
+
+        self.assertEqual(registry.labels, ["DELL (1920x1080)", "DELL (1920x1080) #2"])
+        self.assertEqual(registry.get("DELL (1920x1080) #2").x, 1920)
+
+    @patch('overlay.get_monitors', side_effect=RuntimeError("no display"))
+    def test_probe_falls_back_when_detection_fails(self, _):
+        registry = overlay.MonitorRegistry(overlay.probe_monitors())
+
+        self.assertEqual(registry.labels, ["Fallback Monitor (1920x1080)"])
+        self.assertTrue(registry.primary.is_primary)
+
+
+class TestMonitorHotplug(unittest.TestCase):
+    """Test monitor layout diffing and the background watcher."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_update_reports_added_removed_and_changed(self):
+        registry = overlay.MonitorRegistry([make_monitor("LAPTOP", 0, 0, is_primary=True), make_monitor("DOCK", 1920, 0)])
+        diff = registry.update([
+            make_monitor("LAPTOP", 0, 0, 2560, 1600, is_primary=True),
+            make_monitor("TV", -3840, 0, 3840, 2160),
+        ])
+
+        self.assertEqual(diff, overlay.MonitorDiff(added=["TV"], removed=["DOCK"], changed=["LAPTOP"]))
+        self.assertNotIn("DOCK (1920x1080)", registry.by_label)
+
+    def test_watcher_posts_only_real_changes(self):
+        layouts = [[make_monitor("A", 0, 0)], [make_monitor("A", 0, 0)], [make_monitor("A", 0, 0), make_monitor("B", 1920, 0)]]
+        dispatcher = overlay.TkDispatcher(FakeScheduler())
+        changes = []
+        registry = overlay.MonitorRegistry(layouts[0])
+        watcher = overlay.MonitorWatcher(dispatcher, changes.append, registry.records, probe=lambda: layouts.pop(0))
+
+        results = [watcher.poll() for _ in range(3)]
+        dispatcher.drain()
+
+        self.assertEqual(results, [False, False, True])
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(len(changes[0]), 2)
+
+    def test_dispatcher_ticks_only_while_work_is_queued(self):
+        master = FakeScheduler()
+        dispatcher = overlay.TkDispatcher(master)
+        dispatcher.start()
+        self.assertEqual(master.run_pending(), 1)  # The start-up idle tick
+        self.assertEqual(master.jobs, {})
+
+        ran = []
+        dispatcher.post(ran.append, 1)
+        dispatcher.post(ran.append, 2)
+        self.assertEqual(len(master.jobs), 1)
+        master.run_pending()
+        self.assertEqual(ran, [1, 2])
+        self.assertEqual(master.jobs, {})
+
+        dispatcher.add_tick_handler(lambda: None)
+        master.run_pending()
+        self.assertEqual(len(master.jobs), 1)  # Handlers keep it ticking
+
+
+def make_bare_app(font_size="36", corner="Bottom Left", padding="40", text="Hello"):
+    """OverlayApp with a visible mocked overlay, built without the controller GUI."""
+    import logging
+    app = overlay.OverlayApp.__new__(overlay.OverlayApp)
+    app.logger = logging.getLogger("overlay.tests.app")
+    app.master = FakeScheduler()
+    app.recorder = overlay.FlightRecorder(capacity=64)
+    app.monitor_registry = overlay.MonitorRegistry([make_monitor("DP-1", 0, 0, is_primary=True)])
+    app.monitor_var = Mock(get=Mock(return_value="DP-1 (1920x1080)"))
+    app.font_size_var = Mock(get=Mock(return_value=font_size))
+    app.corner_var = Mock(get=Mock(return_value=corner))
+    app.padding_entry = Mock(get=Mock(return_value=padding))
+    app.font_cache = overlay.FontCache(None, font_factory=FakeFont)
+    app.measure_cache = overlay.TextMeasureCache(app.font_cache.get)
+    app._label_font = None
+    app._label_text = text
+    app.fit_enabled = Mock(get=Mock(return_value=False))
+    app.fit_entry = Mock(get=Mock(return_value="90"))
+    app.wrap_enabled = Mock(get=Mock(return_value=False))
+    app.bitmap_cache = None
+    app._label_image = None
+    app.overlay = Mock()
+    app.label = Mock()
+    app.overlay_text = text
+    app.overlay_visible = True
+    app.ticker = Mock(running=False)
+    app.verify_geometry_every = 0
+    app.geometry_updates = 0
+    return app
+
+
+class TestGeometryApply(unittest.TestCase):
+    """Test that layout passes apply geometry without a synchronous update."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_layout_does_not_force_update_or_read_back(self):
+        app = make_bare_app()
+        app.update_overlay_appearance()
+
+        app.overlay.geometry.assert_called_once_with("170x120+20+940")
+        app.overlay.update.assert_not_called()
+        app.overlay.winfo_x.assert_not_called()
+        app.overlay.after.assert_not_called()
+
+    def test_verification_is_sampled_every_n_updates(self):
+        app = make_bare_app()
+        app.verify_geometry_every = 3
+        for _ in range(7):
+            app.update_overlay_appearance()
+
+        self.assertEqual(app.overlay.after.call_count, 2)
+
+
+class TestFontCache(unittest.TestCase):
+    """Test the shared named-font cache."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_same_key_returns_shared_font(self):
+        cache = overlay.FontCache(None, font_factory=FakeFont)
+        first = cache.get("Arial", 36, "bold")
+
+        self.assertIs(cache.get("Arial", 36, "bold"), first)
+        self.assertIsNot(cache.get("Arial", 36), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_least_recently_used_font_is_evicted(self):
+        cache = overlay.FontCache(None, max_fonts=2, font_factory=FakeFont)
+        small = cache.get("Arial", 12)
+        cache.get("Arial", 24)
+        cache.get("Arial", 12)
+        cache.get("Arial", 48)  # evicts size 24
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertIs(cache.get("Arial", 12), small)
+
+    def test_font_size_change_reconfigures_label_once(self):
+        app = make_bare_app(font_size="48")
+        app.update_overlay_appearance()
+        app.update_overlay_appearance()  # e.g. a padding change: same font
+
+        font_calls = [c for c in app.label.config.call_args_list if "font" in c.kwargs]
+        self.assertEqual(len(font_calls), 1)
+
+
+class TestGuiZoom(unittest.TestCase):
+    """Test that controller zoom reconfigures a fixed set of named fonts."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_zoom_reconfigures_each_role_font_once(self):
+        app = make_bare_app()
+        app.master = Mock()
+        app.gui_font_size = 11
+        app.gui_fonts = {"normal": Mock(), "bold": Mock(), "entry": Mock()}
+
+        app.increase_gui_font()
+
+        app.gui_fonts["normal"].configure.assert_called_once_with(size=12, weight="normal")
+        app.gui_fonts["bold"].configure.assert_called_once_with(size=12, weight="bold")
+        app.gui_fonts["entry"].configure.assert_called_once_with(size=14, weight="normal")
+        app.master.winfo_children.assert_not_called()
+
+
+class TestOverlayWindowPool(unittest.TestCase):
+    """Test the pre-warmed overlay window pool."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.master = FakeScheduler()
+        self.pool = overlay.OverlayWindowPool(self.master, size=2, factory=lambda: (Mock(), Mock()))
+
+    def test_warm_builds_one_window_per_idle_callback(self):
+        self.pool.warm()
+        self.assertEqual(len(self.pool), 0)
+        self.master.run_pending()
+        self.assertEqual(len(self.pool), 1)
+        self.master.run_pending()
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.master.run_pending(), 0)
+
+    def test_hits_misses_and_reuse(self):
+        self.pool.warm()
+        self.master.run_pending()
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 1))
+
+        self.pool.release(first)
+        self.assertIs(self.pool.acquire(), first)
+        first[0].withdraw.assert_called_once_with()
+        self.assertIsNot(first, second)
+
+    def test_release_beyond_size_destroys_window(self):
+        entries = [self.pool.acquire() for _ in range(3)]
+        for entry in entries:
+            self.pool.release(entry)
+
+        self.assertEqual(len(self.pool), 2)
+        entries[2][0].destroy.assert_called_once_with()
+
+
+class TestOverlayReveal(unittest.TestCase):
+    """Test the event-driven overlay reveal."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.master = FakeScheduler()
+        self.shown = []
+        self.reported = []
+        self.reveal = overlay.OverlayReveal(self.master, self.shown.append, lambda *a: self.reported.append(a))
+        self.window = Mock()
+        self.window.__str__ = Mock(return_value=".!toplevel")
+        self.window.winfo_width.return_value = 1
+        self.window.winfo_height.return_value = 1
+        self.window.winfo_ismapped.return_value = False
+
+    def event(self, widget, width=0, height=0):
+        return Mock(widget=widget, width=width, height=height)
+
+    def test_reveals_on_matching_configure_and_reports_on_map(self):
+        self.reveal.begin(self.window, (300, 120))
+        self.reveal._on_configure(self.event(Mock(__str__=Mock(return_value=".!toplevel.!label")), 300, 120))
+        self.assertEqual(self.shown, [])
+
+        self.reveal._on_configure(self.event(self.window, 300, 120))
+        self.assertEqual(self.shown, [self.window])
+        self.assertEqual(self.master.jobs, {})  # timeout cancelled
+
+        self.reveal._on_map(self.event(self.window))
+        self.assertEqual(len(self.reported), 1)
+        self.assertEqual(self.reported[0][1], "configure")
+        self.assertGreaterEqual(self.reported[0][0], 0)
+
+    def test_map_delivered_inside_show_reports_once(self):
+        def show(window):
+            window.winfo_ismapped.return_value = True
+            self.reveal._on_map(self.event(window))
+
+        self.reveal.show = show
+        self.reveal.begin(self.window, (300, 120))
+        self.master.run_pending()
+
+        self.assertEqual(len(self.reported), 1)
+        self.assertEqual(self.reported[0][1], "first-map")
+
+    def test_timeout_fallback(self):
+        self.reveal.begin(self.window, (300, 120))
+        self.reveal._on_configure(self.event(self.window, 300, 120))
+        self.reveal._on_map(self.event(self.window))
+
+        self.reveal.begin(self.window, (400, 120))
+        self.master.run_pending()
+
+        self.assertEqual(self.shown, [self.window, self.window])
+        self.assertEqual(self.reveal.trigger, "timeout")
+        self.assertEqual(self.reveal.timeout_rate, 0.5)
+
+    def test_never_mapped_window_reveals_on_idle(self):
+        self.reveal.begin(self.window, (300, 120))
+
+        self.assertEqual(sorted(ms for ms, _, _ in self.master.jobs.values() if ms == "idle"), ["idle"])
+        self.master.run_pending()
+        self.assertEqual(self.reveal.trigger, "first-map")
+        self.assertEqual(self.reveal.triggers["timeout"], 0)
+
+    def test_unchanged_size_reveals_on_idle(self):
+        self.reveal._mapped.add(str(self.window))
+        self.window.winfo_width.return_value = 300
+        self.window.winfo_height.return_value = 120
+        self.reveal.begin(self.window, (300, 120))
+
+        idle = [job for job, (ms, _, _) in self.master.jobs.items() if ms == "idle"]
+        self.assertEqual(len(idle), 1)
+        self.master.run_pending()
+        self.assertEqual(self.reveal.trigger, "unchanged")
+        self.assertEqual(len(self.shown), 1)
+
+    def test_cancel_prevents_reveal(self):
+        self.reveal.begin(self.window, (300, 120))
+        self.reveal.cancel()
+        self.master.run_pending()
+        self.reveal._on_configure(self.event(self.window, 300, 120))
+
+        self.assertEqual(self.shown, [])
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Test the heap-backed scheduler behind the auto-hide timer."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.master = FakeScheduler()
+        self.clock = FakeClock()
+        self.timers = overlay.TimerWheel(self.master, clock=self.clock)
+
+    def test_single_tk_job_armed_for_earliest_deadline(self):
+        fired = []
+        for delay in (5, 1, 3):
+            self.timers.schedule(delay, fired.append, delay)
+
+        self.assertEqual(len(self.master.jobs), 1)
+        self.assertEqual(list(self.master.jobs.values())[0][0], 1000)
+        self.clock.now += 1.002
+        self.master.run_pending()
+        self.assertEqual(fired, [1])
+        self.assertAlmostEqual(list(self.master.jobs.values())[0][0], 1998, delta=1)
+        self.assertAlmostEqual(self.timers.last_drift, 0.002)
+
+    def test_cancel_keystroke_churn_leaves_one_live_timer(self):
+        fired = []
+        handle = None
+        for _ in range(100):
+            self.timers.cancel(handle)
+            handle = self.timers.schedule(60, fired.append, "hide")
+
+        self.assertEqual(len(self.timers), 1)
+        self.assertLess(len(self.timers._heap), 10)
+        self.assertEqual(len(self.master.jobs), 1)
+        self.clock.now += 60
+        self.master.run_pending()
+        self.assertEqual(fired, ["hide"])
+        self.assertEqual(self.master.jobs, {})
+
+    def test_cancelling_only_timer_leaves_idle_tk_job(self):
+        fired = []
+        handle = self.timers.schedule(2, fired.append, "hide")
+        self.timers.cancel(handle)
+        self.timers.cancel(handle)
+
+        self.assertEqual(len(self.timers), 0)
+        self.clock.now += 2
+        self.master.run_pending()
+        self.assertEqual(fired, [])
+        self.assertEqual(self.master.jobs, {})
+
+    def test_reschedule_makes_no_tk_calls(self):
+        self.master.after = Mock(wraps=self.master.after)
+        self.master.after_cancel = Mock(wraps=self.master.after_cancel)
+        handle = self.timers.schedule(60, lambda: None)
+        self.master.after.reset_mock()
+        for _ in range(5):
+            self.clock.now += 0.2
+            self.timers.cancel(handle)
+            handle = self.timers.schedule(60, lambda: None)
+
+        self.master.after.assert_not_called()
+        self.master.after_cancel.assert_not_called()
+        self.clock.now += 59
+        self.master.run_pending()  # the original job fires early and re-arms for the live deadline
+        self.assertAlmostEqual(list(self.master.jobs.values())[0][0], 1000, delta=1)
+
+
+class TestCueList(unittest.TestCase):
+    """Test cue list parsing and playback from precomputed layouts."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_parse_cue_time_formats(self):
+        for value, seconds in ((90, 90), ("90s", 90), ("45m", 2700), ("T+1h30m", 5400), ("45:00", 2700), ("1:30:00", 5400)):
+            self.assertEqual(overlay.parse_cue_time(value), seconds, value)
+        for value in ("soon", "-5", None):
+            with self.assertRaises(ValueError):
+                overlay.parse_cue_time(value)
+
+    def test_load_applies_defaults_and_sorts(self):
+        import json
+        import tempfile
+        data = {
+            "defaults": {"corner": "Top Right", "font_size": 48},
+            "cues": [
+                {"at": "45m", "text": "Break", "duration": 600},
+                {"at": 0, "text": "Doors open", "monitor": 2},
+            ],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cues.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            cues = overlay.load_cue_list(path)
+
+        self.assertEqual([cue.text for cue in cues], ["Doors open", "Break"])
+        self.assertEqual((cues[0].monitor, cues[0].corner, cues[0].font_size, cues[0].padding), (2, "Top Right", 48, 40))
+        self.assertIsNone(cues[0].duration)
+        self.assertEqual((cues[1].at, cues[1].duration), (2700, 600))
+
+    def test_cues_fire_with_precomputed_geometry(self):
+        app = make_bare_app()
+        app.monitor_registry = overlay.MonitorRegistry([
+            make_monitor("DP-1", 0, 0, is_primary=True), make_monitor("HDMI-1", 1920, 0),
+        ])
+        app.timers = overlay.TimerWheel(app.master, clock=FakeClock())
+        app.hide_timer = None
+        app.layout_coalescer = Mock()
+        app.toggle_btn = Mock()
+        cues = [
+            overlay.Cue(0, "Doors open", 2, "Top Left", 36, 40, None),
+            overlay.Cue(10, "Break", "DP-1", "Bottom Left", 36, 40, 5),
+        ]
+        player = overlay.CuePlayer(app)
+        player.load(cues)
+        misses = app.measure_cache.misses
+        player.start()
+
+        app.master.run_pending()
+        app.overlay.geometry.assert_called_with("260x120+1940+20")
+        app.timers.clock.now += 10
+        app.master.run_pending()
+        app.overlay.geometry.assert_called_with("170x120+20+940")
+
+        self.assertEqual(app.measure_cache.misses, misses)
+        self.assertEqual(player.fired, 2)
+        self.assertFalse(player.playing)
+        self.assertIsNotNone(app.hide_timer)
+
+
+class FakeImage:
+    """PhotoImage stand-in with a fixed size."""
+
+    def __init__(self, width, height):
+        self._size = (width, height)
+
+    def width(self):
+        return self._size[0]
+
+    def height(self):
+        return self._size[1]
+
+
+class TestBitmapCache(unittest.TestCase):
+    """Test the pre-rendered text image cache and bitmap render mode."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.rendered = []
+
+    def render(self, text, family, size, weight, fg, bg, outline, shadow):
+        self.rendered.append(text)
+        return FakeImage(len(text) * size // 2 + 2 * outline + shadow, size + 2 * outline + shadow)
+
+    def test_repeat_is_a_hit_and_style_is_part_of_key(self):
+        cache = overlay.BitmapCache(self.render)
+        first = cache.get("Hello", "Arial", 36, "bold")
+        self.assertIs(cache.get("Hello", "Arial", 36, "bold"), first)
+        cache.outline = 2
+        self.assertIsNot(cache.get("Hello", "Arial", 36, "bold"), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        cache = overlay.BitmapCache(self.render, max_bytes=3 * 100 * 20 * 4)
+        for text in ("aaaaaaaaaa", "bbbbbbbbbb", "cccccccccc"):
+            cache.get(text, "Arial", 20, "bold")
+        cache.get("aaaaaaaaaa", "Arial", 20, "bold")
+        cache.get("dddddddddd", "Arial", 20, "bold")
+
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.bytes, cache.max_bytes)
+        cache.get("bbbbbbbbbb", "Arial", 20, "bold")
+        self.assertEqual(self.rendered.count("bbbbbbbbbb"), 2)
+
+    def test_layout_uses_image_size_and_swaps_image_once(self):
+        app = make_bare_app()
+        app.bitmap_cache = overlay.BitmapCache(self.render, shadow=4)
+        app.update_overlay_appearance()
+        app.update_overlay_appearance()
+
+        app.overlay.geometry.assert_called_with("174x120+20+940")
+        self.assertEqual(app.label.config.call_args_list.count(call(image=app._label_image)), 1)
+        self.assertEqual(app.measure_cache.misses, 0)
+
+    def test_renderer_converts_points_to_pixels(self):
+        master = Mock()
+        master.winfo_fpixels.return_value = 96 / 72
+        with patch.object(overlay, "Image", Mock()), patch.object(overlay, "ImageFont") as image_font:
+            renderer = overlay.PillowTextRenderer(master)
+            renderer.font("Arial", 36, "bold")
+            renderer.font("Arial", 12, "bold")
+
+        self.assertEqual(image_font.truetype.call_args_list[0][0][1], 48)
+        self.assertEqual(image_font.truetype.call_args_list[1][0][1], 16)
+        self.assertEqual(renderer.pixel_size(-20), 20)
+        master.winfo_fpixels.assert_called_once_with("1p")
+
+
+class TestFitFontSize(unittest.TestCase):
+    """Test the fit-to-monitor-width font size search."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.cache = overlay.TextMeasureCache(overlay.FontCache(None, font_factory=FakeFont).get)
+
+    def test_binary_search_finds_largest_fitting_size(self):
+        # FakeFont: width = len * size // 2, so 20 chars + 80px padding fit 1000px up to size 92
+        size, text = self.cache.fit("x" * 20, "Arial", "bold", 40, max_width=1000, max_height=1000)
+
+        self.assertEqual((size, text), (92, "x" * 20))
+        self.assertLessEqual(self.cache.fit_probes, 8)
+        probes = self.cache.fit_probes
+        self.cache.fit("x" * 20, "Arial", "bold", 40, max_width=1000, max_height=1000)
+        self.assertEqual(self.cache.fit_probes, probes)
+
+    def test_wrap_breaks_lines_to_grow_font(self):
+        text = "one two three four five six"
+        plain, _ = self.cache.fit(text, "Arial", "bold", 0, max_width=600, max_height=1000)
+        wrapped, laid_out = self.cache.fit(text, "Arial", "bold", 0, max_width=600, max_height=1000, wrap=True)
+
+        self.assertGreater(wrapped, plain)
+        self.assertIn("\n", laid_out)
+        self.assertEqual(laid_out.replace("\n", " "), text)
+
+    def test_layout_in_fit_mode_stays_on_the_monitor(self):
+        app = make_bare_app(text="A long announcement that would spill past the edge of the monitor")
+        app.fit_enabled = Mock(get=Mock(return_value=True))
+        app.update_overlay_appearance()
+
+        width = app.last_geometry[0]
+        self.assertLessEqual(width, 1920 * 90 // 100)
+        self.assertNotEqual(app._label_font.size, 36)
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """Test the shared per-frame animation driver and the ticker built on it."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.master = FakeScheduler()
+        self.clock = FakeClock(0.0)
+        self.frames = overlay.FrameScheduler(self.master, fps=50, clock=self.clock)
+
+    def tick(self, seconds):
+        self.clock.now += seconds
+        self.master.run_pending()
+
+    def test_late_ticks_are_counted_as_skipped_frames(self):
+        seen = []
+        self.frames.add(lambda now, frames: seen.append(frames) or True)
+        self.tick(0.02)
+        self.tick(0.06)
+
+        self.assertEqual(seen, [1, 3])
+        self.assertEqual((self.frames.frames, self.frames.skipped), (2, 2))
+        self.assertAlmostEqual(self.frames.max_frame_time, 0.06)
+        self.assertEqual(len(self.master.jobs), 1)
+
+    def test_finished_animation_stops_the_frame_callback(self):
+        self.frames.add(lambda now, frames: False)
+        self.tick(0.02)
+
+        self.assertFalse(self.frames.running)
+        self.assertEqual(self.master.jobs, {})
+
+    def test_ticker_moves_by_elapsed_time_and_wraps(self):
+        canvas = Mock()
+        canvas.create_text.return_value = "text#1"
+        ticker = overlay.Ticker(self.frames, lambda: (Mock(), canvas), speed=100)
+        ticker.start("Breaking news", FakeFont("Arial", 20, "bold"), make_monitor("DP-1", 0, 0, width=400), 10)
+        self.tick(0.02)
+        self.tick(0.02)
+        self.tick(0.1)
+
+        moves = [c.args[1] for c in canvas.move.call_args_list]
+        self.assertEqual(len(moves), 2)
+        self.assertAlmostEqual(moves[0], -2.0)
+        self.assertAlmostEqual(moves[1], -10.0)
+        ticker._x = -1000.0
+        self.tick(0.02)
+        canvas.coords.assert_called_once_with("text#1", 400.0, ticker._y)
+
+        ticker.stop()
+        self.assertFalse(self.frames.running)
+        canvas.delete.assert_called_once_with("text#1")
+
+    def test_ticker_follows_corner_and_live_setting_changes(self):
+        window, canvas = Mock(), Mock()
+        ticker = overlay.Ticker(self.frames, lambda: (window, canvas), speed=100)
+        monitor = make_monitor("DP-1", 0, 0, width=400)
+        ticker.start("News", FakeFont("Arial", 20, "bold"), monitor, 10, "Top Right")
+        window.geometry.assert_called_with("400x44+0+0")
+
+        ticker._x = 150.0
+        ticker.update(FakeFont("Arial", 40, "bold"), monitor, 10, "Bottom Left")
+
+        window.geometry.assert_called_with("400x64+0+1016")
+        canvas.coords.assert_called_with(canvas.create_text.return_value, 150.0, 32)
+        self.assertEqual(canvas.create_text.call_count, 1)
+
+    def test_setting_change_while_ticker_runs_updates_ticker(self):
+        app = make_bare_app(font_size="48", corner="Top Left")
+        app.overlay = None
+        app.ticker = Mock(running=True)
+        app.layout_coalescer = Mock()
+        app.on_setting_change()
+        app.layout_coalescer.request.assert_called_once_with()
+
+        app._run_coalesced_layout()
+        font, monitor, padding, corner = app.ticker.update.call_args[0]
+        self.assertEqual((font.size, monitor.id, padding, corner), (48, app.selected_monitor().id, 40, "Top Left"))
+
+
+class TestAlphaFade(unittest.TestCase):
+    """Test time-based alpha fades on the frame scheduler."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.master = FakeScheduler()
+        self.clock = FakeClock(0.0)
+        self.frames = overlay.FrameScheduler(self.master, fps=50, clock=self.clock)
+
+    def run_fade(self, tick_seconds):
+        window = Mock()
+        done = []
+        fade = overlay.AlphaFade(self.frames, window, 0.0, 1.0, 0.2, on_done=done.append)
+        fade.begin()
+        while self.master.jobs:
+            self.clock.now += tick_seconds
+            self.master.run_pending()
+        return fade, window, done
+
+    def test_fade_ends_at_target_alpha(self):
+        fade, window, done = self.run_fade(0.02)
+
+        self.assertEqual(done, [fade])
+        self.assertEqual(window.attributes.call_args_list[-1], call("-alpha", 1.0))
+        self.assertIn(fade.steps, (10, 11))  # 10 x 0.02 may land just short of 0.2
+        self.assertEqual(fade.dropped, 0)
+
+    def test_slow_frames_shorten_step_count_not_duration(self):
+        fade, window, done = self.run_fade(0.05)
+
+        self.assertEqual(done, [fade])
+        self.assertIn(fade.steps, (4, 5))
+        self.assertGreater(fade.dropped, 0)
+        self.assertLess(self.clock.now, 0.26)
+
+    def test_reshowing_visible_overlay_does_not_fade_again(self):
+        app = make_bare_app()
+        app.frames = self.frames
+        app.fade_ms = 200
+        app.ticker_enabled = Mock(get=Mock(return_value=False))
+        app.timer_enabled = Mock(get=Mock(return_value=False))
+        app.entry = Mock(get=Mock(return_value="Hello"))
+        app.toggle_btn = Mock()
+        app.label.winfo_fpixels.return_value = 0
+        app.overlay_pool = Mock(acquire=Mock(return_value=(app.overlay, app.label)), hits=0, misses=1)
+        app.reveal = overlay.OverlayReveal(self.master, app._deiconify_overlay, Mock())
+        app.overlay, app.label = None, None
+        app._fade_in = None
+        app.show_overlay()
+        self.master.run_pending()  # first-map reveal starts the fade-in
+        first_fade = app._fade_in
+        self.assertIsNotNone(first_fade)
+
+        window = app.overlay
+        window.reset_mock()
+        app.show_overlay()
+        self.master.run_pending()
+
+        window.deiconify.assert_not_called()
+        self.assertIs(app._fade_in, first_fade)  # still running, not restarted from transparent
+
+
+class TestControlServer(unittest.TestCase):
+    """Test the local JSON control API and its hand-off to the Tk thread."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        self.applied = []
+        self.server = overlay.ControlServer(("tcp", ("127.0.0.1", 0)), self.applied.append, max_pending=2)
+
+    def test_parse_control_address(self):
+        self.assertEqual(overlay.parse_control_address("8765"), ("tcp", ("127.0.0.1", 8765)))
+        self.assertEqual(overlay.parse_control_address("localhost:8765"), ("tcp", ("localhost", 8765)))
+        self.assertEqual(overlay.parse_control_address("/tmp/overlay.sock"), ("unix", "/tmp/overlay.sock"))
+        with self.assertRaises(ValueError):
+            overlay.parse_control_address("0.0.0.0:8765")
+
+    def test_batch_is_queued_until_drained_and_overflow_dropped(self):
+        response = self.server.submit({"batch": [
+            {"cmd": "set", "text": "One"}, {"cmd": "show"}, {"cmd": "hide"}, {"cmd": "explode"},
+        ]})
+
+        self.assertEqual(response["accepted"], 2)
+        self.assertFalse(response["ok"])
+        self.assertEqual(self.applied, [])
+        self.assertEqual(self.server.drain(), 2)
+        self.assertEqual([c["cmd"] for c in self.applied], ["set", "show"])
+        status = self.server.submit({"cmd": "status"})["status"]
+        self.assertEqual((status["accepted"], status["dropped"], status["applied"]), (2, 2, 2))
+
+    def test_invalid_fields_are_rejected_before_queueing(self):
+        response = self.server.submit([
+            {"cmd": "show", "text": "X", "corner": "Nowhere"},
+            {"cmd": "set", "font_size": "big"},
+            {"cmd": "set", "monitor": [1]},
+            {"cmd": "show", "text": 5, "timer": 0.5},
+        ])
+
+        self.assertEqual(response["accepted"], 1)
+        self.assertEqual(len(response["errors"]), 3)
+        self.assertEqual(self.server.dropped, 3)
+        self.server.drain()
+        self.assertEqual(self.applied, [{"cmd": "show", "text": "5", "timer": 1}])
+
+    def test_socket_round_trip(self):
+        import json
+        import socket
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        with socket.create_connection(self.server.address, timeout=5) as sock:
+            sock.sendall(b'{"cmd": "show", "text": "Hi"}\nnot json\n')
+            stream = sock.makefile("rb")
+            first, second = json.loads(stream.readline()), json.loads(stream.readline())
+
+        self.assertEqual(first, {"ok": True, "accepted": 1})
+        self.assertFalse(second["ok"])
+        self.server.drain()
+        self.assertEqual(self.applied, [{"cmd": "show", "text": "Hi"}])
+        self.assertGreater(self.server.last_latency, 0)
+
+
+class TestOneShotOverlay(unittest.TestCase):
+    """Test the --message path that skips the controller GUI."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def make_one_shot(self):
+        master = FakeScheduler()
+        master.quit = Mock()
+        window, label = Mock(), Mock()
+        label.cget.return_value = 0
+        label.winfo_fpixels.return_value = 0
+        one_shot = overlay.OneShotOverlay(
+            master, window_factory=lambda: (window, label),
+            monitors=[make_monitor("DP-1", 0, 0, is_primary=True), make_monitor("HDMI-1", 1920, 0)],
+        )
+        one_shot.font_cache = overlay.FontCache(None, font_factory=FakeFont)
+        one_shot.measure_cache = overlay.TextMeasureCache(one_shot.font_cache.get)
+        return one_shot, master, window
+
+    def test_show_positions_on_requested_monitor(self):
+        one_shot, master, window = self.make_one_shot()
+        one_shot.show("Hello", monitor=2, corner="Top Right", timeout=5)
+
+        window.geometry.assert_called_once_with("170x120+3650+20")
+        self.assertIn(5000, [job[0] for job in master.jobs.values()])
+
+    def test_timeout_destroys_window_and_quits(self):
+        one_shot, master, window = self.make_one_shot()
+        one_shot.show("Hello", timeout=1)
+        one_shot.hide()
+
+        window.destroy.assert_called_once()
+        master.quit.assert_called_once()
+
+
+class TestOverlayClient(unittest.TestCase):
+    """Test the thin daemon client."""
+
+    def test_client_does_not_import_tkinter(self):
+        import subprocess
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, overlay_client; print('tkinter' in sys.modules)"],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_show_is_forwarded_to_daemon(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        import tempfile
+        if overlay_client.default_address()[0] != "unix":
+            self.skipTest("Unix sockets not available")
+        applied = []
+        with tempfile.TemporaryDirectory() as tmp:
+            address = ("unix", os.path.join(tmp, "overlay.sock"))
+            server = overlay.ControlServer(address, applied.append)
+            server.start()
+            try:
+                status = overlay_client.main(["--control", address[1], "show", "Hi", "--monitor", "2", "--timeout", "5"])
+            finally:
+                server.stop()
+            missing = overlay_client.main(["--control", address[1], "hide"])
+
+        server.drain()
+        self.assertEqual(status, 0)
+        self.assertEqual(applied, [{"cmd": "show", "text": "Hi", "monitor": 2, "timer": 5}])
+        self.assertEqual(missing, 2)
+
+    def test_default_socket_lives_in_a_private_directory(self):
+        import stat
+        import tempfile
+        if overlay_client.default_address()[0] != "unix":
+            self.skipTest("Unix sockets not available")
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(os.environ, {"XDG_RUNTIME_DIR": ""}), \
+                patch.object(overlay_client.tempfile, "gettempdir", return_value=tmp):
+            family, path = overlay_client.default_address()
+            private = os.path.dirname(path)
+            self.assertEqual(stat.S_IMODE(os.stat(private).st_mode), 0o700)
+
+            os.chmod(private, 0o777)  # e.g. created by another user first
+            with self.assertRaises(PermissionError):
+                overlay_client.default_address()
+
+    def test_start_keeps_live_socket_and_replaces_stale_one(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        import socket
+        import tempfile
+        if not hasattr(socket, "AF_UNIX"):
+            self.skipTest("Unix sockets not available")
+        with tempfile.TemporaryDirectory() as tmp:
+            address = ("unix", os.path.join(tmp, "overlay.sock"))
+            first = overlay.ControlServer(address, Mock())
+            first.start()
+            try:
+                with self.assertRaises(OSError):
+                    overlay.ControlServer(address, Mock()).start()
+                self.assertEqual(overlay_client.send({"cmd": "status"}, address)["ok"], True)
+            finally:
+                first.stop()
+
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(address[1])
+            stale.close()
+            second = overlay.ControlServer(address, Mock())
+            second.start()
+            second.stop()
+
+
+class TestLineStream(unittest.TestCase):
+    """Test latest-value hand-off of streamed lines to the Tk thread."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+
+    def test_burst_collapses_to_newest_line(self):
+        import io
+        stream = overlay.LineStream(lambda: io.StringIO("".join(f"line {i}\n" for i in range(5000))))
+        stream.start()
+        stream._thread.join(timeout=5)
+
+        self.assertEqual(stream.take(), "line 4999")
+        self.assertIsNone(stream.take())
+        self.assertTrue(stream.finished)
+        self.assertEqual(stream.stats(), {"received": 5000, "displayed": 1, "dropped": 4999})
+
+    def test_stream_step_updates_overlay_once_per_frame(self):
+        import io
+        app = Mock()
+        app.stream = overlay.LineStream(lambda: io.StringIO("a\nb\n"))
+        app.stream.start()
+        app.stream._thread.join(timeout=5)
+
+        keep = overlay.OverlayApp._stream_step(app, 0.0, 1)
+        app.set_overlay_text.assert_called_once_with("b")
+        self.assertFalse(keep)
+
+    def test_idle_stream_does_not_tick_frames(self):
+        import time
+        master = FakeScheduler()
+        app = make_bare_app()
+        app.dispatcher = overlay.TkDispatcher(master)
+        app.frames = overlay.FrameScheduler(master, fps=50, clock=FakeClock())
+        app.set_overlay_text = Mock()
+        read_fd, write_fd = os.pipe()
+        app.start_stream(overlay.LineStream(lambda: os.fdopen(read_fd, encoding="utf-8")))
+        self.assertFalse(app.frames.running)
+
+        os.write(write_fd, b"a\nb\n")
+        deadline = time.monotonic() + 5
+        while app.stream.received < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(app.dispatcher.drain(), 1)  # One wake-up for the burst
+        self.assertTrue(app.frames.running)
+        self.assertFalse(app._stream_step(0.0, 1))
+        app.frames.remove(app._stream_step)
+        app.set_overlay_text.assert_called_once_with("b")
+        self.assertFalse(app.frames.running)
+
+        os.close(write_fd)
+        app.stream._thread.join(timeout=5)
+        self.assertEqual(app.dispatcher.drain(), 1)
+        self.assertTrue(app.frames.running)
+        self.assertFalse(app._stream_step(0.0, 2))
+        self.assertTrue(app.stream.finished)
+
+
+class TestFileWatcher(unittest.TestCase):
+    """Test stat-based change detection and tail reads for --watch."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "status.txt")
+
+    def write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_read_tail_starts_at_line_boundary(self):
+        self.write("first line\n" + "x" * 100 + "\nlast line\n")
+
+        self.assertEqual(overlay.read_tail(self.path, 20), "last line\n")
+        self.assertEqual(overlay.read_tail(self.path, 1000)[:10], "first line")
+
+    def test_only_real_changes_are_read_and_posted(self):
+        dispatcher = Mock()
+        watcher = overlay.FileWatcher(dispatcher, "on_change", self.path, use_inotify=False)
+        self.assertFalse(watcher.poll())  # Missing file
+        self.write("Build running")
+        self.assertTrue(watcher.poll())
+        self.assertFalse(watcher.poll())
+        os.utime(self.path, ns=(0, 0))
+        self.assertFalse(watcher.poll())  # Touched, same text
+
+        dispatcher.post.assert_called_once_with("on_change", "Build running")
+        self.assertEqual((watcher.polls, watcher.reads, watcher.changes), (4, 2, 1))
+
+    def test_inotify_reports_writes_in_directory(self):
+        waiter = overlay.InotifyWaiter.create(self.tmp.name)
+        if waiter is None:
+            self.skipTest("inotify not available")
+        self.addCleanup(waiter.close)
+        self.assertFalse(waiter.wait(0))
+        self.write("changed")
+        self.assertTrue(waiter.wait(1))
+
+
+class TestPersistedState(unittest.TestCase):
+    """Test the state file used for warm starts."""
+
+    def setUp(self):
+        if overlay is None:
+            self.skipTest("Tkinter not available")
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "state", "state.json")
+
+    def test_round_trip_and_version_check(self):
+        import json
+        registry = overlay.MonitorRegistry([make_monitor("DP-1", 0, 0, is_primary=True)])
+        overlay.save_state(self.path, {"settings": {"corner": "Top Right"},
+                                       "monitors": [r._asdict() for r in registry.records]})
+        state = overlay.load_state(self.path)
+
+        self.assertEqual(state["settings"], {"corner": "Top Right"})
+        restored = overlay.MonitorRegistry([overlay.MonitorInfo(**m) for m in state["monitors"]])
+        self.assertEqual(restored.records, registry.records)
+
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": overlay.STATE_VERSION + 1}, f)
+        self.assertEqual(overlay.load_state(self.path), {})
+        self.assertEqual(overlay.load_state(os.path.join(self.tmp.name, "missing.json")), {})
+
+    def test_malformed_parts_are_dropped_and_no_temp_files_left(self):
+        overlay.save_state(self.path, {"settings": ["Top Right"], "monitors": {"DP-1": 1}, "measurements": []})
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["state.json"])
+        state = overlay.load_state(self.path)
+        self.assertEqual((state["settings"], state["monitors"]), ({}, []))
+
+        overlay.save_state(self.path, {"settings": {"corner": "Top Right", "monitor": ["DP-1"]}})
+        self.assertEqual(overlay.load_state(self.path)["settings"], {"corner": "Top Right"})
+
+    def test_measurements_preload_skips_font_metrics(self):
+        fonts = overlay.FontCache(None, font_factory=FakeFont)
+        first = overlay.TextMeasureCache(fonts.get)
+        first.label_inset = (2, 2)
+        size = first.measure("Hello", "Arial", 36, "bold", 40)
+
+        warm = overlay.TextMeasureCache(Mock(side_effect=AssertionError("font metrics used")))
+        warm.preload(first.snapshot(), [2, 2])
+        self.assertEqual(warm.measure("Hello", "Arial", 36, "bold", 40), size)
+        self.assertEqual(warm.hits, 1)
+
+    def test_cached_layout_is_reprobed_immediately(self):
+        dispatcher = Mock()
+        cached = [make_monitor("DP-1", 0, 0, is_primary=True)]
+        probed = cached + [make_monitor("HDMI-1", 1920, 0)]
+        watcher = overlay.MonitorWatcher(dispatcher, "apply", cached, interval=3600, probe=lambda: probed)
+        watcher.start(immediate=True)
+        watcher.stop()
+        watcher._thread.join(timeout=5)
+
+        dispatcher.post.assert_called_once_with("apply", probed)
+
+
 if __name__ == '__main__':
     unittest.main()